@@ -14,6 +14,7 @@ from packaging.version import Version
 from science.fetcher import FetchResult, fetch_and_verify
 from science.hashing import Digest, Fingerprint
 from science.model import Ptex, ScieJump, Url
+from science.parallel import Memo
 from science.platform import CURRENT_PLATFORM, Platform
 
 
@@ -63,7 +64,20 @@ def jump(
     )
 
 
+_CUSTOM_JUMP_MEMO = Memo[Path, LoadResult]()
+
+
 def custom_jump(repo_path: Path) -> LoadResult:
+    # N.B.: The custom scie-jump is built at most once per process even though it is requested for
+    # each platform being built.
+    return _CUSTOM_JUMP_MEMO.get(
+        repo_path.resolve(),
+        lambda: _build_custom_jump(repo_path),
+        valid=lambda load_result: load_result.path.exists(),
+    )
+
+
+def _build_custom_jump(repo_path: Path) -> LoadResult:
     dist_dir = tempfile.mkdtemp()
     atexit.register(shutil.rmtree, dist_dir, ignore_errors=True)
     subprocess.run(
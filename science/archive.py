@@ -0,0 +1,458 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import bz2
+import dataclasses
+import functools
+import gzip
+import io
+import json
+import logging
+import lzma
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import zipfile
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Callable, Collection, Iterator
+
+from science.cache import Complete, Missing, artifact_cache
+from science.errors import InputError
+from science.hashing import Digest, Fingerprint
+from science.model import Bytecode, File, FileType, Slim, Zstd
+
+logger = logging.getLogger(__name__)
+
+_TAR_TYPES = frozenset(
+    (FileType.Tar, FileType.TarGzip, FileType.TarBzip2, FileType.TarLzma),
+)
+
+
+def _matches(path: PurePosixPath, patterns: Collection[str]) -> bool:
+    # N.B.: A pattern matching a directory matches everything under it too.
+    return any(
+        candidate.full_match(pattern)
+        for candidate in (path, *path.parents[:-1])
+        for pattern in patterns
+    )
+
+
+def _select(
+    entries: Iterator[tuple[str, bool]], include: Collection[str], exclude: Collection[str]
+) -> frozenset[PurePosixPath]:
+    selected = set[PurePosixPath]()
+    dirs = list[PurePosixPath]()
+    for name, is_dir in entries:
+        path = PurePosixPath(name)
+        if _matches(path, exclude):
+            continue
+        if is_dir:
+            dirs.append(path)
+        elif not include or _matches(path, include):
+            selected.add(path)
+
+    # Directories are retained when they are selected outright or else when they are needed to hold
+    # a selected file.
+    parents = {parent for path in selected for parent in path.parents}
+    selected.update(
+        path for path in dirs if not include or _matches(path, include) or path in parents
+    )
+    return frozenset(selected)
+
+
+@contextmanager
+def _compressed_output(path: Path, file_type: FileType) -> Iterator[BinaryIO]:
+    # N.B.: We avoid `tarfile`'s built-in compression support since it records the current time in
+    # the gzip header and we want slimming to be reproducible.
+    with path.open("wb") as fp:
+        match file_type:
+            case FileType.Tar:
+                yield fp
+            case FileType.TarGzip:
+                with gzip.GzipFile(filename="", mode="wb", fileobj=fp, mtime=0) as gz:
+                    yield gz  # type: ignore[misc]
+            case FileType.TarBzip2:
+                with bz2.BZ2File(fp, mode="wb") as bz:
+                    yield bz  # type: ignore[misc]
+            case FileType.TarLzma:
+                with lzma.LZMAFile(fp, mode="wb") as xz:
+                    yield xz  # type: ignore[misc]
+
+
+def _slim_tar(
+    src: Path, file_type: FileType, dest: Path, include: Collection[str], exclude: Collection[str]
+) -> None:
+    with tarfile.open(src) as src_tf:
+        members = src_tf.getmembers()
+        selected = _select(
+            ((member.name, member.isdir()) for member in members), include=include, exclude=exclude
+        )
+        with (
+            _compressed_output(dest, file_type) as fp,
+            tarfile.open(fileobj=fp, mode="w", format=src_tf.format) as dest_tf,
+        ):
+            for member in members:
+                if PurePosixPath(member.name) not in selected:
+                    continue
+                if member.islnk() and PurePosixPath(member.linkname) not in selected:
+                    raise InputError(
+                        f"Cannot slim {src.name}: the retained entry {member.name} is a hard link "
+                        f"to the removed entry {member.linkname}."
+                    )
+                dest_tf.addfile(member, src_tf.extractfile(member) if member.isfile() else None)
+
+
+def _slim_zip(src: Path, dest: Path, include: Collection[str], exclude: Collection[str]) -> None:
+    with zipfile.ZipFile(src) as src_zf:
+        infos = src_zf.infolist()
+        selected = _select(
+            ((info.filename, info.is_dir()) for info in infos), include=include, exclude=exclude
+        )
+        with zipfile.ZipFile(dest, mode="w") as dest_zf:
+            for info in infos:
+                if PurePosixPath(info.filename) not in selected:
+                    continue
+                with src_zf.open(info) as src_fp, dest_zf.open(info, mode="w") as dest_fp:
+                    shutil.copyfileobj(src_fp, dest_fp)
+
+
+def _require_archive(file: File, subject: str) -> FileType:
+    file_type = file.type
+    if file_type is None or (file_type is not FileType.Zip and file_type not in _TAR_TYPES):
+        tar_types = ", ".join(sorted(tar_type.value for tar_type in _TAR_TYPES))
+        raise InputError(
+            f"Cannot {subject} {file.name}: only zip and {tar_types} archives are supported."
+        )
+    return file_type
+
+
+def _cached_transform(
+    subject: str,
+    file: File,
+    params: dict[str, object],
+    transform: Callable[[Path], None],
+    file_name: str | None = None,
+) -> tuple[Path, Digest]:
+    if not file.digest:
+        raise InputError(f"Cannot {subject} {file.name}: it has no digest to key the result by.")
+
+    key = json.dumps(
+        {"subject": subject, "digest": file.digest.fingerprint, **params}, sort_keys=True
+    )
+    with artifact_cache().get_or_create(key, file=file_name or file.name) as cache_result:
+        match cache_result:
+            case Complete(path=result_path, aux_dir=aux_dir):
+                digest = json.loads((aux_dir / "digest.json").read_text())
+                return result_path, Digest(
+                    size=digest["size"], fingerprint=Fingerprint(digest["fingerprint"])
+                )
+            case Missing(work_path=work_path, work_aux_dir=work_aux_dir):
+                transform(work_path)
+                digest = Digest.hash(work_path)
+                (work_aux_dir / "digest.json").write_text(
+                    json.dumps({"size": digest.size, "fingerprint": digest.fingerprint})
+                )
+    return cache_result.path, digest
+
+
+def slim(file: File, path: Path, rules: Slim) -> tuple[Path, Digest]:
+    """Produce a slimmed copy of the archive at `path` with just the entries `rules` selects.
+
+    The slimmed archive has the same format as the original and is cached keyed by the original
+    archive's digest and the slim rules.
+
+    Returns the path of the slimmed archive and its digest.
+    """
+    file_type = _require_archive(file, "slim")
+
+    def transform(dest: Path) -> None:
+        if file_type is FileType.Zip:
+            _slim_zip(path, dest, include=rules.include, exclude=rules.exclude)
+        else:
+            _slim_tar(path, file_type, dest, include=rules.include, exclude=rules.exclude)
+
+    return _cached_transform(
+        "slim",
+        file,
+        params={"include": sorted(rules.include), "exclude": sorted(rules.exclude)},
+        transform=transform,
+    )
+
+
+def _extract(file_type: FileType, src: Path, dest_dir: Path) -> None:
+    if file_type is FileType.Zip:
+        with zipfile.ZipFile(src) as zf:
+            zf.extractall(dest_dir)
+    else:
+        with tarfile.open(src) as tf:
+            tf.extractall(dest_dir, filter="tar")
+
+
+def extract(file: File, path: Path) -> Path:
+    """Extract the archive at `path` to a directory cached keyed by the archive's digest.
+
+    Returns the path of the directory holding the extracted archive contents.
+    """
+    file_type = _require_archive(file, "extract")
+    if not file.digest:
+        raise InputError(f"Cannot extract {file.name}: it has no digest to key the result by.")
+
+    key = json.dumps({"subject": "extract", "digest": file.digest.fingerprint}, sort_keys=True)
+    name = file.name.removesuffix(f".{file_type.value}")
+    with artifact_cache().get_or_create(key, file=name) as cache_result:
+        if isinstance(cache_result, Missing):
+            _extract(file_type, path, cache_result.work_path)
+    return cache_result.path
+
+
+def _iter_added(root: Path, existing: Collection[PurePosixPath]) -> Iterator[PurePosixPath]:
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names.sort()
+        rel_dir = PurePosixPath(Path(dir_path).relative_to(root).as_posix())
+        for name in (*dir_names, *sorted(file_names)):
+            rel_path = rel_dir / name
+            if rel_path not in existing:
+                yield rel_path
+
+
+def _repack_tar(src: Path, file_type: FileType, dest: Path, root: Path) -> None:
+    with tarfile.open(src) as src_tf:
+        members = src_tf.getmembers()
+        existing = {PurePosixPath(member.name): member for member in members}
+        # N.B.: New entries get the newest timestamp found in the original archive to keep
+        # re-packing reproducible.
+        mtime = max((member.mtime for member in members), default=0)
+        with (
+            _compressed_output(dest, file_type) as fp,
+            tarfile.open(fileobj=fp, mode="w", format=src_tf.format) as dest_tf,
+        ):
+            for member in members:
+                updated = root / member.name
+                if member.isfile() and member.name.endswith(".pyc") and updated.is_file():
+                    member = member.replace(deep=False)
+                    member.size = updated.stat().st_size
+                    with updated.open("rb") as updated_fp:
+                        dest_tf.addfile(member, updated_fp)
+                else:
+                    dest_tf.addfile(member, src_tf.extractfile(member) if member.isfile() else None)
+            for rel_path in _iter_added(root, existing):
+                added = root / rel_path
+                tar_info = tarfile.TarInfo(str(rel_path))
+                tar_info.mtime = mtime
+                if added.is_dir():
+                    tar_info.type = tarfile.DIRTYPE
+                    tar_info.mode = 0o755
+                    dest_tf.addfile(tar_info)
+                else:
+                    tar_info.size = added.stat().st_size
+                    tar_info.mode = 0o644
+                    with added.open("rb") as added_fp:
+                        dest_tf.addfile(tar_info, added_fp)
+
+
+def _repack_zip(src: Path, dest: Path, root: Path) -> None:
+    with zipfile.ZipFile(src) as src_zf, zipfile.ZipFile(dest, mode="w") as dest_zf:
+        infos = src_zf.infolist()
+        for info in infos:
+            updated = root / info.filename
+            if info.filename.endswith(".pyc") and updated.is_file():
+                with updated.open("rb") as src_fp, dest_zf.open(info, mode="w") as dest_fp:
+                    shutil.copyfileobj(src_fp, dest_fp)
+            else:
+                with src_zf.open(info) as src_fp, dest_zf.open(info, mode="w") as dest_fp:
+                    shutil.copyfileobj(src_fp, dest_fp)
+        existing = {PurePosixPath(info.filename) for info in infos}
+        for rel_path in _iter_added(root, existing):
+            added = root / rel_path
+            if added.is_dir():
+                dest_zf.mkdir(zipfile.ZipInfo(f"{rel_path}/"))
+            else:
+                zip_info = zipfile.ZipInfo(str(rel_path))
+                zip_info.compress_type = zipfile.ZIP_DEFLATED
+                with added.open("rb") as src_fp, dest_zf.open(zip_info, mode="w") as dest_fp:
+                    shutil.copyfileobj(src_fp, dest_fp)
+
+
+@functools.cache
+def _interpreter_identity(python: Path) -> dict[str, object]:
+    # N.B.: Bytecode depends on the interpreter's implementation and version and not on where the
+    # interpreter lives; so we identify it by those, which keeps the cache key stable across hosts.
+    result = subprocess.run(
+        args=[
+            str(python),
+            "-I",
+            "-c",
+            (
+                "import json, platform, sys; "
+                "print(json.dumps({"
+                "'cache_tag': sys.implementation.cache_tag, "
+                "'version': platform.python_version(), "
+                "'optimize': sys.flags.optimize"
+                "}))"
+            ),
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise InputError(f"Failed to identify the interpreter at {python}:\n{result.stdout}")
+    return json.loads(result.stdout)
+
+
+def compile_bytecode(
+    file: File, path: Path, bytecode: Bytecode, python: Path
+) -> tuple[Path, Digest]:
+    """Produce a copy of the interpreter distribution archive at `path` with bytecode compiled.
+
+    All Python sources in the archive are compiled using the given `python`, which must be an
+    interpreter of the same implementation and version as the one the archive contains. The
+    resulting `.pyc` files use unchecked hash-based invalidation so they remain valid regardless of
+    the file timestamps the archive is extracted with.
+
+    The result has the same format as the original and is cached keyed by the original archive's
+    digest, the implementation and version of the `python` used and the bytecode options.
+
+    Returns the path of the archive with bytecode compiled and its digest.
+    """
+    file_type = _require_archive(file, "compile bytecode for")
+
+    def transform(dest: Path) -> None:
+        root = dest.with_name(f"{dest.name}.extracted")
+        _extract(file_type, path, root)
+        try:
+            result = subprocess.run(
+                args=[
+                    str(python),
+                    "-I",
+                    "-m",
+                    "compileall",
+                    "-q",
+                    "-f",
+                    "-j",
+                    "0",
+                    "--invalidation-mode",
+                    "unchecked-hash",
+                    "-o",
+                    str(bytecode.optimize),
+                    "-s",
+                    str(root),
+                    str(root),
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+            )
+            # N.B.: Interpreter distributions commonly ship sources that intentionally do not
+            # compile, like the CPython test suite's syntax error cases; so we tolerate individual
+            # compile failures (exit code 1), but not failures to run compileall at all.
+            if result.returncode == 1:
+                logger.info(f"Some sources in {file.name} failed to compile:\n{result.stdout}")
+            elif result.returncode != 0:
+                raise InputError(
+                    f"Failed to compile bytecode for {file.name} using {python}:\n{result.stdout}"
+                )
+            if file_type is FileType.Zip:
+                _repack_zip(path, dest, root)
+            else:
+                _repack_tar(path, file_type, dest, root)
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    return _cached_transform(
+        "compile bytecode for",
+        file,
+        params={"optimize": bytecode.optimize, "python": _interpreter_identity(python)},
+        transform=transform,
+    )
+
+
+_COMPRESSED_TAR_OPENERS: dict[FileType, Callable[[Path], io.BufferedIOBase]] = {
+    FileType.TarGzip: gzip.GzipFile,
+    FileType.TarBzip2: bz2.BZ2File,
+    FileType.TarLzma: lzma.LZMAFile,
+}
+
+
+@contextmanager
+def _zstd_output(path: Path, level: int, threads: int) -> Iterator[BinaryIO]:
+    with path.open("wb") as fp:
+        if sys.version_info >= (3, 14):
+            from compression import zstd
+
+            with zstd.ZstdFile(
+                fp,
+                mode="wb",
+                options={
+                    zstd.CompressionParameter.compression_level: level,
+                    zstd.CompressionParameter.nb_workers: threads,
+                },
+            ) as zstd_fp:
+                yield zstd_fp
+            return
+
+        try:
+            import zstandard
+        except ImportError:
+            raise InputError(
+                "Transcoding to zstd requires Python 3.14 or greater or else the `zstandard` "
+                "distribution to be installed."
+            )
+        with zstandard.ZstdCompressor(level=level, threads=threads).stream_writer(
+            fp, closefd=False
+        ) as writer:
+            yield writer  # type: ignore[misc]
+
+
+def transcode_to_zstd(file: File, path: Path, zstd: Zstd) -> tuple[File, Path] | None:
+    """Transcode the compressed tarball at `path` to a zstd compressed tarball.
+
+    The tar stream itself is copied verbatim; only its compression changes. The transcoded tarball
+    is cached keyed by the original tarball's digest and the compression options.
+
+    Returns the updated file and the path of the transcoded tarball or else `None` if the file is
+    not a compressed tarball that can be transcoded.
+    """
+    file_type = file.type or next(
+        (
+            file_type
+            for file_type in _COMPRESSED_TAR_OPENERS
+            if file.name.endswith(f".{file_type.value}")
+        ),
+        None,
+    )
+    if file_type not in _COMPRESSED_TAR_OPENERS:
+        return None
+    opener = _COMPRESSED_TAR_OPENERS[file_type]
+
+    threads = (os.cpu_count() or 1) if zstd.threads is None else zstd.threads
+
+    def transform(dest: Path) -> None:
+        with opener(path) as src_fp, _zstd_output(dest, zstd.level, threads) as dest_fp:
+            shutil.copyfileobj(src_fp, dest_fp, length=1024 * 1024)
+
+    # MyPy does not handle dataclass_transform yet: https://github.com/python/mypy/issues/14293
+    file = dataclasses.replace(file, digest=file.digest or Digest.hash(path))  # type: ignore[misc]
+    name = f"{file.name.removesuffix(f'.{file_type.value}')}.{FileType.TarZstd.value}"
+    transcoded, digest = _cached_transform(
+        "transcode",
+        file,
+        # N.B.: Multithreaded zstd output does not depend on the number of threads, but does differ
+        # from single-threaded output.
+        params={"level": zstd.level, "multithreaded": threads > 0},
+        transform=transform,
+        file_name=name,
+    )
+    transcoded_file = dataclasses.replace(
+        file,  # type: ignore[misc]
+        name=name,
+        key=file.id,
+        digest=digest,
+        type=FileType.TarZstd,
+    )
+    return transcoded_file, transcoded
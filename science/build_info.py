@@ -4,11 +4,14 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 import logging
 import os
 import shlex
 import shutil
 import subprocess
+import threading
+import weakref
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -17,46 +20,122 @@ from science import __version__
 from science.dataclass.reflect import metadata
 from science.doc import DOC_SITE_URL
 from science.frozendict import FrozenDict
-from science.hashing import Digest, Provenance
+from science.hashing import Digest, DigestCache, Provenance
 from science.platform import CURRENT_PLATFORM_SPEC
 
 logger = logging.getLogger(__name__)
 
 
-def _maybe_gather_git_state() -> str | None:
-    git = shutil.which("git")
-    if not git:
+class _GitState:
+    """The `git describe` state of the current working directory, gathered in the background."""
+
+    def __init__(self) -> None:
+        git = shutil.which("git")
+        self._args = [git, "describe", "--always", "--dirty", "--long"] if git else []
+        self._process = (
+            subprocess.Popen(
+                args=self._args,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+            if self._args
+            else None
+        )
+        if self._process:
+            # N.B.: Provenance may never be rendered; so we make sure the process is reaped either
+            # way.
+            weakref.finalize(self, self._reap, self._process)
+        self._lock = threading.Lock()
+        self._value: tuple[str | None] | None = None
+
+    @staticmethod
+    def _reap(process: subprocess.Popen[str]) -> None:
+        if process.poll() is None:
+            process.kill()
+        process.communicate()
+
+    def value(self) -> str | None:
+        with self._lock:
+            if self._value is None:
+                self._value = (self._wait(),)
+            return self._value[0]
+
+    def _wait(self) -> str | None:
+        if not self._process:
+            return None
+
+        stdout, stderr = self._process.communicate()
+        if self._process.returncode == 0:
+            return stdout.strip()
+
+        logger.warning("Failed to gather git state for provenance.")
+        logger.info(
+            f"Got exit code {self._process.returncode} for command: {shlex.join(self._args)}"
+        )
+        logger.debug(f"Got STDERR:\n{stderr}")
         return None
 
-    git_info = subprocess.run(
-        args=[git, "describe", "--always", "--dirty", "--long"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-    )
-    if git_info.returncode == 0:
-        return git_info.stdout.strip()
 
-    logger.warning("Failed to gather git state for provenance.")
-    logger.info(f"Got exit code {git_info.returncode} for command: {shlex.join(git_info.args)}")
-    logger.debug(f"Got STDERR:\n{git_info.stderr}")
-    return None
+class _Gathered:
+    """Provenance information that is expensive to gather and so is gathered on first use."""
+
+    def __init__(
+        self, science: Path | None, digest_cache: DigestCache | None, include_git_state: bool
+    ) -> None:
+        self._science = science
+        self._digest_cache = digest_cache
+        # N.B.: We kick off `git describe` eagerly so that it runs concurrently with the rest of the
+        # build up until the point its output is needed.
+        self._git_state = _GitState() if include_git_state else None
+
+    @functools.cached_property
+    def digest(self) -> Digest | None:
+        if not self._science:
+            return None
+        if self._digest_cache:
+            return self._digest_cache.digest(self._science)
+        return Digest.hash(self._science)
+
+    @property
+    def git_state(self) -> str | None:
+        return self._git_state.value() if self._git_state else None
 
 
 @dataclass(frozen=True)
 class BuildInfo:
     @classmethod
     def gather(
-        cls, lift_toml: Provenance, app_info: FrozenDict[str, Any] = FrozenDict()
+        cls,
+        lift_toml: Provenance,
+        app_info: FrozenDict[str, Any] = FrozenDict(),
+        digest_cache: DigestCache | None = None,
+        include_git_state: bool = True,
     ) -> BuildInfo:
-        digest = Digest.hash(Path(science)) if (science := os.environ.get("SCIE_ARGV0")) else None
-        git_state = _maybe_gather_git_state()
-        return cls(lift_toml, digest=digest, git_state=git_state, app_info=app_info)
+        science = os.environ.get("SCIE_ARGV0")
+        return cls(
+            lift_toml,
+            app_info=app_info,
+            gathered=_Gathered(
+                Path(science) if science else None,
+                digest_cache=digest_cache,
+                include_git_state=include_git_state,
+            ),
+        )
 
     lift_toml: Provenance = dataclasses.field(metadata=metadata(hidden=True))
-    digest: Digest | None = dataclasses.field(default=None, metadata=metadata(hidden=True))
-    git_state: str | None = dataclasses.field(default=None, metadata=metadata(hidden=True))
     app_info: FrozenDict[str, Any] = FrozenDict()
+    gathered: _Gathered | None = dataclasses.field(
+        default=None, compare=False, repr=False, metadata=metadata(hidden=True)
+    )
+
+    @property
+    def digest(self) -> Digest | None:
+        return self.gathered.digest if self.gathered else None
+
+    @property
+    def git_state(self) -> str | None:
+        return self.gathered.git_state if self.gathered else None
 
     def to_dict(self, **extra_app_info: Any) -> dict[str, Any]:
         binary = dict[str, Any](
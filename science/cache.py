@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import atexit
 import errno
+import functools
 import hashlib
 import os
 import shutil
@@ -19,6 +20,7 @@ from typing import ClassVar, Iterator, TypeAlias
 from filelock import FileLock
 
 from science.context import ScienceConfig
+from science.hashing import DigestCache
 from science.model import Url
 
 
@@ -85,25 +87,23 @@ _TTL_EXPIRY_FORMAT = "%m/%d/%y %H:%M:%S"
 
 
 @dataclass(frozen=True)
-class DownloadCache:
-    # Bump this when changing download cache on-disk structure.
+class _KeyedCache:
+    # Bump this when changing cache on-disk structure.
     _VERSION: ClassVar[int] = 1
 
     base_dir: Path
 
-    @contextmanager
-    def get_or_create(self, url: Url, ttl: timedelta | None = None) -> Iterator[CacheResult]:
-        """A context manager that yields a cache result.
-
-        If the cache result is `Missing`, the block yielded to should materialize the given url to
-        the `Missing.work_path` path. Upon successful exit from this context manager, the given
-        url's content will exist at the cache result path.
+    def _cache_dir(self, key: str) -> Path:
+        return self.base_dir / str(self._VERSION) / hashlib.sha256(key.encode()).hexdigest()
 
-        Auxiliary files and directories can be created using `Missing.work_aux_dir` as a base.
-        Anything created under that directory will be made available atomically at the cache result
-        aux dir.
-        """
+    @staticmethod
+    def _lock(cache_dir: Path) -> FileLock:
+        return FileLock(str(cache_dir.with_name(f"{cache_dir.name}.lck")))
 
+    @contextmanager
+    def _get_or_create(
+        self, key: str, file: str, ttl: timedelta | None = None, lock: bool = False
+    ) -> Iterator[CacheResult]:
         # Cache structure looks like so for a cached entry:
         # ---
         # <base_dir>/1/abcd1234.lck
@@ -119,8 +119,7 @@ class DownloadCache:
         #     _/file
         #     aux/ (Again, only present if Missing.work_aux_dir is used by caller.)
 
-        url_hash = hashlib.sha256(url.encode()).hexdigest()
-        cache_dir = self.base_dir / str(self._VERSION) / url_hash
+        cache_dir = self._cache_dir(key)
 
         ttl_file = cache_dir.with_suffix(".ttl") if ttl else None
         if ttl_file and not ttl_file.exists():
@@ -135,30 +134,91 @@ class DownloadCache:
             except ValueError:
                 _delete_dir(cache_dir)
 
-        cache_file = os.path.basename(url.info.path)
-
-        if cache_dir.exists():
-            yield Complete(_cache_dir=cache_dir, _file=cache_file)
+        if not lock and cache_dir.exists():
+            yield Complete(_cache_dir=cache_dir, _file=file)
             return
 
         cache_dir.parent.mkdir(parents=True, exist_ok=True)
-        with FileLock(str(cache_dir.with_name(f"{cache_dir.name}.lck"))):
+        with self._lock(cache_dir):
             if cache_dir.exists():
-                yield Complete(_cache_dir=cache_dir, _file=cache_file)
+                yield Complete(_cache_dir=cache_dir, _file=file)
                 return
 
             work_dir = cache_dir.with_name(f"{cache_dir.name}.work")
             _delete_dir(work_dir)
             atexit.register(_delete_dir, work_dir)
-            yield Missing(_cache_dir=cache_dir, _file=cache_file, _work_dir=work_dir)
+            yield Missing(_cache_dir=cache_dir, _file=file, _work_dir=work_dir)
             work_dir.rename(cache_dir)
             if ttl_file and ttl:
                 ttl_file.write_text((datetime.now() + ttl).strftime(_TTL_EXPIRY_FORMAT))
 
 
+@dataclass(frozen=True)
+class DownloadCache(_KeyedCache):
+    @contextmanager
+    def get_or_create(self, url: Url, ttl: timedelta | None = None) -> Iterator[CacheResult]:
+        """A context manager that yields a cache result.
+
+        If the cache result is `Missing`, the block yielded to should materialize the given url to
+        the `Missing.work_path` path. Upon successful exit from this context manager, the given
+        url's content will exist at the cache result path.
+
+        Auxiliary files and directories can be created using `Missing.work_aux_dir` as a base.
+        Anything created under that directory will be made available atomically at the cache result
+        aux dir.
+        """
+        with self._get_or_create(url, file=os.path.basename(url.info.path), ttl=ttl) as result:
+            yield result
+
+
+@dataclass(frozen=True)
+class ArtifactCache(_KeyedCache):
+    # N.B.: Version 2 folds the cached file name into keys.
+    _VERSION: ClassVar[int] = 2
+
+    @contextmanager
+    def get_or_create(self, key: str, file: str, lock: bool = False) -> Iterator[CacheResult]:
+        """A context manager that yields a cache result for a file derived from other content.
+
+        The key should capture everything the derived file's content depends on; e.g.: the digest
+        of the input file and the parameters used to transform it. Cache results are handled just
+        as for `DownloadCache.get_or_create`.
+
+        If `lock` is set, the cache entry is locked for the duration of the block even when it is
+        `Complete`; so the block can use the entry without racing a concurrent `delete` of it.
+        """
+        # N.B.: Unlike a url, an arbitrary key does not determine the file name; so we fold it in.
+        with self._get_or_create(f"{key}:{file}", file=file, lock=lock) as result:
+            yield result
+
+    def delete(self, key: str, file: str) -> None:
+        """Delete the cache entry for the given key and file, if there is one.
+
+        The deletion waits for any block using the entry under `get_or_create(..., lock=True)`.
+        """
+        cache_dir = self._cache_dir(f"{key}:{file}")
+        if not cache_dir.exists():
+            return
+        with self._lock(cache_dir):
+            _delete_dir(cache_dir)
+
+
 def science_cache() -> Path:
     return ScienceConfig.active().cache_dir
 
 
 def download_cache() -> DownloadCache:
     return DownloadCache(science_cache() / "downloads")
+
+
+def artifact_cache() -> ArtifactCache:
+    return ArtifactCache(science_cache() / "artifacts")
+
+
+@functools.cache
+def _digest_cache(base_dir: Path) -> DigestCache:
+    return DigestCache(base_dir)
+
+
+def digest_cache() -> DigestCache:
+    return _digest_cache(science_cache() / "digests")
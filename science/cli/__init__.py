@@ -0,0 +1,100 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import importlib
+import os
+from dataclasses import dataclass
+from typing import Any
+
+import click
+from click.shell_completion import CompletionItem
+from click_didyoumean import DYMGroup
+
+from science.doc import DOC_SITE_URL
+
+SCIE_ARGV0 = os.environ.get("SCIE_ARGV0")
+
+SEE_MANIFEST_HELP = (
+    f"For more information on the TOML manifest format, see: {DOC_SITE_URL}/manifest.html"
+)
+
+
+def complete_platforms(
+    _ctx: click.Context, _param: click.Parameter, incomplete: str
+) -> list[CompletionItem]:
+    # N.B.: We import here since this module is imported on every science run and platform
+    # detection is only needed by the sub-commands that take a `--platform`.
+    from science.platform import Platform
+
+    return [
+        CompletionItem(value)
+        for value in ("current", *(platform.value for platform in Platform))
+        if value.startswith(incomplete)
+    ]
+
+
+@dataclass(frozen=True)
+class LazyCommand:
+    """A command whose defining module is only imported when the command is used.
+
+    The `import_path` is of the form `<module>:<attribute>` and the `short_help` is shown in the
+    parent group's help without importing the command.
+    """
+
+    import_path: str
+    short_help: str
+
+    def load(self) -> click.Command:
+        module_name, _, attribute = self.import_path.partition(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(
+                f"Expected {self.import_path} to be a click command but it is a {type(command)}."
+            )
+        return command
+
+
+class LazyGroup(DYMGroup):
+    """A command group that defers importing its sub-commands until they are invoked.
+
+    Sub-commands pull in heavy dependencies; so listing them in help or running one of them should
+    not pay to import all the others.
+    """
+
+    def __init__(self, *args: Any, lazy_commands: dict[str, LazyCommand], **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and (lazy_command := self.lazy_commands.get(cmd_name)):
+            self.add_command(lazy_command.load(), name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        names = [
+            name
+            for name in self.list_commands(ctx)
+            if name not in self.commands or not self.commands[name].hidden
+        ]
+        if not names:
+            return
+
+        # N.B.: This mirrors `click.Group.format_commands` save for using the declared short help of
+        # commands not yet loaded.
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = [
+            (
+                name,
+                self.commands[name].get_short_help_str(limit)
+                if name in self.commands
+                else self.lazy_commands[name].short_help,
+            )
+            for name in names
+        ]
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
@@ -0,0 +1,67 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from io import BytesIO
+
+import click
+
+from science.cli import SCIE_ARGV0
+from science.commands.complete import Shell
+from science.errors import InputError
+from science.os import EXE_EXT
+
+
+@click.command(name="complete")
+@click.option(
+    "--shell",
+    default=shell.value if (shell := Shell.current()) else None,
+    type=click.Choice([shell.value for shell in Shell]),
+    show_default=Shell.current() is not None,
+    callback=lambda _ctx, _param, value: Shell(value),
+    required=Shell.current() is None,
+    help="Specify the shell to generate a completion script for.",
+)
+@click.option(
+    "--output", type=click.File("wb"), help="The file to output the shell completion script to."
+)
+def _complete(shell: Shell, output: BytesIO | None) -> None:
+    """Generate shell completion scripts.
+
+    By default, the appropriate shell completion script for the current shell is output to stdout,
+    but both the shell and output destination can be altered.
+
+    The use of the script depends on your shell type and preferences. To test things out you can
+    use:
+
+    * `bash` or `zsh`::
+
+        \b
+        eval "$(science complete)"
+
+    * `fish`::
+
+        \b
+        eval (science complete)
+
+    To trigger option completion you must type `-` before tabbing.
+
+    .. note::
+     If science cannot detect your shell, or it can but is not one of the supported shells for
+     completion, you must specify `--shell`.
+    """
+    if not SCIE_ARGV0:
+        raise InputError("Can only generate completion scripts when run from a scie.")
+
+    env_var_bin_name = SCIE_ARGV0.rstrip(EXE_EXT).replace("-", "_").upper()
+    sys.exit(
+        subprocess.run(
+            [SCIE_ARGV0],
+            env={**os.environ, f"_{env_var_bin_name}_COMPLETE": f"{shell.value}_source"},
+            stdout=output.fileno() if output else None,
+        ).returncode
+    )
@@ -0,0 +1,177 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import click
+from click.shell_completion import CompletionItem, shell_complete
+
+from science import __version__
+
+INDEX = Path(__file__).with_name("completion-index.json")
+
+
+def _index_param(ctx: click.Context, param: click.Parameter) -> dict[str, Any]:
+    entry: dict[str, Any] = {
+        "name": param.name,
+        "opts": param.opts,
+        "secondary_opts": param.secondary_opts,
+        "nargs": param.nargs,
+        "multiple": param.multiple,
+        "required": param.required,
+        # N.B.: Completions are gathered for an empty incomplete value and filtered by prefix when
+        # served; so only static completions (choices, platforms, files and directories) survive.
+        "completions": [
+            {"value": item.value, "type": item.type, "help": item.help}
+            for item in param.shell_complete(ctx, "")
+        ],
+    }
+    if isinstance(param, click.Option):
+        entry.update(
+            kind="option",
+            is_flag=param.is_flag,
+            count=param.count,
+            hidden=param.hidden,
+            help=param.help,
+        )
+    else:
+        entry.update(kind="argument")
+    return entry
+
+
+def _index_command(ctx: click.Context, command: click.Command) -> dict[str, Any]:
+    entry: dict[str, Any] = {
+        "short_help": command.get_short_help_str(),
+        "hidden": command.hidden,
+        "params": [_index_param(ctx, param) for param in command.get_params(ctx)],
+    }
+    if isinstance(command, click.Group):
+        subcommands = {}
+        for name in command.list_commands(ctx):
+            subcommand = command.get_command(ctx, name)
+            if subcommand is None:
+                continue
+            subcommands[name] = _index_command(
+                click.Context(
+                    subcommand, info_name=name, parent=ctx, **subcommand.context_settings
+                ),
+                subcommand,
+            )
+        entry.update(commands=subcommands)
+    return entry
+
+
+def create_index(command: click.Command) -> dict[str, Any]:
+    """Walks the full CLI to produce an index of everything shell completion needs.
+
+    This imports every sub-command; so it is done once when building science and not on each TAB
+    press.
+    """
+    ctx = click.Context(command, info_name=command.name, **command.context_settings)
+    return {"version": __version__, "command": _index_command(ctx, command)}
+
+
+def write_index(index: Path = INDEX) -> None:
+    from science.exe import _main
+
+    index.write_text(json.dumps(create_index(_main), indent=2, sort_keys=True))
+
+
+def _load_param(entry: dict[str, Any]) -> click.Parameter:
+    completions = [
+        CompletionItem(item["value"], type=item["type"], help=item["help"])
+        for item in entry["completions"]
+    ]
+
+    def complete(
+        _ctx: click.Context, _param: click.Parameter, incomplete: str
+    ) -> list[CompletionItem]:
+        return [
+            # N.B.: Files and directories are completed by the shell itself.
+            CompletionItem(incomplete, type=item.type) if item.type in ("file", "dir") else item
+            for item in completions
+            if item.type in ("file", "dir") or item.value.startswith(incomplete)
+        ]
+
+    if "argument" == entry["kind"]:
+        return click.Argument(
+            [entry["name"]],
+            nargs=entry["nargs"],
+            required=entry["required"],
+            shell_complete=complete,
+        )
+
+    param_decls = [
+        f"{opt}/{secondary_opt}"
+        for opt, secondary_opt in zip(entry["opts"], entry["secondary_opts"])
+    ]
+    param_decls.extend(entry["opts"][len(param_decls) :])
+    return click.Option(
+        [entry["name"], *param_decls],
+        is_flag=entry["is_flag"] or None,
+        count=entry["count"],
+        nargs=entry["nargs"],
+        multiple=entry["multiple"],
+        hidden=entry["hidden"],
+        help=entry["help"],
+        shell_complete=complete,
+    )
+
+
+def _load_command(name: str | None, entry: dict[str, Any]) -> click.Command:
+    kwargs: dict[str, Any] = dict(
+        name=name,
+        params=[_load_param(param) for param in entry["params"]],
+        short_help=entry["short_help"],
+        hidden=entry["hidden"],
+        # N.B.: The help option is part of the indexed params.
+        add_help_option=False,
+    )
+    if (commands := entry.get("commands")) is not None:
+        return click.Group(
+            commands={
+                subcommand_name: _load_command(subcommand_name, subcommand)
+                for subcommand_name, subcommand in commands.items()
+            },
+            **kwargs,
+        )
+    return click.Command(**kwargs)
+
+
+def load_index(index: Path = INDEX) -> click.Command | None:
+    """Loads a skeleton of the CLI from its completion index.
+
+    The skeleton has all the commands and parameters of the full CLI, but none of their callbacks;
+    so it is only fit for shell completion. If there is no index or it was created by a different
+    version of science, returns `None`.
+    """
+    try:
+        data = json.loads(index.read_text())
+    except FileNotFoundError:
+        return None
+    if __version__ != data.get("version"):
+        return None
+    return _load_command(None, data["command"])
+
+
+def complete(prog_name: str, index: Path = INDEX) -> int | None:
+    """Serves a shell completion request from the completion index if possible.
+
+    Shell completion re-runs science on every TAB press and the full CLI imports a sub-command's
+    heavy dependencies just to complete its options; so we answer from the index instead when we
+    have one. Returns the exit code when the request was served and `None` when the full CLI should
+    handle it.
+    """
+    # N.B.: This mirrors how click derives the completion environment variable name.
+    complete_var = f"_{prog_name}_COMPLETE".replace("-", "_").upper()
+    instruction = os.environ.get(complete_var)
+    if not instruction or not instruction.endswith("_complete"):
+        return None
+    if not (command := load_index(index)):
+        return None
+    return shell_complete(command, {}, prog_name, complete_var, instruction)
@@ -0,0 +1,114 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path, PurePath
+from textwrap import dedent
+from urllib.parse import urlparse, urlunparse
+
+import click
+from click_didyoumean import DYMGroup
+
+from science import __version__
+from science.commands.doc import SERVER_NAME, LaunchError
+from science.commands.doc import launch as launch_doc_server
+from science.commands.doc import shutdown as shutdown_doc_server
+from science.context import DocConfig
+from science.doc import DOC_SITE_URL
+
+logger = logging.getLogger(__name__)
+
+
+logger = logging.getLogger(__name__)
+
+
+pass_doc = click.make_pass_decorator(DocConfig)
+
+
+@click.group(cls=DYMGroup, name="doc")
+@click.option(
+    "--site",
+    default=DOC_SITE_URL,
+    show_default=True,
+    help="Specify an alternate URL of the doc site.",
+)
+@click.option("--local", type=Path, hidden=True)  # N.B.: Set via env var by the lift manifest.
+@click.pass_context
+def _doc(ctx: click.Context, site: str, local: Path | None) -> None:
+    """Interact with science docs."""
+    ctx.obj = DocConfig(site=site, local=local)
+
+
+@_doc.command(name="open")
+@click.option(
+    "--remote",
+    is_flag=True,
+    help=dedent(
+        f"""\
+        Open the official remote doc site instead.
+
+        N.B.: The official docs track the latest release of science. You're using {__version__},
+        which may not match.
+        """
+    ),
+)
+@click.argument("page", default=None, required=False)
+@pass_doc
+@click.pass_context
+def _open_doc(ctx: click.Context, doc: DocConfig, remote: bool, page: str | None = None) -> None:
+    """Opens the local documentation in a browser.
+
+    If an optional page argument is supplied, that page will be opened instead of the default doc
+    site page.
+
+    Documentation is served by a local HTTP server which you can shut down with `science doc close`.
+    """
+    if remote or not doc.local:
+        url = doc.site
+    else:
+        try:
+            launch_result = launch_doc_server(document_root=doc.local)
+        except LaunchError:
+            try:
+                launch_result = launch_doc_server(document_root=doc.local, port=0)
+            except LaunchError as e:
+                with open(e.log) as fp:
+                    for line in fp:
+                        logger.error(line.rstrip())
+                logger.fatal(f"Failed to launch {SERVER_NAME}.")
+                ctx.exit(1)
+                return
+
+        url = launch_result.server_info.url
+        if launch_result.already_running:
+            click.secho(
+                f"Using {SERVER_NAME} already running at {launch_result.server_info}.",
+                fg="cyan",
+                err=True,
+            )
+        else:
+            click.secho(
+                f"Launched {SERVER_NAME} at {launch_result.server_info}", fg="green", err=True
+            )
+
+    if not page:
+        if not remote:
+            url = f"{url}/index.html"
+    else:
+        url_info = urlparse(url)
+        page = f"{page}.html" if not PurePath(page).suffix else page
+        url = urlunparse(url_info._replace(path=f"{url_info.path}/{page}"))
+
+    click.launch(url)
+
+
+@_doc.command(name="close")
+def _close_doc() -> None:
+    """Shuts down the local documentation server."""
+    server_info = shutdown_doc_server()
+    if server_info:
+        click.secho(f"Shut down the {SERVER_NAME} at {server_info}.", fg="green", err=True)
+    else:
+        click.secho("No documentation server was running.", fg="cyan", err=True)
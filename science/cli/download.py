@@ -0,0 +1,228 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import dataclasses
+from dataclasses import dataclass
+from pathlib import Path
+from textwrap import dedent
+from typing import Any, Callable
+
+import click
+from click_didyoumean import DYMGroup
+from packaging.version import Version
+
+from science.cli import complete_platforms
+from science.commands.download import download_a_scie_executables, download_provider_distribution
+from science.options import OptionDescriptor, mutually_exclusive, to_option_string
+from science.platform import CURRENT_PLATFORM_SPEC, LibC, Platform, PlatformSpec
+from science.providers import ProviderInfo, all_providers
+
+
+@dataclass(frozen=True)
+class DownloadConfig:
+    platform_specs: tuple[PlatformSpec, ...]
+    explicit_set: bool
+    jobs: int | None = None
+
+
+pass_download = click.make_pass_decorator(DownloadConfig)
+
+platform_mutex_check = mutually_exclusive(
+    OptionDescriptor("platforms", flag="--platform"), "all_platforms"
+)
+
+
+@click.group(cls=DYMGroup, name="download")
+@click.option(
+    "--platform",
+    "platforms",
+    type=Platform.parse,
+    shell_complete=complete_platforms,
+    multiple=True,
+    default=[],
+    callback=platform_mutex_check,
+    help=(
+        "Download binaries for the specified platform(s). Mutually exclusive with "
+        "`--all-platforms`. By default, only binaries for the current platform are downloaded."
+    ),
+)
+@click.option(
+    "--all-platforms",
+    is_flag=True,
+    default=False,
+    callback=platform_mutex_check,
+    help=(
+        "Download binaries for all platforms science supports. Mutually exclusive with "
+        "`--platform`. By default, only binaries for the current platform are downloaded."
+    ),
+)
+@click.option(
+    "--libc",
+    "libcs",
+    type=click.Choice([libc.value for libc in LibC]),
+    multiple=True,
+    default=[],
+    callback=lambda _ctx, _param, value: [LibC(v) for v in value],
+    help=(
+        "Choose binaries that link to the specified libc when downloading for a Linux platform. "
+        "Binaries that link against gnu libc by will be chosen by default."
+    ),
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help=(
+        "The maximum number of downloads to run in parallel. By default, a number appropriate for "
+        "I/O bound work on this machine is used."
+    ),
+)
+@click.pass_context
+def _download(
+    ctx: click.Context,
+    platforms: list[Platform],
+    all_platforms: bool,
+    libcs: list[LibC | None],
+    jobs: int | None,
+) -> None:
+    """Download binaries for offline use."""
+
+    if platforms:
+        platforms = list(dict.fromkeys(platforms))
+        explicit_set = True
+    elif all_platforms:
+        platforms = list(Platform)
+        explicit_set = False
+    else:
+        platforms = [CURRENT_PLATFORM_SPEC.platform]
+        explicit_set = True
+
+    libcs = libcs or [CURRENT_PLATFORM_SPEC.libc]
+
+    ctx.obj = DownloadConfig(
+        platform_specs=tuple(
+            PlatformSpec(platform, libc) for platform in platforms for libc in libcs
+        ),
+        explicit_set=explicit_set,
+        jobs=jobs,
+    )
+
+
+download_dest_dir = click.argument("dest_dir", metavar="DEST_DIR", type=Path)
+
+
+@_download.group(cls=DYMGroup, name="provider")
+def _download_provider() -> None:
+    """Download distributions from providers for offline use."""
+
+
+def _create_provider_download_func(
+    provider_info: ProviderInfo,
+) -> Callable[[DownloadConfig, Path], None]:
+    @_download_provider.command(name=provider_info.short_name)
+    @download_dest_dir
+    @click.option(
+        "--incremental",
+        is_flag=True,
+        help=dedent(
+            """\
+            Only download distributions not already present in the mirror at DEST_DIR.
+
+            Distributions are considered present when the `.sha256` file science writes alongside
+            them matches the distribution fingerprint. The distributions manifests written to the
+            mirror are pared down to the downloaded distributions and merged with any existing
+            distributions manifests.
+            """
+        ),
+    )
+    @pass_download
+    def func(
+        download_config: DownloadConfig, dest_dir: Path, incremental: bool, **kwargs: Any
+    ) -> None:
+        download_provider_distribution(
+            provider_info=provider_info,
+            platform_specs=download_config.platform_specs,
+            explicit_platforms=download_config.explicit_set,
+            dest_dir=dest_dir,
+            jobs=download_config.jobs,
+            incremental=incremental,
+            **kwargs,
+        )
+
+    setattr(func, "__name__", provider_info.name.replace(".", "_"))
+    func.__doc__ = f"Download {provider_info.name} distributions for offline use."
+
+    for field in provider_info.config_fields():
+        assert field.type.has_origin_type or callable(getattr(field.type, "parse", None)), (
+            f"Expected {provider_info.name} config fields to be simple scalar types or else have a "
+            f"`parse(str)` factory function. Field {field.name} has type {field.type} which is "
+            f"neither."
+        )
+        func = click.option(
+            to_option_string(field.name),
+            type=field.type.origin_type,
+            required=field.default is dataclasses.MISSING,
+            multiple=True,
+            default=[],
+            help=(
+                f"{field.doc} [default: {field.default}]"
+                if (field.default and field.default is not dataclasses.MISSING)
+                else field.doc
+            ),
+        )(func)
+
+    return func
+
+
+for _provider_info in all_providers():
+    _create_provider_download_func(_provider_info)
+
+download_a_scie_versions = click.option(
+    "--version",
+    "versions",
+    type=Version,
+    multiple=True,
+    default=[],
+    help="One or more versions to download. By default, the latest version is downloaded.",
+)
+
+
+@_download.command(name="ptex")
+@download_dest_dir
+@download_a_scie_versions
+@pass_download
+def _download_ptex(
+    download_config: DownloadConfig, dest_dir: Path, versions: list[Version]
+) -> None:
+    """Download ptex binaries for offline use."""
+    download_a_scie_executables(
+        project_name="ptex",
+        binary_name="ptex",
+        versions=versions,
+        platforms=dict.fromkeys(
+            platform_spec.platform for platform_spec in download_config.platform_specs
+        ),
+        dest_dir=dest_dir,
+    )
+
+
+@_download.command(name="scie-jump")
+@download_dest_dir
+@download_a_scie_versions
+@pass_download
+def _download_scie_jump(
+    download_config: DownloadConfig, dest_dir: Path, versions: list[Version]
+) -> None:
+    """Download scie-jump binaries for offline use."""
+    download_a_scie_executables(
+        project_name="jump",
+        binary_name="scie-jump",
+        versions=versions,
+        platforms=dict.fromkeys(
+            platform_spec.platform for platform_spec in download_config.platform_specs
+        ),
+        dest_dir=dest_dir,
+    )
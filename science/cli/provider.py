@@ -0,0 +1,62 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import json
+import textwrap
+
+import click
+from click_didyoumean import DYMGroup
+
+from science import providers
+
+
+@click.group(cls=DYMGroup, name="provider")
+def _provider() -> None:
+    """Perform operations against provider plugins."""
+
+
+@_provider.command(name="list")
+@click.option(
+    "--json",
+    "emit_json",
+    is_flag=True,
+    help="Output the list of providers as a JSON list of objects",
+)
+def _list(emit_json: bool) -> None:
+    """List the installed provider plugins."""
+    if emit_json:
+        click.echo(
+            json.dumps(
+                [
+                    {
+                        "type": provider_info.fully_qualified_name,
+                        "source": provider_info.source,
+                        "short_name": provider_info.short_name,
+                        "summary": provider_info.summary,
+                        "description": provider_info.description,
+                    }
+                    for provider_info in providers.all_providers()
+                ],
+                sort_keys=True,
+            )
+        )
+        return
+
+    indent_width = len(f"{len(providers.all_providers())}. ")
+    indent = " " * indent_width
+    for index, provider_info in enumerate(providers.all_providers(), start=1):
+        if index > 1:
+            click.echo()
+        index_prefix = f"{index}.".ljust(indent_width)
+        click.echo(f"{index_prefix}{provider_info.fully_qualified_name}")
+        click.echo(f"{indent}source: {provider_info.source}")
+        if provider_info.short_name:
+            click.echo(f"{indent}short name: {provider_info.short_name}")
+        if provider_info.summary:
+            click.echo()
+            click.echo(f"{indent}{provider_info.summary}")
+        if provider_info.description:
+            click.echo()
+            click.echo(textwrap.indent(provider_info.description, prefix=indent))
@@ -1,20 +1,32 @@
 # Copyright 2023 Science project contributors.
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+import functools
 import hashlib
-import io
+import json
+import logging
+import os
 import shutil
 import subprocess
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Mapping
 
 from science import a_scie
+from science.cache import Complete, Missing, artifact_cache, digest_cache
 from science.commands import lift
 from science.commands.lift import LiftConfig, PlatformInfo
-from science.fs import temporary_directory
+from science.fs import copy_or_reflink, temporary_directory
+from science.hashing import hash_path
 from science.model import Application
+from science.parallel import raise_errors
 from science.platform import CURRENT_PLATFORM, PlatformSpec
+from science.scheduler import Scheduler, Task
+
+logger = logging.getLogger(__name__)
+
+_CHECKSUMS_FILE = "checksums.json"
 
 
 @dataclass(frozen=True)
@@ -30,6 +42,174 @@ class AssemblyInfo:
     scies: tuple[ScieAssembly, ...]
 
 
+def _checksums(
+    binary: Path, hash_functions: Iterable[str], known: Mapping[str, str] | None = None
+) -> dict[str, str]:
+    checksums = {
+        hash_function: known[hash_function]
+        for hash_function in hash_functions
+        if known and hash_function in known
+    }
+    if missing := sorted(set(hash_functions) - checksums.keys()):
+        checksums.update(hash_path(binary, algorithms=missing).fingerprints)
+    return checksums
+
+
+def _write_checksums(binary: Path, checksums: Mapping[str, str]) -> tuple[Path, ...]:
+    hashes = list[Path]()
+    for hash_function, hexdigest in sorted(checksums.items()):
+        checksum_file = binary.with_name(f"{binary.name}.{hash_function}")
+        checksum_file.write_text(f"{hexdigest} *{binary.name}")
+        hashes.append(checksum_file)
+    return tuple(hashes)
+
+
+def _fingerprint(path: Path) -> str:
+    if not path.is_dir():
+        return digest_cache().digest(path).fingerprint
+
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(path, followlinks=True):
+        dirs.sort()
+        for file in sorted(files):
+            file_path = Path(root) / file
+            executable = bool(file_path.stat().st_mode & 0o111)
+            digest.update(f"{file_path.relative_to(path).as_posix()}\0{executable:d}\0".encode())
+            digest.update(digest_cache().digest(file_path).fingerprint.encode())
+    return digest.hexdigest()
+
+
+def _fingerprint_payload(lift_manifest: Path) -> dict[str, str]:
+    with lift_manifest.open() as fp:
+        data = json.load(fp)
+
+    fingerprints = dict[str, str]()
+    for file in data["scie"]["lift"]["files"]:
+        if file.get("source"):
+            # This file is fetched at run-time and so is not part of the scie payload.
+            continue
+        name = file["name"]
+        # N.B.: Declared hashes have already been verified against the file contents by the time
+        # the lift manifest is exported.
+        fingerprints[name] = file.get("hash") or _fingerprint(lift_manifest.parent / name)
+    return fingerprints
+
+
+def _resolve_native_jump(use_jump: Path | None) -> a_scie.LoadResult:
+    return a_scie.custom_jump(repo_path=use_jump) if use_jump else a_scie.jump()
+
+
+def _load_jump(
+    application: Application, platform_spec: PlatformSpec, use_jump: Path | None
+) -> a_scie.LoadResult:
+    if use_jump:
+        return a_scie.custom_jump(repo_path=use_jump)
+    return a_scie.jump(specification=application.scie_jump, platform=platform_spec.platform)
+
+
+def _retain_latest_scie(slot: str, key: str, file: str) -> None:
+    # N.B.: Each cached scie is a full copy of everything it embeds; so, to bound the growth of the
+    # cache, we only retain the scie last assembled for a given project, application and platform
+    # and evict the scie it replaces. Other builds copy cached scies out under the cache entry lock;
+    # so the eviction cannot pull a scie out from under them.
+    cache = artifact_cache()
+    slot_file = cache.base_dir / "scies" / f"{hashlib.sha256(slot.encode()).hexdigest()}.json"
+    entry = {"key": key, "file": file}
+    try:
+        previous_entry = json.loads(slot_file.read_text())
+    except (OSError, ValueError):
+        previous_entry = None
+    if previous_entry == entry:
+        return
+
+    slot_file.parent.mkdir(parents=True, exist_ok=True)
+    work_file = slot_file.with_name(f"{slot_file.name}.{os.getpid()}.{threading.get_ident()}")
+    work_file.write_text(json.dumps(entry))
+    work_file.replace(slot_file)
+
+    if previous_entry:
+        try:
+            cache.delete(key=previous_entry["key"], file=previous_entry["file"])
+        except (OSError, KeyError, TypeError) as e:
+            logger.debug(f"Failed to evict the scie previously assembled for {slot}: {e}")
+
+
+@dataclass(frozen=True)
+class _AssembledScie:
+    lift_manifest: Path
+    scie: Path
+    checksums: Mapping[str, str]
+
+
+def _assemble_scie(
+    application: Application,
+    dest_dir: Path,
+    platform_spec: PlatformSpec,
+    platform_info: PlatformInfo,
+    hash_functions: list[str],
+    *,
+    project: str,
+    export_task: Task[Path],
+    native_jump_task: Task[a_scie.LoadResult],
+    jump_task: Task[a_scie.LoadResult],
+) -> _AssembledScie:
+    lift_manifest = export_task.result()
+    native_jump = native_jump_task.result()
+    jump = jump_task.result()
+
+    # N.B.: A scie is fully determined by its lift manifest, the scie-jumps involved in assembling
+    # it and the contents of the files it embeds; so we can re-use any scie assembled from the same.
+    key = json.dumps(
+        {
+            "subject": "scie",
+            "native_jump": native_jump.digest.fingerprint,
+            "jump": jump.digest.fingerprint,
+            "lift_manifest": lift_manifest.read_text(),
+            "files": _fingerprint_payload(lift_manifest),
+        },
+        sort_keys=True,
+    )
+    binary_name = CURRENT_PLATFORM.binary_name(application.name)
+    dst_binary = dest_dir / platform_info.binary_name(
+        application.name, target_platform=platform_spec
+    )
+    with artifact_cache().get_or_create(key, file=binary_name, lock=True) as cache_result:
+        match cache_result:
+            case Missing(work_path=work_path, work_aux_dir=work_aux_dir):
+                with temporary_directory("assemble") as build_dir:
+                    subprocess.run(
+                        args=[str(native_jump.path), "-sj", str(jump.path), lift_manifest],
+                        cwd=build_dir,
+                        stdout=subprocess.DEVNULL,
+                        check=True,
+                    )
+                    shutil.move(Path(build_dir) / binary_name, work_path)
+                checksums = _checksums(work_path, hash_functions)
+                (work_aux_dir / _CHECKSUMS_FILE).write_text(json.dumps(checksums))
+                copy_or_reflink(work_path, dst_binary)
+            case Complete(path=path, aux_dir=aux_dir):
+                logger.info(f"Using the cached scie assembled for {platform_spec}.")
+                checksums = json.loads((aux_dir / _CHECKSUMS_FILE).read_text())
+                copy_or_reflink(path, dst_binary)
+
+    _retain_latest_scie(
+        slot=f"{project}:{application.name}:{platform_spec.value}",
+        key=key,
+        file=binary_name,
+    )
+    return _AssembledScie(lift_manifest=lift_manifest, scie=dst_binary, checksums=checksums)
+
+
+def _hash_scie(hash_functions: list[str], assemble_task: Task[_AssembledScie]) -> ScieAssembly:
+    assembled_scie = assemble_task.result()
+    checksums = _checksums(assembled_scie.scie, hash_functions, known=assembled_scie.checksums)
+    return ScieAssembly(
+        lift_manifest=assembled_scie.lift_manifest,
+        scie=assembled_scie.scie,
+        hashes=_write_checksums(assembled_scie.scie, checksums),
+    )
+
+
 def assemble_scies(
     lift_config: LiftConfig,
     application: Application,
@@ -38,48 +218,61 @@ def assemble_scies(
     platform_info: PlatformInfo,
     use_jump: Path | None,
     hash_functions: list[str],
+    project: str,
 ) -> AssemblyInfo:
-    native_jump_path = (a_scie.custom_jump(repo_path=use_jump) if use_jump else a_scie.jump()).path
+    """Export, assemble and hash a scie for each platform.
 
-    scies = list[ScieAssembly]()
-    for platform_spec, lift_manifest in lift.export_manifest(
-        lift_config, application, dest_dir=dest_dir, platform_specs=platform_specs
-    ):
-        jump_path = (
-            a_scie.custom_jump(repo_path=use_jump)
-            if use_jump
-            else a_scie.jump(specification=application.scie_jump, platform=platform_spec.platform)
-        ).path
-        with temporary_directory("assemble") as build_dir:
-            subprocess.run(
-                args=[str(native_jump_path), "-sj", str(jump_path), lift_manifest],
-                cwd=build_dir,
-                stdout=subprocess.DEVNULL,
-                check=True,
-            )
-
-            src_binary = Path(build_dir) / CURRENT_PLATFORM.binary_name(application.name)
-            dst_binary_name = platform_info.binary_name(
-                application.name, target_platform=platform_spec
-            )
-            dst_binary = dest_dir / dst_binary_name
-            shutil.move(src_binary, dst_binary)
-
-        hashes = list[Path]()
-        if hash_functions:
-            digests = tuple(
-                hashlib.new(hash_function) for hash_function in sorted(set(hash_functions))
-            )
-            with dst_binary.open(mode="rb") as fp:
-                for chunk in iter(lambda: fp.read(io.DEFAULT_BUFFER_SIZE), b""):
-                    for digest in digests:
-                        digest.update(chunk)
-            for digest in digests:
-                checksum_file = dst_binary.with_name(f"{dst_binary_name}.{digest.name}")
-                checksum_file.write_text(f"{digest.hexdigest()} *{dst_binary_name}")
-                hashes.append(checksum_file)
-        scies.append(
-            ScieAssembly(lift_manifest=lift_manifest, scie=dst_binary, hashes=tuple(hashes))
+    All the work is scheduled as a single task graph run with up to `lift_config.jobs` tasks at
+    once; so, for example, one platform's scie can be assembled while another platform's
+    interpreter distribution is still downloading.
+
+    The `project` identifies the lift manifest being built; the scie cache retains just the latest
+    scie assembled for each project, application and platform.
+    """
+    scheduler = Scheduler(jobs=lift_config.jobs)
+    export_tasks = lift.schedule_export(
+        scheduler, lift_config, application, dest_dir, platform_specs=platform_specs
+    )
+    native_jump_task = scheduler.add(
+        "resolve native scie-jump",
+        functools.partial(_resolve_native_jump, use_jump),
+    )
+    hash_tasks = dict[PlatformSpec, Task[ScieAssembly]]()
+    for platform_spec, export_task in export_tasks.items():
+        jump_task = scheduler.add(
+            f"fetch scie-jump {platform_spec}",
+            functools.partial(_load_jump, application, platform_spec, use_jump),
+        )
+        assemble_task = scheduler.add(
+            f"assemble {platform_spec}",
+            functools.partial(
+                _assemble_scie,
+                application,
+                dest_dir,
+                platform_spec,
+                platform_info,
+                hash_functions,
+                project=project,
+                export_task=export_task,
+                native_jump_task=native_jump_task,
+                jump_task=jump_task,
+            ),
+            dependencies=(export_task, native_jump_task, jump_task),
+        )
+        hash_tasks[platform_spec] = scheduler.add(
+            f"hash {platform_spec}",
+            functools.partial(_hash_scie, hash_functions, assemble_task),
+            dependencies=(assemble_task,),
         )
+    scheduler.run()
+
+    scies = list[ScieAssembly]()
+    errors = dict[PlatformSpec, Exception]()
+    for platform_spec, hash_task in hash_tasks.items():
+        try:
+            scies.append(hash_task.result())
+        except Exception as e:
+            errors[platform_spec] = e
+    raise_errors(errors, subject="assemble scies")
 
-    return AssemblyInfo(native_jump=native_jump_path, scies=tuple(scies))
+    return AssemblyInfo(native_jump=native_jump_task.result().path, scies=tuple(scies))
@@ -4,16 +4,24 @@
 import itertools
 import logging
 import shutil
+import sys
+import time
+from concurrent.futures import as_completed
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable, Iterator, Tuple
 
 import click
 from packaging.version import Version
+from tqdm import tqdm
 
 from science import a_scie
 from science.errors import InputError
 from science.fetcher import fetch_and_verify
-from science.model import Fetch, Identifier
+from science.fs import link_or_copy
+from science.hashing import Digest
+from science.model import Fetch, Identifier, Provider, Url
+from science.parallel import Executor
 from science.platform import Platform, PlatformSpec
 from science.providers import ProviderInfo
 
@@ -51,11 +59,72 @@ def download_a_scie_executables(
             )
 
 
+@dataclass(frozen=True)
+class _Artifact:
+    description: str
+    url: Url
+    digest: Digest | None
+    executable: bool
+    dest: Path
+
+    @property
+    def sidecar(self) -> Path:
+        return self.dest.with_name(f"{self.dest.name}.sha256")
+
+    def is_mirrored(self) -> bool:
+        """Determine if the artifact is already mirrored using its mirror `.sha256` sidecar file.
+
+        N.B.: This purposefully avoids re-hashing the mirrored artifact; we trust that the mirror
+        is only written to by science.
+        """
+        if not self.digest or not self.sidecar.is_file():
+            return False
+        fingerprint = self.sidecar.read_text().split(" ", 1)[0]
+        try:
+            return (
+                fingerprint == self.digest.fingerprint
+                and self.dest.stat().st_size == self.digest.size
+            )
+        except FileNotFoundError:
+            return False
+
+
+@dataclass(frozen=True)
+class _Downloaded:
+    artifact: _Artifact
+    size: int
+    elapsed: float
+
+
+def _download_artifact(artifact: _Artifact) -> _Downloaded:
+    start = time.monotonic()
+    result = fetch_and_verify(
+        url=artifact.url,
+        fingerprint=artifact.digest,
+        executable=artifact.executable,
+        show_progress=False,
+    )
+    link_or_copy(result.path, artifact.dest)
+    exe_flag = "*" if artifact.executable else " "
+    artifact.sidecar.write_text(f"{result.digest.fingerprint} {exe_flag}{artifact.dest.name}")
+    return _Downloaded(artifact=artifact, size=result.digest.size, elapsed=time.monotonic() - start)
+
+
+def _format_size(size: float) -> str:
+    for unit in "B", "KiB", "MiB":
+        if size < 1024:
+            return f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GiB"
+
+
 def download_provider_distribution(
     provider_info: ProviderInfo,
     platform_specs: Iterable[PlatformSpec],
     explicit_platforms: bool,
     dest_dir: Path,
+    jobs: int | None = None,
+    incremental: bool = False,
     **kwargs: list[Any],
 ) -> None:
     base_dir = dest_dir / "providers" / provider_info.name
@@ -71,42 +140,43 @@ def download_provider_distribution(
         config_dataclass(**dict(params))
         for params in itertools.product(*(iter_values(name) for name in kwargs))
     ]
-    for config in configs:
-        provider = provider_info.type.create(Identifier("_"), lazy=False, config=config)
 
-        # TODO(John Sirois): Consider paring down the set of distributions serialized to those we
-        #  actually download. The issue this will introduce is merging partial download distribution
-        #  manifests.
-        distributions = provider.distributions()
-        distributions.serialize(base_dir=base_dir)
+    def create_provider(config: Any) -> Provider:
+        return provider_info.type.create(Identifier("_"), lazy=False, config=config)
+
+    with Executor(max_workers=jobs) as executor:
+        providers = list(executor.map(create_provider, configs))
 
+    # N.B.: Several platforms can share a distribution (e.g.: Windows aarch64 and x86_64 may both
+    # use an x86_64 distribution); so we key artifacts by destination to download each just once.
+    artifacts = dict[Path, _Artifact]()
+    urls_by_provider = [set[Url]() for _ in providers]
+    for config, provider, urls in zip(configs, providers, urls_by_provider):
         config_desc = " ".join(
             str(value)
             for field in provider_info.config_fields()
             if (value := getattr(config, field.name))
         )
-        for platform_spec in provider.iter_supported_platforms(platform_specs):
-            if dist := provider.distribution(platform_spec):
+        distributions_by_platform = provider.distributions_for(
+            provider.iter_supported_platforms(platform_specs)
+        )
+        for platform_spec, dist in distributions_by_platform.items():
+            if dist:
                 assert isinstance(dist.file.source, Fetch), (
                     f"Expected {provider_info.name} to fetch distributions by URL but "
                     f"{config_desc} for {platform_spec} has a source of {dist.file.source}."
                 )
+                urls.add(dist.file.source.url)
                 dest = base_dir / dist.file.source.url.rel_path
-                click.echo(
-                    f"Downloading {provider_info.name} {config_desc} for {platform_spec} to "
-                    f"{dest}...",
-                    err=True,
-                )
-                result = fetch_and_verify(
-                    url=dist.file.source.url,
-                    fingerprint=dist.file.digest,
-                    executable=dist.file.is_executable,
-                )
-                dest.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy(result.path, dest)
-                exe_flag = "*" if dist.file.is_executable else " "
-                dest.with_name(f"{dest.name}.sha256").write_text(
-                    f"{result.digest.fingerprint} {exe_flag}{dest.name}"
+                artifacts.setdefault(
+                    dest,
+                    _Artifact(
+                        description=f"{provider_info.name} {config_desc} for {platform_spec}",
+                        url=dist.file.source.url,
+                        digest=dist.file.digest,
+                        executable=dist.file.is_executable,
+                        dest=dest,
+                    ),
                 )
             elif explicit_platforms:
                 raise InputError(
@@ -118,3 +188,58 @@ def download_provider_distribution(
                     f"skipping.",
                     fg="yellow",
                 )
+
+    if incremental:
+        mirrored = [artifact for artifact in artifacts.values() if artifact.is_mirrored()]
+        if mirrored:
+            click.echo(
+                f"Skipping {len(mirrored)} {provider_info.name} distributions already mirrored.",
+                err=True,
+            )
+            for artifact in mirrored:
+                artifacts.pop(artifact.dest)
+
+    start = time.monotonic()
+    downloaded = list[_Downloaded]()
+    with (
+        Executor(max_workers=jobs) as executor,
+        # N.B.: Not all distributions have a known size up front; so we count progress by
+        # distribution and report sizes in the summary below.
+        tqdm(
+            total=len(artifacts),
+            desc=f"Downloading {provider_info.name} distributions",
+            unit="dist",
+            disable=not artifacts,
+        ) as progress,
+    ):
+        futures = [executor.submit(_download_artifact, artifact) for artifact in artifacts.values()]
+        for future in as_completed(futures):
+            result = future.result()
+            progress.update()
+            progress.write(
+                f"Downloaded {result.artifact.description} to {result.artifact.dest}",
+                file=sys.stderr,
+            )
+            downloaded.append(result)
+    elapsed = time.monotonic() - start
+
+    # N.B.: We only write distribution manifests once the distributions they describe are in place
+    # so that an interrupted download never leaves the mirror advertising missing distributions.
+    for provider, urls in zip(providers, urls_by_provider):
+        provider.distributions().serialize(base_dir=base_dir, urls=urls if incremental else None)
+
+    if not downloaded:
+        return
+
+    click.echo(f"Downloaded {len(downloaded)} {provider_info.name} distributions:", err=True)
+    name_width = max(len(result.artifact.dest.name) for result in downloaded)
+    for result in sorted(downloaded, key=lambda result: result.artifact.dest):
+        click.echo(
+            f"  {result.artifact.dest.name.ljust(name_width)} "
+            f"{_format_size(result.size):>10} {result.elapsed:>8.2f}s",
+            err=True,
+        )
+    click.echo(
+        f"Downloaded {_format_size(sum(result.size for result in downloaded))} in {elapsed:.2f}s.",
+        err=True,
+    )
@@ -4,16 +4,21 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
+import hashlib
 import json
+import os
 from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable, Iterator, Mapping, TextIO
+from typing import Any, BinaryIO, Iterable, Iterator, Mapping, TextIO
 
-from science import a_scie, providers
+from science import __version__, a_scie, archive, providers
 from science.build_info import BuildInfo
+from science.cache import digest_cache, science_cache
 from science.errors import InputError
 from science.fetcher import fetch_and_verify
+from science.hashing import Digest
 from science.model import (
     Application,
     Binding,
@@ -22,10 +27,15 @@ from science.model import (
     Fetch,
     File,
     FileType,
+    Identifier,
+    Interpreter,
     InterpreterGroup,
     ScieJump,
 )
+from science.parallel import raise_errors
 from science.platform import CURRENT_PLATFORM_SPEC, PlatformSpec
+from science.scheduler import Scheduler, Task
+from science.template import Placeholder, Template
 
 
 @dataclass(frozen=True)
@@ -93,6 +103,7 @@ class LiftConfig:
     app_info: tuple[AppInfo, ...] = ()
     app_name: str | None = None
     platform_specs: tuple[PlatformSpec, ...] = ()
+    jobs: int | None = None
 
 
 def export_manifest(
@@ -102,155 +113,530 @@ def export_manifest(
     *,
     platform_specs: Iterable[PlatformSpec] | None = None,
 ) -> Iterator[tuple[PlatformSpec, Path]]:
-    app_info = AppInfo.assemble(lift_config.app_info)
-
-    for platform_spec in platform_specs or application.platform_specs:
-        chroot = dest_dir / platform_spec.value
-        chroot.mkdir(parents=True, exist_ok=True)
+    """Export a scie lift JSON manifest for each platform.
+
+    The platforms are exported in parallel using up to `lift_config.jobs` threads, but results are
+    yielded in platform order. If exporting fails for any platforms, yielding stops at the first
+    failed platform and the errors for all platforms are raised together.
+    """
+    scheduler = Scheduler(jobs=lift_config.jobs)
+    export_tasks = schedule_export(
+        scheduler, lift_config, application, dest_dir, platform_specs=platform_specs
+    )
+    scheduler.run()
+
+    errors = dict[PlatformSpec, Exception]()
+    for platform_spec, export_task in export_tasks.items():
+        try:
+            lift_manifest = export_task.result()
+        except Exception as e:
+            errors[platform_spec] = e
+        else:
+            if not errors:
+                yield platform_spec, lift_manifest
+    raise_errors(errors, subject="export lift manifests")
 
-        bindings = list[Command]()
-        distributions = list[Distribution]()
 
-        requested_files = deque[File]()
-        file_paths_by_id = {
-            file_mapping.id: file_mapping.path.resolve()
-            for file_mapping in lift_config.file_mappings
+@dataclass(frozen=True)
+class ExportFingerprint:
+    """A fingerprint of the inputs to `science lift export` used to skip redundant exports.
+
+    The fingerprint covers the lift TOML, the lift configuration, the export options, the cwd, the
+    science version, the interpreter distributions and ptex binaries the export resolves and the
+    scie-jump it pins. The record of an export made with a given fingerprint additionally tracks the
+    stat signatures of the local files that went into it and the digests of the lift manifests it
+    output; so an export can be reused only as long as none of those have changed either.
+    """
+
+    @staticmethod
+    def _resolve(lift_config: LiftConfig, application: Application) -> dict[str, Any]:
+        # N.B.: Resolving is cheap next to exporting since the release metadata and ptex binaries
+        # involved are cached; so we re-resolve on every export to pick up new releases.
+        platform_specs = tuple(lift_config.platform_specs or application.platform_specs)
+
+        def render(file: File) -> dict[str, Any]:
+            url = str(file.source.url) if isinstance(file.source, Fetch) else None
+            digest = file.digest
+            return {
+                "url": url,
+                "size": digest.size if digest else None,
+                "hash": digest.fingerprint if digest else None,
+            }
+
+        distributions = {
+            interpreter.id: interpreter.provider.distributions_for(platform_specs)
+            for interpreter in application.interpreters
         }
-        inverted = list[str]()
-
-        def maybe_invert_lazy(file: File) -> File:
-            if file.id in lift_config.invert_lazy_ids:
-                match file.source:
-                    case Fetch(_, lazy=lazy) as fetch:
-                        inverted.append(file.id)
-                        # MyPy does not handle dataclass_transform yet: https://github.com/python/mypy/issues/14293
-                        return dataclasses.replace(
-                            file,
-                            source=dataclasses.replace(fetch, lazy=not lazy),  # type: ignore[misc]
-                        )  # type: ignore[misc]
-                    case Binding(name):
-                        raise InputError(f"Cannot make binding {name!r} non-lazy.")
-                    case None:
-                        raise InputError(f"Cannot lazy fetch local file {file.name!r}.")
-            return file
-
-        for interpreter in application.interpreters:
-            distribution = interpreter.provider.distribution(platform_spec)
-            if distribution is None:
-                raise InputError(
-                    f"No compatible {providers.name(interpreter.provider)} distribution was found "
-                    f"for {platform_spec}."
-                )
-            if distribution:
-                distributions.append(distribution)
-                requested_files.append(maybe_invert_lazy(distribution.file))
-        requested_files.extend(map(maybe_invert_lazy, application.files))
-        if (actually_inverted := frozenset(inverted)) != lift_config.invert_lazy_ids:
-            raise InputError(
-                "There following files were not present to invert laziness for: "
-                f"{', '.join(sorted(lift_config.invert_lazy_ids - actually_inverted))}"
-            )
 
+        # N.B.: This mirrors the check `_fetch_platform` uses to decide whether to embed ptex.
         fetches_present = any(
-            isinstance(file.source, Fetch) and file.source.lazy for file in requested_files
+            isinstance(file.source, Fetch)
+            and file.source.lazy != (file.id in lift_config.invert_lazy_ids)
+            for file in (
+                *application.files,
+                *(
+                    distribution.file
+                    for resolved in distributions.values()
+                    for distribution in resolved.values()
+                    if distribution
+                ),
+            )
+        )
+        ptex = (
+            {
+                platform_spec.value: a_scie.ptex(
+                    specification=application.ptex, platform=platform_spec.platform
+                ).digest.fingerprint
+                for platform_spec in platform_specs
+            }
+            if application.ptex or fetches_present
+            else None
+        )
+
+        scie_jump = application.scie_jump
+        return {
+            "distributions": {
+                interpreter_id: {
+                    platform_spec.value: render(distribution.file) if distribution else None
+                    for platform_spec, distribution in resolved.items()
+                }
+                for interpreter_id, resolved in distributions.items()
+            },
+            "ptex": ptex,
+            "scie_jump": {
+                "version": str(scie_jump.version) if scie_jump and scie_jump.version else None,
+                "hash": scie_jump.digest.fingerprint if scie_jump and scie_jump.digest else None,
+            },
+        }
+
+    @classmethod
+    def calculate(
+        cls,
+        lift_config: LiftConfig,
+        config: BinaryIO,
+        application: Application,
+        dest_dir: Path,
+        use_platform_suffix: bool | None,
+    ) -> ExportFingerprint | None:
+        if lift_config.include_provenance or not config.seekable():
+            # N.B.: Provenance includes the git state of the cwd which we'd have to gather to check;
+            # so we just re-export.
+            return None
+
+        config.seek(0)
+        lift_toml = Digest.hasher(config).drain()
+        fingerprint = json.dumps(
+            {
+                "science": __version__,
+                "lift_toml": {"source": config.name, "hash": lift_toml.fingerprint},
+                "file_mappings": [
+                    [file_mapping.id, str(file_mapping.path.resolve())]
+                    for file_mapping in lift_config.file_mappings
+                ],
+                "invert_lazy_ids": sorted(lift_config.invert_lazy_ids),
+                "app_name": lift_config.app_name,
+                "platform_specs": [
+                    platform_spec.value for platform_spec in lift_config.platform_specs
+                ],
+                "use_platform_suffix": use_platform_suffix,
+                "cwd": str(Path.cwd()),
+                "resolved": cls._resolve(lift_config, application),
+            },
+            sort_keys=True,
         )
-        if application.ptex or fetches_present:
-            ptex = a_scie.ptex(specification=application.ptex, platform=platform_spec.platform)
-            (chroot / ptex.binary_name).symlink_to(ptex.path)
-            ptex_key = application.ptex.id if application.ptex and application.ptex.id else "ptex"
-            ptex_file = File(
-                name=ptex.binary_name, key=ptex_key, digest=ptex.digest, is_executable=True
+        return cls(
+            value=hashlib.sha256(fingerprint.encode()).hexdigest(), dest_dir=dest_dir.resolve()
+        )
+
+    value: str
+    dest_dir: Path
+
+    @property
+    def _record(self) -> Path:
+        dest_dir_hash = hashlib.sha256(str(self.dest_dir).encode()).hexdigest()
+        return science_cache() / "exports" / f"{dest_dir_hash}.json"
+
+    @staticmethod
+    def _stat_signature(path: Path) -> list[int] | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return [stat.st_ino, stat.st_size, stat.st_mtime_ns]
+
+    def reusable_outputs(self) -> tuple[Path, ...] | None:
+        """Return the lift manifests output by a previous export with this fingerprint.
+
+        If any of those outputs are no longer intact, returns `None`.
+        """
+        try:
+            record = json.loads(self._record.read_text())
+        except (OSError, ValueError):
+            return None
+        if record.get("fingerprint") != self.value:
+            return None
+        for input_path, stat_signature in record["inputs"].items():
+            if self._stat_signature(Path(input_path)) != stat_signature:
+                return None
+        outputs = list[Path]()
+        for output, fingerprint in record["outputs"].items():
+            output_path = self.dest_dir / output
+            try:
+                if Digest.hash(output_path).fingerprint != fingerprint:
+                    return None
+            except OSError:
+                return None
+            outputs.append(output_path)
+        return tuple(outputs)
+
+    def record(self, inputs: Iterable[Path], outputs: Iterable[Path]) -> None:
+        """Record an export with this fingerprint that used the given local files."""
+        self._record.parent.mkdir(parents=True, exist_ok=True)
+        work_record = self._record.with_name(f"{self._record.name}.{os.getpid()}")
+        work_record.write_text(
+            json.dumps(
+                {
+                    "fingerprint": self.value,
+                    "inputs": {str(path): self._stat_signature(path) for path in inputs},
+                    "outputs": {
+                        output.relative_to(self.dest_dir).as_posix(): Digest.hash(
+                            output
+                        ).fingerprint
+                        for output in outputs
+                    },
+                }
             )
+        )
+        work_record.replace(self._record)
 
-            file_paths_by_id[ptex_file.id] = chroot / ptex_file.name
-            requested_files.appendleft(ptex_file)
-            if fetches_present:
-                argv1 = (
-                    application.ptex.argv1
-                    if application.ptex and application.ptex.argv1
-                    else "{scie.lift}"
-                )
-                bindings.append(Fetch.create_binding(fetch_exe=ptex_file, argv1=argv1))
-        bindings.extend(application.bindings)
-
-        files = list[File]()
-        fetch_urls = dict[str, str]()
-        for requested_file in requested_files:
-            file = requested_file
-            file_path: Path | None = None
-            match requested_file.source:
-                case Fetch(url=url, lazy=True):
-                    fetch_urls[requested_file.name] = url
-                case Fetch(url=url, lazy=False):
+
+def local_inputs(lift_config: LiftConfig, application: Application) -> tuple[Path, ...]:
+    """Return the paths of the local files an export of the given application uses."""
+    file_paths_by_id = {
+        file_mapping.id: file_mapping.path.resolve() for file_mapping in lift_config.file_mappings
+    }
+    return tuple(
+        dict.fromkeys(
+            (
+                *file_paths_by_id.values(),
+                *(
+                    file_paths_by_id.get(file.id) or Path.cwd() / file.name
+                    for file in application.files
+                    if not file.source
+                ),
+            )
+        )
+    )
+
+
+def schedule_export(
+    scheduler: Scheduler,
+    lift_config: LiftConfig,
+    application: Application,
+    dest_dir: Path,
+    *,
+    platform_specs: Iterable[PlatformSpec] | None = None,
+) -> dict[PlatformSpec, Task[Path]]:
+    """Add the tasks needed to export a scie lift JSON manifest for each platform to `scheduler`.
+
+    Returns the task that exports the lift manifest for each platform.
+    """
+    app_info = AppInfo.assemble(lift_config.app_info)
+    platform_specs = tuple(platform_specs or application.platform_specs)
+
+    resolve_tasks = {
+        interpreter.id: scheduler.add(
+            f"resolve {interpreter.id} distributions",
+            functools.partial(interpreter.provider.distributions_for, platform_specs),
+        )
+        for interpreter in application.interpreters
+    }
+
+    # N.B.: Local files are the same for every platform; so we verify their digests once up front,
+    # in parallel, and leave each platform export to hit the digest cache.
+    verify_tasks = [
+        scheduler.add(
+            f"verify {file.id}",
+            functools.partial(file.maybe_check_digest, file_path, digest_cache=digest_cache()),
+        )
+        for file, file_path in _local_files(lift_config, application)
+    ]
+
+    export_tasks = dict[PlatformSpec, Task[Path]]()
+    for platform_spec in platform_specs:
+        fetch_task = scheduler.add(
+            f"fetch {platform_spec}",
+            functools.partial(
+                _fetch_platform,
+                lift_config,
+                application,
+                platform_spec=platform_spec,
+                resolve_tasks=resolve_tasks,
+            ),
+            dependencies=resolve_tasks.values(),
+        )
+        export_tasks[platform_spec] = scheduler.add(
+            f"export {platform_spec}",
+            functools.partial(
+                _export_platform,
+                lift_config,
+                application,
+                dest_dir,
+                platform_spec=platform_spec,
+                fetch_task=fetch_task,
+                app_info=app_info,
+            ),
+            dependencies=(fetch_task, *verify_tasks),
+        )
+    return export_tasks
+
+
+def _local_files(lift_config: LiftConfig, application: Application) -> Iterator[tuple[File, Path]]:
+    file_paths_by_id = {
+        file_mapping.id: file_mapping.path.resolve() for file_mapping in lift_config.file_mappings
+    }
+    for file in application.files:
+        if file.source or not file.digest:
+            continue
+        file_path = file_paths_by_id.get(file.id) or Path.cwd() / file.name
+        if file_path.is_file():
+            yield file, file_path
+
+
+@dataclass(frozen=True)
+class _PlatformFiles:
+    distributions: tuple[Distribution, ...]
+    requested_files: tuple[File, ...]
+    file_paths_by_id: Mapping[str, Path]
+    bindings: tuple[Command, ...]
+
+
+def _fetch_platform(
+    lift_config: LiftConfig,
+    application: Application,
+    *,
+    platform_spec: PlatformSpec,
+    resolve_tasks: Mapping[Identifier, Task[Mapping[PlatformSpec, Distribution | None]]],
+) -> _PlatformFiles:
+    bindings = list[Command]()
+    distributions = list[Distribution]()
+
+    requested_files = deque[File]()
+    file_paths_by_id = {
+        file_mapping.id: file_mapping.path.resolve() for file_mapping in lift_config.file_mappings
+    }
+    inverted = list[str]()
+
+    def maybe_invert_lazy(file: File) -> File:
+        if file.id in lift_config.invert_lazy_ids:
+            match file.source:
+                case Fetch(_, lazy=lazy) as fetch:
+                    inverted.append(file.id)
                     # MyPy does not handle dataclass_transform yet: https://github.com/python/mypy/issues/14293
-                    file = dataclasses.replace(requested_file, source=None)  # type: ignore[misc]
-                    file_path = fetch_and_verify(
-                        url,
-                        fingerprint=requested_file.digest,
-                        executable=requested_file.is_executable,
-                    ).path
+                    return dataclasses.replace(
+                        file,
+                        source=dataclasses.replace(fetch, lazy=not lazy),  # type: ignore[misc]
+                    )  # type: ignore[misc]
+                case Binding(name):
+                    raise InputError(f"Cannot make binding {name!r} non-lazy.")
                 case None:
-                    file_path = (
-                        file_paths_by_id.get(requested_file.id) or Path.cwd() / requested_file.name
-                    )
-                    if not file_path.exists():
-                        if file_path.is_relative_to(Path.cwd()):
-                            raise InputError(
-                                f"The file for {requested_file.id} is not mapped or cannot be "
-                                f"found at {file_path.relative_to(Path.cwd())} relative to the cwd "
-                                f"of {Path.cwd()}."
-                            )
+                    raise InputError(f"Cannot lazy fetch local file {file.name!r}.")
+        return file
+
+    for interpreter in application.interpreters:
+        distribution = resolve_tasks[interpreter.id].result()[platform_spec]
+        if distribution is None:
+            raise InputError(
+                f"No compatible {providers.name(interpreter.provider)} distribution was found "
+                f"for {platform_spec}."
+            )
+        if distribution:
+            distributions.append(distribution)
+            file = maybe_invert_lazy(distribution.file)
+            if interpreter.slim or interpreter.bytecode:
+                file, file_paths_by_id[file.id] = _process_distribution(interpreter, file)
+            requested_files.append(file)
+    requested_files.extend(map(maybe_invert_lazy, application.files))
+    if (actually_inverted := frozenset(inverted)) != lift_config.invert_lazy_ids:
+        raise InputError(
+            "There following files were not present to invert laziness for: "
+            f"{', '.join(sorted(lift_config.invert_lazy_ids - actually_inverted))}"
+        )
+
+    fetches_present = any(
+        isinstance(file.source, Fetch) and file.source.lazy for file in requested_files
+    )
+    if application.ptex or fetches_present:
+        ptex = a_scie.ptex(specification=application.ptex, platform=platform_spec.platform)
+        ptex_key = application.ptex.id if application.ptex and application.ptex.id else "ptex"
+        ptex_file = File(
+            name=ptex.binary_name, key=ptex_key, digest=ptex.digest, is_executable=True
+        )
+
+        file_paths_by_id[ptex_file.id] = ptex.path
+        requested_files.appendleft(ptex_file)
+        if fetches_present:
+            argv1 = (
+                application.ptex.argv1
+                if application.ptex and application.ptex.argv1
+                else "{scie.lift}"
+            )
+            bindings.append(Fetch.create_binding(fetch_exe=ptex_file, argv1=argv1))
+    bindings.extend(application.bindings)
+
+    for requested_file in requested_files:
+        match requested_file.source:
+            case Fetch(url=url, lazy=False):
+                file_paths_by_id[requested_file.id] = fetch_and_verify(
+                    url,
+                    fingerprint=requested_file.digest,
+                    executable=requested_file.is_executable,
+                ).path
+
+    return _PlatformFiles(
+        distributions=tuple(distributions),
+        requested_files=tuple(requested_files),
+        file_paths_by_id=file_paths_by_id,
+        bindings=tuple(bindings),
+    )
+
+
+def _export_platform(
+    lift_config: LiftConfig,
+    application: Application,
+    dest_dir: Path,
+    *,
+    platform_spec: PlatformSpec,
+    fetch_task: Task[_PlatformFiles],
+    app_info: Mapping[str, Any],
+) -> Path:
+    chroot = dest_dir / platform_spec.value
+    chroot.mkdir(parents=True, exist_ok=True)
+
+    platform_files = fetch_task.result()
+    file_paths_by_id = platform_files.file_paths_by_id
+
+    files = list[File]()
+    fetch_urls = dict[str, str]()
+    for requested_file in platform_files.requested_files:
+        file = requested_file
+        file_path: Path | None = None
+        match requested_file.source:
+            case Fetch(url=url, lazy=True):
+                fetch_urls[requested_file.name] = url
+            case Fetch(lazy=False):
+                # MyPy does not handle dataclass_transform yet: https://github.com/python/mypy/issues/14293
+                file = dataclasses.replace(requested_file, source=None)  # type: ignore[misc]
+                file_path = file_paths_by_id[requested_file.id]
+            case None:
+                file_path = (
+                    file_paths_by_id.get(requested_file.id) or Path.cwd() / requested_file.name
+                )
+                if not file_path.exists():
+                    if file_path.is_relative_to(Path.cwd()):
                         raise InputError(
-                            f"The file for {requested_file.id} is not mapped or cannot be found at "
-                            f"{file_path}."
+                            f"The file for {requested_file.id} is not mapped or cannot be "
+                            f"found at {file_path.relative_to(Path.cwd())} relative to the cwd "
+                            f"of {Path.cwd()}."
                         )
-            files.append(file)
-
-            target = chroot / requested_file.name
-            if file_path and file_path.is_dir():
-                if requested_file.type and requested_file.type is not FileType.Directory:
                     raise InputError(
-                        f"The file for {requested_file.id} is expected to be a "
-                        f"{requested_file.type} but maps to the directory {file_path}."
+                        f"The file for {requested_file.id} is not mapped or cannot be found at "
+                        f"{file_path}."
                     )
+        target = chroot / requested_file.name
+        if file_path and file_path.is_dir():
+            if requested_file.type and requested_file.type is not FileType.Directory:
+                raise InputError(
+                    f"The file for {requested_file.id} is expected to be a "
+                    f"{requested_file.type} but maps to the directory {file_path}."
+                )
 
-                # N.B.: The scie-jump boot pack expects a local directory to zip up as a sibling. It
-                # then includes the local sibling <dir>.zip in the scie. If we point it at the
-                # directory `file_path` directly via symlink it will follow the symlink and zip up
-                # the directory as a sibling there instead and not find the resulting zip. As such
-                # we create a thin local directory of symlinks here for it to work against.
-                target.mkdir(parents=True, exist_ok=True)
-                for entry in file_path.iterdir():
-                    (target / entry.name).symlink_to(entry)
-            elif file_path:
-                requested_file.maybe_check_digest(file_path)
-                target.parent.mkdir(parents=True, exist_ok=True)
-                if not target.exists():
-                    target.symlink_to(file_path)
-
-        lift_manifest = chroot / "lift.json"
-
-        build_info = application.build_info if lift_config.include_provenance else None
-
-        with open(lift_manifest, "w") as lift_manifest_output:
-            _emit_manifest(
-                lift_manifest_output,
-                name=application.name,
-                description=application.description,
-                load_dotenv=application.load_dotenv,
-                base=application.base,
-                scie_jump=application.scie_jump or ScieJump(),
-                platform_spec=platform_spec,
-                distributions=distributions,
-                interpreter_groups=application.interpreter_groups,
-                files=requested_files,
-                commands=application.commands,
-                bindings=bindings,
-                fetch_urls=fetch_urls,
-                build_info=build_info,
-                app_info=app_info,
+            # N.B.: The scie-jump boot pack expects a local directory to zip up as a sibling. It
+            # then includes the local sibling <dir>.zip in the scie. If we point it at the
+            # directory `file_path` directly via symlink it will follow the symlink and zip up
+            # the directory as a sibling there instead and not find the resulting zip. As such
+            # we create a thin local directory of symlinks here for it to work against.
+            target.mkdir(parents=True, exist_ok=True)
+            for entry in file_path.iterdir():
+                (target / entry.name).symlink_to(entry)
+        elif file_path:
+            requested_file.maybe_check_digest(file_path, digest_cache=digest_cache())
+            if application.zstd and (
+                transcoded := archive.transcode_to_zstd(file, file_path, application.zstd)
+            ):
+                file, file_path = transcoded
+                target = chroot / file.name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if not target.exists():
+                target.symlink_to(file_path)
+        files.append(file)
+
+    lift_manifest = chroot / "lift.json"
+
+    build_info = application.build_info if lift_config.include_provenance else None
+
+    with open(lift_manifest, "w") as lift_manifest_output:
+        _emit_manifest(
+            lift_manifest_output,
+            name=application.name,
+            description=application.description,
+            load_dotenv=application.load_dotenv,
+            base=application.base,
+            scie_jump=application.scie_jump or ScieJump(),
+            platform_spec=platform_spec,
+            distributions=platform_files.distributions,
+            interpreter_groups=application.interpreter_groups,
+            files=files,
+            commands=application.commands,
+            bindings=platform_files.bindings,
+            fetch_urls=fetch_urls,
+            build_info=build_info,
+            app_info=app_info,
+        )
+    return lift_manifest
+
+
+def _host_python(interpreter: Interpreter) -> Path:
+    distribution = interpreter.provider.distribution(CURRENT_PLATFORM_SPEC)
+    if not distribution or Identifier("python") not in distribution.placeholders:
+        raise InputError(
+            f"Compiling bytecode for the {interpreter.id} interpreter requires a "
+            f"{providers.name(interpreter.provider)} Python distribution that runs on the current "
+            f"platform of {CURRENT_PLATFORM_SPEC} but none was found."
+        )
+    file = distribution.file
+    if not isinstance(file.source, Fetch):
+        raise InputError(
+            f"Cannot fetch the {interpreter.id} interpreter distribution for the current platform "
+            f"of {CURRENT_PLATFORM_SPEC} to compile bytecode with."
+        )
+    path = fetch_and_verify(file.source.url, fingerprint=file.digest).path
+    return archive.extract(file, path) / distribution.placeholders[Identifier("python")]
+
+
+def _process_distribution(interpreter: Interpreter, file: File) -> tuple[File, Path]:
+    match file.source:
+        case Fetch(url=url, lazy=False):
+            path = fetch_and_verify(url, fingerprint=file.digest).path
+        case _:
+            table = "slim" if interpreter.slim else "bytecode"
+            raise InputError(
+                f"The {interpreter.id} interpreter distribution is lazily fetched and so cannot be "
+                f"processed at build-time. Either set `lazy = false` for the interpreter, invert "
+                f"its laziness with `--invert-lazy {file.id}` or remove its `{table}` table."
             )
-        yield platform_spec, lift_manifest
+
+    # MyPy does not handle dataclass_transform yet: https://github.com/python/mypy/issues/14293
+    file = dataclasses.replace(file, source=None)  # type: ignore[misc]
+    if interpreter.slim:
+        path, digest = archive.slim(file, path, interpreter.slim)
+        file = dataclasses.replace(file, digest=digest)  # type: ignore[misc]
+    if interpreter.bytecode:
+        path, digest = archive.compile_bytecode(
+            file, path, interpreter.bytecode, python=_host_python(interpreter)
+        )
+        file = dataclasses.replace(file, digest=digest)  # type: ignore[misc]
+    return file, path
 
 
 def _render_file(file: File) -> dict[str, Any]:
@@ -273,21 +659,56 @@ def _render_file(file: File) -> dict[str, Any]:
     return data
 
 
-def _render_command(
-    command: Command,
-    platform_spec: PlatformSpec,
-    distributions: Iterable[Distribution],
-    interpreter_groups: Iterable[InterpreterGroup],
-) -> tuple[str, dict[str, Any]]:
-    env: dict[str, str | None] = {}
+class _PlaceholderResolver:
+    """Resolves `#{<id>...}` placeholders for a single platform via lookup by id."""
 
-    def expand_placeholders(text: str) -> str:
+    def __init__(
+        self,
+        platform_spec: PlatformSpec,
+        distributions: Iterable[Distribution],
+        interpreter_groups: Iterable[InterpreterGroup],
+    ) -> None:
+        self._platform_spec = platform_spec
+        # N.B.: Distributions take precedence over interpreter groups and the first of any given id
+        # wins.
+        self._targets = dict[str, Distribution | InterpreterGroup]()
         for distribution in distributions:
-            text = distribution.expand_placeholders(platform_spec, text)
+            self._targets.setdefault(distribution.id, distribution)
         for interpreter_group in interpreter_groups:
-            text, ig_env = interpreter_group.expand_placeholders(platform_spec, text)
-            env.update(ig_env)
-        return text
+            self._targets.setdefault(interpreter_group.id, interpreter_group)
+        self._expansions = dict[tuple[str, str | None], tuple[str, Mapping[str, str]]]()
+
+    def expand(self, template: str, env: dict[str, str | None]) -> str:
+        """Expand the placeholders in the given template, adding any env vars they need to `env`."""
+
+        def resolve(placeholder: Placeholder) -> str | None:
+            key = placeholder.id, placeholder.name
+            if (expansion := self._expansions.get(key)) is None:
+                match self._targets.get(placeholder.id):
+                    case Distribution() as distribution:
+                        expansion = (
+                            distribution.expand_placeholder(self._platform_spec, placeholder.name),
+                            {},
+                        )
+                    case InterpreterGroup() as interpreter_group:
+                        expansion = interpreter_group.expand_placeholder(
+                            self._platform_spec, placeholder.name
+                        )
+                    case _:
+                        return None
+                self._expansions[key] = expansion
+            value, placeholder_env = expansion
+            env.update(placeholder_env)
+            return value
+
+        return Template.parse(template).render(resolve)
+
+
+def _render_command(command: Command, resolver: _PlaceholderResolver) -> tuple[str, dict[str, Any]]:
+    env: dict[str, str | None] = {}
+
+    def expand_placeholders(text: str) -> str:
+        return resolver.expand(text, env)
 
     cmd: dict[str, Any] = {"exe": expand_placeholders(command.exe)}
 
@@ -333,10 +754,10 @@ def _emit_manifest(
     def render_files() -> list[dict[str, Any]]:
         return [_render_file(file) for file in files]
 
+    resolver = _PlaceholderResolver(platform_spec, distributions, interpreter_groups)
+
     def render_commands(cmds: Iterable[Command]) -> dict[str, dict[str, Any]]:
-        return dict(
-            _render_command(cmd, platform_spec, distributions, interpreter_groups) for cmd in cmds
-        )
+        return dict(_render_command(cmd, resolver) for cmd in cmds)
 
     lift_data = {
         "name": name,
@@ -9,13 +9,14 @@ import tomllib
 from collections import defaultdict
 from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
-from functools import cache
+from functools import cache, partial
 from io import BytesIO
 from pathlib import Path
 from textwrap import dedent
 from typing import BinaryIO, Generic, TypeVar
 
 from science.build_info import BuildInfo
+from science.cache import digest_cache
 from science.data import Accessor, Data
 from science.dataclass import Dataclass
 from science.dataclass.deserializer import HeterogeneousParser
@@ -36,11 +37,13 @@ from science.platform import LibC, Platform, PlatformSpec
 from science.providers import get_provider
 
 
-def parse_config(content: BinaryIO, source: str) -> Application:
+def parse_config(content: BinaryIO, source: str, include_provenance: bool = False) -> Application:
     hashed_content = Digest.hasher(content)
     data = FrozenDict(tomllib.load(hashed_content))
     provenance = Provenance(source, digest=hashed_content.digest())
-    return parse_config_data(Data(provenance=provenance, data=data))
+    return parse_config_data(
+        Data(provenance=provenance, data=data), include_provenance=include_provenance
+    )
 
 
 def parse_config_file(path: Path) -> Application:
@@ -52,9 +55,13 @@ def parse_config_str(config: str) -> Application:
     return parse_config(BytesIO(config.encode()), source="<string>")
 
 
-def parse_build_info(data: Data) -> BuildInfo:
+def parse_build_info(data: Data, include_provenance: bool = False) -> BuildInfo:
     return BuildInfo.gather(
-        lift_toml=data.provenance, app_info=data.get_data("app_info", default={}, used=True).data
+        lift_toml=data.provenance,
+        app_info=data.get_data("app_info", default={}, used=True).data,
+        digest_cache=digest_cache(),
+        # N.B.: The git state is only rendered in provenance; so we only pay to gather it then.
+        include_git_state=include_provenance,
     )
 
 
@@ -146,7 +153,7 @@ def gather_unrecognized_application_config(
     return valid_config_by_unused_accessor
 
 
-def parse_config_data(data: Data) -> Application:
+def parse_config_data(data: Data, include_provenance: bool = False) -> Application:
     lift = data.get_data("lift")
 
     interpreters_by_id = {
@@ -178,7 +185,7 @@ def parse_config_data(data: Data) -> Application:
         Application,
         interpreters=tuple(interpreters_by_id.values()),
         custom_parsers={
-            BuildInfo: parse_build_info,
+            BuildInfo: partial(parse_build_info, include_provenance=include_provenance),
             InterpreterGroup: parse_interpreter_group,
             PlatformSpec: HeterogeneousParser.wrap(
                 parse_platform_spec, Data, str, output_type=PlatformSpec
@@ -39,10 +39,11 @@ from tenacity import (
 from tqdm import tqdm
 
 from science import VERSION, hashing
-from science.cache import CacheEntry, Missing, download_cache
+from science.cache import CacheEntry, Missing, download_cache, science_cache
 from science.errors import InputError
 from science.hashing import Digest, ExpectedDigest, Fingerprint
 from science.model import Url
+from science.parallel import Memo
 from science.platform import CURRENT_PLATFORM
 
 logger = logging.getLogger(__name__)
@@ -265,9 +266,27 @@ def configured_client(
     return httpx.Client(follow_redirects=True, headers=headers, auth=auth, timeout=timeout)
 
 
-@retry_fetch
+def _memo_key(*components: Any, headers: Mapping[str, str] | None = None) -> tuple[Any, ...]:
+    # N.B.: Memoized results live in the active science cache; so they are keyed by it too.
+    return science_cache(), *components, tuple(sorted(headers.items())) if headers else None
+
+
+_FETCH_TO_CACHE_MEMO = Memo[tuple[Any, ...], Path]()
+
+
 def _fetch_to_cache(
     url: Url, ttl: timedelta | None = None, headers: Mapping[str, str] | None = None
+) -> Path:
+    return _FETCH_TO_CACHE_MEMO.get(
+        _memo_key(url, ttl, headers=headers),
+        lambda: _fetch_to_cache_uncached(url, ttl, headers),
+        valid=Path.exists,
+    )
+
+
+@retry_fetch
+def _fetch_to_cache_uncached(
+    url: Url, ttl: timedelta | None = None, headers: Mapping[str, str] | None = None
 ) -> Path:
     with download_cache().get_or_create(url, ttl=ttl) as cache_result:
         match cache_result:
@@ -362,7 +381,9 @@ class FetchResult:
         )
 
 
-@retry_fetch
+_FETCH_AND_VERIFY_MEMO = Memo[tuple[Any, ...], FetchResult]()
+
+
 def fetch_and_verify(
     url: Url,
     fingerprint: Digest | Fingerprint | Url | None = None,
@@ -370,10 +391,43 @@ def fetch_and_verify(
     executable: bool = False,
     ttl: timedelta | None = None,
     headers: Mapping[str, str] | None = None,
+    show_progress: bool = True,
+) -> FetchResult:
+    """Fetch the given url to the download cache, verifying its digest.
+
+    Each unique fetch is resolved at most once per process; so concurrent and repeated requests
+    for the same url and expected digest, say from the exports for several platforms, share the
+    first result.
+    """
+    return _FETCH_AND_VERIFY_MEMO.get(
+        _memo_key(url, fingerprint, digest_algorithm, executable, ttl, headers=headers),
+        lambda: _fetch_and_verify(
+            url=url,
+            fingerprint=fingerprint,
+            digest_algorithm=digest_algorithm,
+            executable=executable,
+            ttl=ttl,
+            headers=headers,
+            show_progress=show_progress,
+        ),
+        valid=lambda fetch_result: fetch_result.path.exists(),
+    )
+
+
+@retry_fetch
+def _fetch_and_verify(
+    url: Url,
+    fingerprint: Digest | Fingerprint | Url | None = None,
+    digest_algorithm: str = hashing.DEFAULT_ALGORITHM,
+    executable: bool = False,
+    ttl: timedelta | None = None,
+    headers: Mapping[str, str] | None = None,
+    show_progress: bool = True,
 ) -> FetchResult:
     with download_cache().get_or_create(url, ttl=ttl) as cache_entry:
         if isinstance(cache_entry, Missing):
-            click.secho(f"Downloading {url} ...", fg="green")
+            if show_progress:
+                click.secho(f"Downloading {url} ...", fg="green")
             with configured_client(url, headers) as client:
                 expected_digest = _expected_digest(
                     url, headers, fingerprint, algorithm=digest_algorithm
@@ -396,7 +450,11 @@ def fetch_and_verify(
                             f"bytes, but advertises a Content-Length of {total} bytes."
                         )
                     with tqdm(
-                        total=total, unit_scale=True, unit_divisor=1024, unit="B"
+                        total=total,
+                        unit_scale=True,
+                        unit_divisor=1024,
+                        unit="B",
+                        disable=not show_progress,
                     ) as progress:
                         num_bytes_downloaded = response.num_bytes_downloaded
                         for data in response.iter_bytes():
@@ -430,11 +488,12 @@ def fetch_and_verify(
     except FetchResult.LoadError as e:
         logger.warning(f"Re-creating unreadable cache entry for {url}: {e}")
         cache_entry.delete()
-        return fetch_and_verify(
+        return _fetch_and_verify(
             url=url,
             fingerprint=fingerprint,
             digest_algorithm=digest_algorithm,
             executable=executable,
             ttl=ttl,
             headers=headers,
+            show_progress=show_progress,
         )
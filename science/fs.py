@@ -3,13 +3,20 @@
 
 from __future__ import annotations
 
+import os
+import shutil
+import sys
 import tempfile
+import uuid
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Iterator
 
 from science.cache import science_cache
 
+if sys.platform == "linux":
+    import fcntl
+
 _TMP_BASE_DIR = science_cache() / ".tmp"
 
 
@@ -23,3 +30,50 @@ def temporary_directory(prefix: str, delete: bool = True) -> Iterator[Path]:
         ignore_cleanup_errors=True,
     ) as td:
         yield Path(td)
+
+
+# See: https://man7.org/linux/man-pages/man2/ioctl_ficlone.2.html
+_FICLONE = 0x40049409
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    if sys.platform != "linux":
+        return False
+    try:
+        with src.open("rb") as src_fp, dst.open("wb") as dst_fp:
+            fcntl.ioctl(dst_fp.fileno(), _FICLONE, src_fp.fileno())
+    except OSError:
+        dst.unlink(missing_ok=True)
+        return False
+    shutil.copymode(src, dst)
+    return True
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    """Materialize the file at `src` at `dst`, avoiding a byte copy when possible.
+
+    When `src` and `dst` are on the same file system, `dst` is created as a copy-on-write reflink
+    where the file system supports those, or else as a hard link. Otherwise, `src` is copied. Any
+    existing file at `dst` is atomically replaced.
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    work_path = dst.with_name(f".{dst.name}.{uuid.uuid4().hex}")
+    try:
+        if not _reflink(src, work_path):
+            try:
+                os.link(src, work_path)
+            except OSError:
+                shutil.copy(src, work_path)
+        os.replace(work_path, dst)
+    finally:
+        work_path.unlink(missing_ok=True)
+
+
+def copy_or_reflink(src: Path, dst: Path) -> None:
+    """Copy the file at `src` to a new file at `dst` as a copy-on-write reflink when possible.
+
+    Unlike `link_or_copy`, the resulting `dst` file never shares an inode with `src`; so it can be
+    safely modified.
+    """
+    if not _reflink(src, dst):
+        shutil.copy(src, dst)
@@ -4,11 +4,16 @@
 from __future__ import annotations
 
 import hashlib
-import io
+import json
+import os
+import threading
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, BinaryIO, Callable, cast
+from typing import Any, BinaryIO, Callable, Iterable, Mapping, cast
 
 from science.dataclass.reflect import documented_dataclass
 from science.errors import InputError
@@ -25,6 +30,10 @@ class BinaryHasher(BinaryIO, ABC):
     def digest(self) -> Digest:
         """Return the digest of the bytes read so far."""
 
+    @abstractmethod
+    def drain(self) -> Digest:
+        """Hash any remaining unread bytes in bounded memory and return the digest of all bytes."""
+
 
 class _BinaryIOHasher:
     def __init__(self, underlying: BinaryIO, algorithm: str = DEFAULT_ALGORITHM) -> None:
@@ -45,10 +54,70 @@ class _BinaryIOHasher:
     def digest(self) -> Digest:
         return Digest(size=self._read, fingerprint=Fingerprint(self._digest.hexdigest()))
 
+    def drain(self) -> Digest:
+        while self.read(_HASH_CHUNK_SIZE):
+            pass
+        return self.digest()
+
     def __getattr__(self, name: str) -> Any:
         return getattr(self._underlying, name)
 
 
+# N.B.: Hashing in large chunks amortizes per-call overhead and hashlib releases the GIL while
+# hashing any chunk this big; so several algorithms can hash the same file in parallel.
+_HASH_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Variable length digest algorithms need an explicit length; we use the OpenSSL defaults.
+_SHAKE_DIGEST_LENGTHS = {"shake_128": 16, "shake_256": 32}
+
+
+def _fingerprint(digest: Any) -> Fingerprint:
+    if length := _SHAKE_DIGEST_LENGTHS.get(digest.name):
+        return Fingerprint(digest.hexdigest(length))
+    return Fingerprint(digest.hexdigest())
+
+
+@dataclass(frozen=True)
+class Digests:
+    size: int
+    fingerprints: Mapping[str, Fingerprint]
+
+
+def hash_path(path: Path, algorithms: Iterable[str] = (DEFAULT_ALGORITHM,)) -> Digests:
+    """Hash the file at the given path with each of the given algorithms in a single read.
+
+    The file is read in bounded memory and each algorithm hashes it on its own thread.
+    """
+    digests = {algorithm: hashlib.new(algorithm) for algorithm in algorithms}
+    with (
+        ThreadPoolExecutor(max_workers=len(digests)) if len(digests) > 1 else nullcontext()
+    ) as executor:
+
+        def update_all(data: Any) -> None:
+            if executor is None:
+                for digest in digests.values():
+                    digest.update(data)
+                return
+            for future in [executor.submit(digest.update, data) for digest in digests.values()]:
+                future.result()
+
+        # N.B.: We read into a single re-used buffer instead of memory mapping the file since the
+        # pages of a mapping stay resident as they are read, growing RSS by the size of the file.
+        size = 0
+        with (
+            path.open(mode="rb", buffering=0) as fp,
+            memoryview(bytearray(_HASH_CHUNK_SIZE)) as buf,
+        ):
+            while read := fp.readinto(buf):
+                size += read
+                update_all(buf[:read])
+
+    return Digests(
+        size=size,
+        fingerprints={algorithm: _fingerprint(digest) for algorithm, digest in digests.items()},
+    )
+
+
 @documented_dataclass(frozen=True, alias="digest")
 class Digest:
     size: int
@@ -63,10 +132,74 @@ class Digest:
 
     @classmethod
     def hash(cls, path: Path, algorithm: str = DEFAULT_ALGORITHM) -> Digest:
-        with path.open(mode="rb") as fp:
-            binary_hasher = cls.hasher(fp, algorithm=algorithm)
-            binary_hasher.read()
-            return binary_hasher.digest()
+        digests = hash_path(path, algorithms=[algorithm])
+        return cls(size=digests.size, fingerprint=digests.fingerprints[algorithm])
+
+
+class DigestCache:
+    """Memoizes file digests keyed by the file's identity and modification state.
+
+    A file is identified by its resolved path and inode and is considered unchanged as long as its
+    size and modification time are unchanged. Digests are memoized in-process and persisted under
+    `base_dir`, one entry per file, so that each file is hashed at most once per change, even across
+    processes.
+    """
+
+    def __init__(self, base_dir: Path) -> None:
+        self._base_dir = base_dir
+        self._lock = threading.Lock()
+        self._key_locks = defaultdict[tuple[Any, ...], threading.Lock](threading.Lock)
+        self._digests = dict[tuple[Any, ...], Digest]()
+
+    def digest(self, path: Path, algorithm: str = DEFAULT_ALGORITHM) -> Digest:
+        resolved_path = path.resolve()
+        stat = resolved_path.stat()
+        key = (
+            algorithm,
+            str(resolved_path),
+            stat.st_dev,
+            stat.st_ino,
+            stat.st_size,
+            stat.st_mtime_ns,
+        )
+        with self._lock:
+            if digest := self._digests.get(key):
+                return digest
+            key_lock = self._key_locks[key]
+
+        # N.B.: We hold a per-key lock while hashing so that concurrent requests for the digest of
+        # the same file wait on a single hash of it instead of each hashing it.
+        with key_lock:
+            with self._lock:
+                if digest := self._digests.get(key):
+                    return digest
+
+            # N.B.: We persist one entry per file, recording the state it was hashed in, and
+            # overwrite the entry when the file changes; so the cache does not grow with each edit.
+            file_key = [algorithm, str(resolved_path)]
+            entry = (
+                self._base_dir / f"{hashlib.sha256(json.dumps(file_key).encode()).hexdigest()}.json"
+            )
+            digest = None
+            try:
+                data = json.loads(entry.read_text())
+                if data["key"] == list(key):
+                    digest = Digest(size=data["size"], fingerprint=Fingerprint(data["fingerprint"]))
+            except (OSError, ValueError, KeyError):
+                pass
+            if digest is None:
+                digest = Digest.hash(resolved_path, algorithm=algorithm)
+                entry.parent.mkdir(parents=True, exist_ok=True)
+                work_entry = entry.with_name(f"{entry.name}.{os.getpid()}.{threading.get_ident()}")
+                work_entry.write_text(
+                    json.dumps({"key": key, "size": digest.size, "fingerprint": digest.fingerprint})
+                )
+                work_entry.replace(entry)
+
+            with self._lock:
+                self._digests[key] = digest
+                self._key_locks.pop(key, None)
+            return digest
 
 
 @dataclass(frozen=True)
@@ -99,15 +232,19 @@ class ExpectedDigest:
         self.maybe_check_size(subject=subject, actual_size=lambda: actual_size)
         self.check_fingerprint(subject=subject, actual_fingerprint=actual_fingerprint)
 
-    def check_path(self, path: Path, subject: str = "file") -> None:
+    def check_path(
+        self, path: Path, subject: str = "file", digest_cache: DigestCache | None = None
+    ) -> None:
         subject = f"{subject} at {path}"
         self.maybe_check_size(subject=subject, actual_size=lambda: path.stat().st_size)
 
-        digest = hashlib.new(self.algorithm)
-        with path.open(mode="rb") as fp:
-            for chunk in iter(lambda: fp.read(io.DEFAULT_BUFFER_SIZE), b""):
-                digest.update(chunk)
-        self.check_fingerprint(subject=subject, actual_fingerprint=Fingerprint(digest.hexdigest()))
+        if digest_cache:
+            actual_digest = digest_cache.digest(path, algorithm=self.algorithm)
+            self.check_fingerprint(subject=subject, actual_fingerprint=actual_digest.fingerprint)
+            return
+
+        actual_digest = Digest.hash(path, algorithm=self.algorithm)
+        self.check_fingerprint(subject=subject, actual_fingerprint=actual_digest.fingerprint)
 
 
 @dataclass(frozen=True)
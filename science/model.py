@@ -5,7 +5,6 @@ from __future__ import annotations
 
 import dataclasses
 import os.path
-import re
 import urllib.parse
 from collections import Counter, defaultdict
 from dataclasses import dataclass
@@ -18,7 +17,7 @@ from typing import (
     Collection,
     Iterable,
     Iterator,
-    Match,
+    Mapping,
     Protocol,
     TypeAlias,
     TypeVar,
@@ -34,8 +33,9 @@ from science.dataclass.reflect import documented_dataclass, metadata
 from science.doc import Ref
 from science.errors import InputError
 from science.frozendict import FrozenDict
-from science.hashing import Digest, ExpectedDigest
+from science.hashing import Digest, DigestCache, ExpectedDigest
 from science.platform import CURRENT_PLATFORM_SPEC, PlatformSpec
+from science.template import Placeholder, Template
 
 
 class FileType(Enum):
@@ -226,13 +226,13 @@ class File:
     def placeholder(self) -> str:
         return f"{{{self.id}}}"
 
-    def maybe_check_digest(self, path: Path):
+    def maybe_check_digest(self, path: Path, digest_cache: DigestCache | None = None):
         if not self.digest:
             return
         if self.source and self.source.lazy:
             return
         expected_digest = ExpectedDigest(fingerprint=self.digest.fingerprint, size=self.digest.size)
-        return expected_digest.check_path(path)
+        return expected_digest.check_path(path, digest_cache=digest_cache)
 
 
 class Url(str):
@@ -339,23 +339,30 @@ class Distribution:
     file: File
     placeholders: FrozenDict[Identifier, str]
 
-    def expand_placeholders(self, platform_spec: PlatformSpec, value: str) -> str:
-        def _expand_placeholder(match: Match) -> str:
-            if placeholder := match.group("placeholder"):
-                return platform_spec.join_path(
-                    self.file.placeholder, self.placeholders[Identifier(placeholder)]
-                )
-            return self.file.placeholder
+    def expand_placeholder(self, platform_spec: PlatformSpec, placeholder: str | None) -> str:
+        if placeholder:
+            return platform_spec.join_path(
+                self.file.placeholder, self.placeholders[Identifier(placeholder)]
+            )
+        return self.file.placeholder
 
-        return re.sub(
-            rf"#{{{re.escape(self.id)}(?::(?P<placeholder>[^{{}}:]+))?}}",
-            _expand_placeholder,
-            value,
+    def expand_placeholders(self, platform_spec: PlatformSpec, value: str) -> str:
+        return Template.parse(value).render(
+            lambda placeholder: (
+                self.expand_placeholder(platform_spec, placeholder.name)
+                if placeholder.id == self.id
+                else None
+            )
         )
 
 
 class DistributionsManifest(Protocol):
-    def serialize(self, base_dir: Path) -> None: ...
+    def serialize(self, base_dir: Path, urls: Collection[Url] | None = None) -> None:
+        """Serialize this distributions manifest to a mirror rooted at `base_dir`.
+
+        If `urls` are given, the serialized manifest is pared down to just the distributions with
+        those urls and these are merged into any compatible manifest already present in the mirror.
+        """
 
 
 ConfigDataclass = TypeVar("ConfigDataclass", bound=Dataclass)
@@ -380,6 +387,92 @@ class Provider(Protocol[ConfigDataclass]):
 
     def distribution(self, platform_spec: PlatformSpec) -> Distribution | None: ...
 
+    def distributions_for(
+        self, platform_specs: Iterable[PlatformSpec]
+    ) -> Mapping[PlatformSpec, Distribution | None]:
+        """Resolve the distributions for several platforms at once.
+
+        Providers that can amortize work across platforms, like remote metadata lookups, should
+        override this; by default it just calls `distribution` for each platform in turn.
+        """
+        return {platform_spec: self.distribution(platform_spec) for platform_spec in platform_specs}
+
+
+@documented_dataclass(
+    """Rules for slimming an embedded interpreter distribution archive.
+
+    Interpreter distributions often contain files not needed at run-time, like test suites, GUI
+    toolkits or bundled installer wheels. Slimming re-archives the distribution with just the
+    selected entries, which shrinks both the scie and its first-run extraction time.
+
+    Entries are matched by their path relative to the root of the archive using glob patterns where
+    `**` matches any number of path components; e.g.: `python/lib/python3.*/test/**`. A pattern
+    that matches a directory also matches everything under it.
+
+    ```{important}
+    Slimming must not remove files the application needs; including those the interpreter's
+    `#{<id>:<name>}` placeholders point to.
+    ```
+    """,
+    frozen=True,
+    alias="slim",
+)
+class Slim:
+    include: tuple[str, ...] = dataclasses.field(
+        default=(),
+        metadata=metadata(
+            """Glob patterns selecting the archive entries to keep.
+
+            If no patterns are given, all entries are kept save for those matching `exclude`
+            patterns.
+            """
+        ),
+    )
+    exclude: tuple[str, ...] = dataclasses.field(
+        default=(),
+        metadata=metadata(
+            """Glob patterns selecting archive entries to remove.
+
+            These take precedence over `include` patterns.
+            """
+        ),
+    )
+
+
+@documented_dataclass(
+    """Options for compiling an embedded interpreter distribution's Python sources to bytecode.
+
+    Without bytecode, the interpreter writes `.pyc` files on demand the first time each module is
+    imported after the scie extracts the distribution; slowing cold starts and failing outright when
+    the scie cache is read-only. Compiling at build-time avoids this.
+
+    Compilation uses the same provider's distribution for the current machine to run `compileall`
+    over the target distribution, and so that distribution must be available. The resulting `.pyc`
+    files use unchecked hash-based invalidation; so they stay valid regardless of the file
+    timestamps recorded at extraction.
+    """,
+    frozen=True,
+    alias="bytecode",
+)
+class Bytecode:
+    optimize: int = dataclasses.field(
+        default=0,
+        metadata=metadata(
+            """The optimization level to compile with.
+
+            This is one of `0`, `1` or `2` and corresponds to running Python with no `-O`, with `-O`
+            or with `-OO` respectively. The application must run with the same optimization level
+            to use the compiled bytecode.
+            """
+        ),
+    )
+
+    def __post_init__(self) -> None:
+        if self.optimize not in (0, 1, 2):
+            raise InputError(
+                f"The bytecode optimization level must be one of 0, 1 or 2; given: {self.optimize}"
+            )
+
 
 @documented_dataclass(
     f"""An interpreter distribution.
@@ -433,6 +526,27 @@ class Interpreter(Dataclass):
             """,
         ),
     )
+    slim: Slim | None = dataclasses.field(
+        default=None,
+        metadata=metadata(
+            """Rules for slimming the interpreter distribution before embedding it in the scie.
+
+            Slimming is only supported for distributions that are not `lazy`.
+            """,
+            reference=True,
+        ),
+    )
+    bytecode: Bytecode | None = dataclasses.field(
+        default=None,
+        metadata=metadata(
+            """Options for compiling the interpreter distribution's Python sources to bytecode.
+
+            Bytecode compilation happens after any slimming and is only supported for distributions
+            that are not `lazy`.
+            """,
+            reference=True,
+        ),
+    )
 
 
 @documented_dataclass(
@@ -503,10 +617,10 @@ class InterpreterGroup:
         )
     )
 
-    def _expand_placeholder(
-        self, platform_spec: PlatformSpec, match: Match
+    def expand_placeholder(
+        self, platform_spec: PlatformSpec, placeholder: str | None
     ) -> tuple[str, dict[str, str]]:
-        if placeholder := match.group("placeholder"):
+        if placeholder:
             env = {}
             ph = Identifier(placeholder)
             env_var_prefix = f"_SCIENCE_IG_{self.id}_{placeholder}_"
@@ -526,19 +640,77 @@ class InterpreterGroup:
     ) -> tuple[str, dict[str, str]]:
         env = {}
 
-        def expand_placeholder(match: Match) -> str:
-            expansion, ig_env = self._expand_placeholder(platform_spec, match)
+        def expand_placeholder(placeholder: Placeholder) -> str | None:
+            if placeholder.id != self.id:
+                return None
+            expansion, ig_env = self.expand_placeholder(platform_spec, placeholder.name)
             env.update(ig_env)
             return expansion
 
-        value = re.sub(
-            rf"#{{{re.escape(self.id)}(?::(?P<placeholder>[^{{}}:]+))?}}",
-            expand_placeholder,
-            value,
-        )
+        value = Template.parse(value).render(expand_placeholder)
         return value, env
 
 
+@documented_dataclass(
+    f"""Options for re-compressing embedded tarballs with [zstd](https://facebook.github.io/zstd/).
+
+    Interpreter distributions and other archives are commonly published as
+    `{FileType.TarGzip.value}`, `{FileType.TarBzip2.value}` or `{FileType.TarLzma.value}` tarballs;
+    all of which extract several times slower than `{FileType.TarZstd.value}` tarballs. When
+    configured, these embedded tarballs are transcoded to `{FileType.TarZstd.value}` at build-time,
+    cutting first-run extraction time for the scie.
+
+    Transcoded files are renamed with a `.{FileType.TarZstd.value}` extension, but they retain their
+    original name as their key; so `{{<name>}}` placeholders continue to work.
+
+    ```{{note}}
+    Transcoding uses the `compression.zstd` module on Python 3.14 or greater and else the
+    [`zstandard`](https://pypi.org/project/zstandard/) distribution, which the science binary
+    releases include.
+    ```
+    """,
+    frozen=True,
+    alias="zstd",
+)
+class Zstd:
+    # N.B.: These are the bounds zstd itself places on compression levels.
+    _MIN_LEVEL: ClassVar[int] = -(1 << 17)
+    _MAX_LEVEL: ClassVar[int] = 22
+
+    level: int = dataclasses.field(
+        default=19,
+        metadata=metadata(
+            """The zstd compression level to use.
+
+            Higher levels produce smaller files at the cost of slower compression at build-time
+            only; decompression speed is largely unaffected by the level. Negative levels select
+            zstd's fast modes, which trade compression ratio for speed. Levels range from -131072
+            to 22 and level 0 selects zstd's default level.
+            """
+        ),
+    )
+    threads: int | None = dataclasses.field(
+        default=None,
+        metadata=metadata(
+            """The number of compression worker threads to use.
+
+            Defaults to the number of CPUs. Use `0` to compress on a single thread.
+            """
+        ),
+    )
+
+    def __post_init__(self) -> None:
+        if not self._MIN_LEVEL <= self.level <= self._MAX_LEVEL:
+            raise InputError(
+                f"The zstd compression level must be from {self._MIN_LEVEL} to {self._MAX_LEVEL}; "
+                f"given: {self.level}"
+            )
+        if self.threads is not None and self.threads < 0:
+            raise InputError(
+                f"The number of zstd compression threads cannot be negative; given: {self.threads}"
+            )
+
+
 @documented_dataclass(frozen=True, alias="lift")
 class Application(Dataclass):
     name: str
@@ -559,6 +731,16 @@ class Application(Dataclass):
     bindings: tuple[Command, ...] = ()
     scie_jump: ScieJump | None = None
     ptex: Ptex | None = None
+    zstd: Zstd | None = dataclasses.field(
+        default=None,
+        metadata=metadata(
+            """Options for re-compressing embedded tarballs with zstd.
+
+            If not configured, embedded files are used as-is.
+            """,
+            reference=True,
+        ),
+    )
 
     @staticmethod
     def _ensure_unique_names(
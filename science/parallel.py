@@ -0,0 +1,114 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import functools
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Generic, Hashable, Mapping, ParamSpec, TypeVar
+
+import click
+from click.globals import pop_context, push_context
+
+from science.errors import InputError
+from science.platform import PlatformSpec
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+_K = TypeVar("_K", bound=Hashable)
+
+
+def _call_in_context(
+    ctx: click.Context, func: Callable[_P, _T], *args: _P.args, **kwargs: _P.kwargs
+) -> _T:
+    push_context(ctx)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        pop_context()
+
+
+class Executor(ThreadPoolExecutor):
+    """A thread pool executor that runs submitted work in the submitting thread's click context.
+
+    Science configuration, like the location of the science cache, is looked up via the active click
+    context; so work run in a pool thread must see the same context the work was submitted from.
+    """
+
+    def submit(self, fn: Callable[_P, _T], /, *args: _P.args, **kwargs: _P.kwargs) -> Future[_T]:
+        if ctx := click.get_current_context(silent=True):
+            return super().submit(functools.partial(_call_in_context, ctx, fn), *args, **kwargs)
+        return super().submit(fn, *args, **kwargs)
+
+
+def raise_errors(errors: Mapping[PlatformSpec, Exception], subject: str) -> None:
+    """Raise the errors encountered performing work for several platforms, if any.
+
+    A single error, even if shared by several platforms, is re-raised as-is; otherwise, if all
+    errors are `InputError`s they are combined into one `InputError` and if not, they are raised as
+    an `ExceptionGroup`.
+    """
+    if not errors:
+        return
+    unique_errors = {id(error): error for error in errors.values()}
+    if len(unique_errors) == 1:
+        # N.B.: Work shared by several platforms can fail them all with the same error.
+        raise next(iter(unique_errors.values()))
+
+    message = f"Failed to {subject} for {len(errors)} platforms"
+    if all(isinstance(error, InputError) for error in errors.values()):
+        raise InputError(
+            os.linesep.join(
+                (
+                    f"{message}:",
+                    *(f"{platform_spec}: {error}" for platform_spec, error in errors.items()),
+                )
+            )
+        )
+    raise ExceptionGroup(f"{message}.", list(errors.values()))
+
+
+class Memo(Generic[_K, _T]):
+    """A thread-safe memo that computes the value for any given key at most once.
+
+    Threads requesting a key whose value is being computed wait on that computation and share its
+    result. Failed computations are not memoized; so a later request for the same key will retry.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._futures = dict[_K, Future[_T]]()
+
+    def get(
+        self, key: _K, compute: Callable[[], _T], valid: Callable[[_T], bool] = lambda _: True
+    ) -> _T:
+        """Return the value for the given key, computing it if needed.
+
+        A memoized value for which `valid` returns `False` is discarded and re-computed.
+        """
+        with self._lock:
+            future = self._futures.get(key)
+            if owner := future is None:
+                future = self._futures[key] = Future()
+        assert future is not None
+
+        if not owner:
+            value = future.result()
+            if valid(value):
+                return value
+            with self._lock:
+                if self._futures.get(key) is future:
+                    del self._futures[key]
+            return self.get(key, compute, valid)
+
+        try:
+            value = compute()
+        except BaseException as e:
+            with self._lock:
+                del self._futures[key]
+            future.set_exception(e)
+            raise
+        future.set_result(value)
+        return value
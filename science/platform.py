@@ -3,9 +3,10 @@
 
 from __future__ import annotations
 
+import glob
 import os
 import platform
-import subprocess
+import struct
 import sys
 from enum import Enum
 from functools import cache, cached_property
@@ -149,21 +150,62 @@ class Platform(OsArch, Enum):
 CURRENT_PLATFORM = Platform.current()
 
 
+def _elf_interpreter(path: str) -> str | None:
+    """Return the program interpreter (dynamic loader) of the given ELF executable, if any.
+
+    Static executables and files that are not ELF executables have no program interpreter.
+    """
+    with open(path, "rb") as fp:
+        ident = fp.read(16)
+        if len(ident) < 16 or not ident.startswith(b"\x7fELF"):
+            return None
+
+        is_64bit = ident[4] == 2
+        byte_order = "<" if ident[5] == 1 else ">"
+        if is_64bit:
+            header_format, program_header_format = "Q14xHH", "I4xQ16xQ"
+        else:
+            header_format, program_header_format = "I10xHH", "II8xI"
+
+        # N.B.: The program header table offset follows the 16 byte ident, the 8 bytes of type,
+        # machine and version fields and the entry address. The program header entry size and
+        # count follow the section header table offset, flags and ELF header size fields.
+        fp.seek(32 if is_64bit else 28)
+        header = fp.read(struct.calcsize(byte_order + header_format))
+        program_header_offset, program_header_size, program_header_count = struct.unpack(
+            byte_order + header_format, header
+        )
+        entry_size = struct.calcsize(byte_order + program_header_format)
+        for index in range(program_header_count):
+            fp.seek(program_header_offset + index * program_header_size)
+            program_header = fp.read(entry_size)
+            if len(program_header) < entry_size:
+                return None
+            segment_type, offset, size = struct.unpack(
+                byte_order + program_header_format, program_header
+            )
+            if segment_type == 3:  # PT_INTERP
+                fp.seek(offset)
+                return fp.read(size).rstrip(b"\x00").decode()
+    return None
+
+
 class LibC(Enum):
     @classmethod
     @cache
     def current(cls) -> LibC | None:
         if CURRENT_PLATFORM.os is not Os.Linux or CURRENT_PLATFORM.arch is not Arch.X86_64:
             return None
-        if (
-            "musl"
-            in subprocess.run(
-                args=["ldd", sys.executable],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-            ).stdout
-        ):
+        try:
+            interpreter = _elf_interpreter(sys.executable)
+        except (OSError, struct.error, UnicodeDecodeError):
+            interpreter = None
+        if interpreter:
+            return LibC.MUSL if "musl" in interpreter else LibC.GLIBC
+
+        # N.B.: A statically linked interpreter does not tell us which libc the system uses; so we
+        # fall back to looking for the musl dynamic loader.
+        if glob.glob("/lib/ld-musl-*") and not glob.glob("/lib*/ld-linux-*"):
             return LibC.MUSL
         return LibC.GLIBC
 
@@ -2,36 +2,61 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
 import dataclasses
-import importlib.metadata
+import hashlib
 import inspect
+import json
 import logging
 import os
 import sys
+import threading
 from dataclasses import dataclass
-from functools import cached_property
+from functools import cache, cached_property
+from importlib.metadata import EntryPoint, entry_points
 from typing import Generic, Iterator, TypeVar
 
+from science.cache import science_cache
 from science.dataclass import Dataclass
 from science.dataclass.reflect import FieldInfo, dataclass_info
 from science.errors import InputError
 from science.model import Provider
-from science.providers.pypy import PyPy
-from science.providers.python_build_standalone import PythonBuildStandalone
 
-_BUILTIN_PROVIDER_TYPES: tuple[type[Provider], ...] = (PythonBuildStandalone, PyPy)
+_PROVIDERS_GROUP = "science.providers_by_short_name"
+
+# N.B.: Provider modules can be expensive to import; so we only refer to them by entry point here
+# and import a provider's module only when its type is needed.
+_BUILTIN_PROVIDERS = (
+    EntryPoint(
+        name="PythonBuildStandalone",
+        group=_PROVIDERS_GROUP,
+        value="science.providers.python_build_standalone:PythonBuildStandalone",
+    ),
+    EntryPoint(name="PyPy", group=_PROVIDERS_GROUP, value="science.providers.pypy:PyPy"),
+)
 
 ConfigDataclass = TypeVar("ConfigDataclass", bound=Dataclass)
 
 
 @dataclass(frozen=True)
 class ProviderInfo(Generic[ConfigDataclass]):
-    type: type[Provider[ConfigDataclass]]
+    entry_point: EntryPoint
     source: str
     short_name: str | None = None
 
+    @cached_property
+    def type(self) -> type[Provider[ConfigDataclass]]:
+        provider_type = self.entry_point.load()
+        if not isinstance(provider_type, type) or not issubclass(provider_type, Provider):
+            raise InputError(
+                f"All science.providers entrypoints must conform to the {Provider.__qualname__} "
+                f"protocol. Found `{self.entry_point.name!r} = {self.entry_point.value!r}` in "
+                f"{self.source} which does not."
+            )
+        return provider_type
+
     @cached_property
     def fully_qualified_name(self) -> str:
-        return f"{self.type.__module__}.{self.type.__qualname__}"
+        module, _, attribute = self.entry_point.value.partition(":")
+        return f"{module}.{attribute}" if attribute else module
 
     @cached_property
     def name(self) -> str:
@@ -55,12 +80,67 @@ class ProviderInfo(Generic[ConfigDataclass]):
 
 
 def iter_builtin_providers() -> Iterator[ProviderInfo]:
-    for builtin_provider_type in _BUILTIN_PROVIDER_TYPES:
-        yield ProviderInfo(
-            type=builtin_provider_type,
-            source="builtin",
-            short_name=builtin_provider_type.__qualname__,
-        )
+    for entry_point in _BUILTIN_PROVIDERS:
+        yield ProviderInfo(entry_point=entry_point, source="builtin", short_name=entry_point.name)
+
+
+def _entry_points_cache_key() -> str:
+    # N.B.: Installing, removing or upgrading a distribution adds or removes its metadata directory
+    # in a `sys.path` entry, which changes that entry's modification time.
+    path_entries = list[tuple[str, int | None]]()
+    for entry in sys.path:
+        try:
+            path_entries.append((entry, os.stat(entry or ".").st_mtime_ns))
+        except OSError:
+            path_entries.append((entry, None))
+    return hashlib.sha256(json.dumps(path_entries).encode()).hexdigest()
+
+
+def _iter_plugin_entry_points() -> Iterator[tuple[EntryPoint, str]]:
+    """Yield each plugin provider entry point along with its source.
+
+    Scanning distribution metadata for entry points can be slow in large environments; so the
+    results are persisted, keyed by the state of the `sys.path` entries scanned.
+    """
+    cache_file = science_cache() / "providers" / f"{_entry_points_cache_key()}.json"
+    try:
+        data = json.loads(cache_file.read_text())
+        plugins = [
+            (
+                EntryPoint(name=item["name"], group=_PROVIDERS_GROUP, value=item["value"]),
+                item["source"],
+            )
+            for item in data
+        ]
+    except (OSError, ValueError, KeyError, TypeError):
+        plugins = [
+            (
+                entry_point,
+                (
+                    f"{entry_point.dist.name} {entry_point.dist.version}"
+                    if entry_point.dist
+                    else "unknown plugin"
+                ),
+            )
+            for entry_point in entry_points().select(group=_PROVIDERS_GROUP)
+        ]
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            work_file = cache_file.with_name(
+                f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}"
+            )
+            work_file.write_text(
+                json.dumps(
+                    [
+                        {"name": entry_point.name, "value": entry_point.value, "source": source}
+                        for entry_point, source in plugins
+                    ]
+                )
+            )
+            work_file.replace(cache_file)
+        except OSError as e:
+            logging.debug(f"Failed to cache provider entry points to {cache_file}: {e}")
+    yield from plugins
 
 
 def _iter_providers() -> Iterator[ProviderInfo]:
@@ -74,29 +154,14 @@ def _iter_providers() -> Iterator[ProviderInfo]:
     for provider_info in iter_builtin_providers():
         yield track_short_name(provider_info)
 
-    for entry_point in importlib.metadata.entry_points().select(
-        group="science.providers_by_short_name"
-    ):
-        provider_type = entry_point.load()
-        source = (
-            f"{entry_point.dist.name} {entry_point.dist.version}"
-            if entry_point.dist
-            else "unknown plugin"
-        )
-        if not issubclass(provider_type, Provider):
-            raise InputError(
-                f"All science.providers entrypoints must conform to the {Provider.__qualname__} "
-                f"protocol. Found `{entry_point.name!r} = {provider_type.__qualname__!r}` in "
-                f"{source} which does not."
-            )
-
-        provider_info = ProviderInfo(type=provider_type, source=source)
+    for entry_point, source in _iter_plugin_entry_points():
+        provider_info = ProviderInfo(entry_point=entry_point, source=source)
         if existing_entry := providers_by_short_name.get(entry_point.name):
             logging.warning(
-                f"The Provider {provider_type.__qualname__} found in {source} has a short name of"
-                f"{entry_point.name!r} that conflicts with Provider "
-                f"{existing_entry.type.__qualname__} provided by {existing_entry.source}. Not "
-                f"registering {provider_type.__qualname__} under a that short name"
+                f"The Provider {provider_info.fully_qualified_name} found in {source} has a short "
+                f"name of {entry_point.name!r} that conflicts with Provider "
+                f"{existing_entry.fully_qualified_name} provided by {existing_entry.source}. Not "
+                f"registering {provider_info.fully_qualified_name} under a that short name"
             )
         else:
             provider_info = dataclasses.replace(provider_info, short_name=entry_point.name)
@@ -104,27 +169,67 @@ def _iter_providers() -> Iterator[ProviderInfo]:
         yield track_short_name(provider_info)
 
 
-ALL_PROVIDERS = tuple[ProviderInfo, ...](
-    sorted(
-        _iter_providers(),
-        key=lambda provider_info: (
-            provider_info.short_name or chr(sys.maxunicode),
-            provider_info.fully_qualified_name,
-        ),
+@dataclass(frozen=True)
+class _Registry:
+    providers: tuple[ProviderInfo, ...]
+
+    @cached_property
+    def by_name(self) -> dict[str, ProviderInfo]:
+        by_name = dict[str, ProviderInfo]()
+        for provider_info in self.providers:
+            by_name.setdefault(provider_info.fully_qualified_name, provider_info)
+            if provider_info.short_name:
+                by_name.setdefault(provider_info.short_name, provider_info)
+        return by_name
+
+
+@cache
+def _registry() -> _Registry:
+    return _Registry(
+        providers=tuple(
+            sorted(
+                _iter_providers(),
+                key=lambda provider_info: (
+                    provider_info.short_name or chr(sys.maxunicode),
+                    provider_info.fully_qualified_name,
+                ),
+            )
+        )
     )
-)
+
+
+def all_providers() -> tuple[ProviderInfo, ...]:
+    """Return all registered providers.
+
+    Providers are discovered on first use and provider modules are only imported when a provider's
+    type is needed.
+    """
+    return _registry().providers
 
 
 def get_provider(name: str) -> ProviderInfo | None:
-    for provider_info in ALL_PROVIDERS:
-        if name in (provider_info.short_name, provider_info.fully_qualified_name):
+    if provider_info := _registry().by_name.get(name):
+        return provider_info
+
+    # N.B.: Providers are indexed by the fully qualified name in their entry point, which can refer
+    # to a provider type re-exported from another module; so we fall back to loading all provider
+    # types to find one by the fully qualified name of the type itself.
+    for provider_info in all_providers():
+        provider_type = provider_info.type
+        if name == f"{provider_type.__module__}.{provider_type.__qualname__}":
             return provider_info
     return None
 
 
 def name(provider: Provider) -> str:
     provider_type = type(provider)
-    for provider_info in ALL_PROVIDERS:
+    provider_info = get_provider(f"{provider_type.__module__}.{provider_type.__qualname__}")
+    if provider_info and provider_type is provider_info.type:
+        return provider_info.name
+
+    # N.B.: An entry point can refer to a provider type by an alias; so we fall back to loading all
+    # provider types to find it.
+    for provider_info in all_providers():
         if provider_type is provider_info.type:
             return provider_info.name
     raise AssertionError(f"Provider of type {provider_type} is not registered!")
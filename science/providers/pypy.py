@@ -10,7 +10,7 @@ import urllib.parse
 from dataclasses import dataclass
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, Iterable, Iterator
+from typing import Any, Collection, Iterable, Iterator, Mapping
 
 from bs4 import BeautifulSoup
 from packaging.version import Version
@@ -30,6 +30,7 @@ from science.model import (
     Provider,
     Url,
 )
+from science.parallel import Executor
 from science.platform import LibC, Platform, PlatformSpec
 
 
@@ -86,13 +87,23 @@ class Distributions:
     release: str | None
     assets: tuple[FingerprintedAsset, ...]
 
-    def serialize(self, base_dir: Path) -> None:
+    def serialize(self, base_dir: Path, urls: Collection[Url] | None = None) -> None:
         base_dir.mkdir(parents=True, exist_ok=True)
-        with (base_dir / f"distributions-{self.version}-{self.release or 'any'}.json").open(
-            "w"
-        ) as fp:
+        manifest = base_dir / f"distributions-{self.version}-{self.release or 'any'}.json"
+
+        assets = [asset.as_dict() for asset in self.assets if urls is None or asset.url in urls]
+        if urls is not None and manifest.exists():
+            with manifest.open() as fp:
+                existing = json.load(fp)
+            # N.B.: Existing assets keep their place, updated in place when re-downloaded, and new
+            # assets are added after them.
+            updated = {asset["name"]: asset for asset in assets}
+            assets = [updated.pop(asset["name"], asset) for asset in existing["assets"]]
+            assets.extend(updated.values())
+
+        with manifest.open("w") as fp:
             json.dump(
-                {"base_url": self.base_url, "assets": [asset.as_dict() for asset in self.assets]},
+                {"base_url": self.base_url, "assets": assets},
                 fp,
                 sort_keys=True,
                 indent=2,
@@ -307,7 +318,7 @@ class PyPy(Provider[Config]):
     def distributions(self) -> DistributionsManifest:
         return self._distributions
 
-    def distribution(self, platform_spec: PlatformSpec) -> Distribution | None:
+    def _select_asset(self, platform_spec: PlatformSpec) -> FingerprintedAsset | None:
         selected_asset: FingerprintedAsset | None = None
         asset_rank: int | None = None
         for asset in self._distributions.assets:
@@ -316,18 +327,23 @@ class PyPy(Provider[Config]):
             ) is not None and (asset_rank is None or rank < asset_rank):
                 asset_rank = rank
                 selected_asset = asset
-        if selected_asset is None:
-            return None
+        return selected_asset
 
-        with download_cache().get_or_create(url=Url(f"{selected_asset.url}.size")) as cache_result:
+    @staticmethod
+    def _size(asset: FingerprintedAsset) -> int:
+        with download_cache().get_or_create(url=Url(f"{asset.url}.size")) as cache_result:
             if isinstance(cache_result, Missing):
-                with configured_client(selected_asset.url) as client:
-                    response = client.head(selected_asset.url)
+                with configured_client(asset.url) as client:
+                    response = client.head(asset.url)
                 size = int(response.headers["Content-Length"].strip())
                 cache_result.work_path.write_text(str(size))
             else:
                 size = int(cache_result.path.read_text())
+        return size
 
+    def _distribution(
+        self, platform_spec: PlatformSpec, selected_asset: FingerprintedAsset, size: int
+    ) -> Distribution:
         file = File(
             name=selected_asset.name,
             key=self.id,
@@ -365,3 +381,29 @@ class PyPy(Provider[Config]):
             placeholders[Identifier("python")] = pypy_binary
 
         return Distribution(id=self.id, file=file, placeholders=FrozenDict(placeholders))
+
+    def distribution(self, platform_spec: PlatformSpec) -> Distribution | None:
+        if selected_asset := self._select_asset(platform_spec):
+            return self._distribution(platform_spec, selected_asset, self._size(selected_asset))
+        return None
+
+    def distributions_for(
+        self, platform_specs: Iterable[PlatformSpec]
+    ) -> Mapping[PlatformSpec, Distribution | None]:
+        selected_assets = {
+            platform_spec: self._select_asset(platform_spec) for platform_spec in platform_specs
+        }
+
+        # N.B.: PyPy does not publish sizes; so each selected asset costs a HEAD request on a cold
+        # cache. We issue these concurrently and just once per asset since several platforms can
+        # share an asset (e.g.: Windows aarch64 and x86_64 both use win64).
+        unique_assets = list(dict.fromkeys(asset for asset in selected_assets.values() if asset))
+        with Executor() as executor:
+            sizes = dict(zip(unique_assets, executor.map(self._size, unique_assets)))
+
+        return {
+            platform_spec: (
+                self._distribution(platform_spec, asset, sizes[asset]) if asset else None
+            )
+            for platform_spec, asset in selected_assets.items()
+        }
@@ -10,7 +10,7 @@ import urllib.parse
 from dataclasses import dataclass
 from datetime import timedelta
 from pathlib import Path, PurePath
-from typing import Any
+from typing import Any, Collection
 
 from packaging.version import Version
 
@@ -93,18 +93,32 @@ class Distributions:
     flavor: str
     assets: tuple[FingerprintedAsset, ...]
 
-    def serialize(self, base_dir: Path) -> None:
+    def serialize(self, base_dir: Path, urls: Collection[Url] | None = None) -> None:
         if self.latest:
             dest_dir = base_dir / "latest" / "download"
         else:
             dest_dir = base_dir / "download" / self.release
         dest_dir.mkdir(parents=True, exist_ok=True)
-        with (dest_dir / f"distributions-{self.version}-{self.flavor}.json").open("w") as fp:
+        manifest = dest_dir / f"distributions-{self.version}-{self.flavor}.json"
+
+        assets = [asset.as_dict() for asset in self.assets if urls is None or asset.url in urls]
+        if urls is not None and manifest.exists():
+            with manifest.open() as fp:
+                existing = json.load(fp)
+            # N.B.: The latest manifest is replaced wholesale when a new release comes out.
+            if existing["release"] == self.release:
+                # N.B.: Existing assets keep their place, updated in place when re-downloaded, and
+                # new assets are added after them.
+                updated = {asset["name"]: asset for asset in assets}
+                assets = [updated.pop(asset["name"], asset) for asset in existing["assets"]]
+                assets.extend(updated.values())
+
+        with manifest.open("w") as fp:
             json.dump(
                 {
                     "base_url": self.base_url,
                     "release": self.release,
-                    "assets": [asset.as_dict() for asset in self.assets],
+                    "assets": assets,
                 },
                 fp,
                 sort_keys=True,
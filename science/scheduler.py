@@ -0,0 +1,163 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import CancelledError, Future, wait
+from typing import Any, Callable, Generic, Iterable, TypeVar
+
+from science.parallel import Executor
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class Task(Generic[_T]):
+    """A unit of work in a build task graph."""
+
+    def __init__(
+        self, name: str, func: Callable[[], _T], dependencies: tuple[Task[Any], ...]
+    ) -> None:
+        self.name = name
+        self.dependencies = dependencies
+        self._func = func
+        self._future = Future[_T]()
+        self.started: float | None = None
+        self.finished: float | None = None
+
+    @property
+    def duration(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+    def result(self) -> _T:
+        """Return the result of this task, raising its error or the error of a failed dependency."""
+        return self._future.result()
+
+    def _execute(self) -> None:
+        if not self._future.set_running_or_notify_cancel():
+            return
+        self.started = time.perf_counter()
+        try:
+            result = self._func()
+        except BaseException as e:
+            self.finished = time.perf_counter()
+            self._future.set_exception(e)
+        else:
+            self.finished = time.perf_counter()
+            self._future.set_result(result)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r})"
+
+
+class Scheduler:
+    """Runs a graph of tasks, starting each as soon as all of its dependencies have succeeded.
+
+    At most `jobs` tasks run at once. If a task fails, the tasks depending on it are not run and
+    instead fail with the same error.
+    """
+
+    def __init__(self, jobs: int | None = None) -> None:
+        self._jobs = jobs
+        self._tasks = list[Task[Any]]()
+        self._epoch: float | None = None
+
+    def add(
+        self, name: str, func: Callable[[], _T], dependencies: Iterable[Task[Any]] = ()
+    ) -> Task[_T]:
+        task = Task(name, func, tuple(dependencies))
+        self._tasks.append(task)
+        return task
+
+    def run(self) -> None:
+        """Run all tasks added so far, returning once they have all completed."""
+        lock = threading.Lock()
+        dependents = {id(task): list[Task[Any]]() for task in self._tasks}
+        remaining = {id(task): len(task.dependencies) for task in self._tasks}
+        for task in self._tasks:
+            for dependency in task.dependencies:
+                dependents[id(dependency)].append(task)
+
+        executor = Executor(max_workers=self._jobs)
+
+        def schedule(task: Task[Any]) -> None:
+            try:
+                executor.submit(task._execute)
+            except RuntimeError:
+                # The executor was shut down out from under us; e.g.: on Ctrl-C.
+                task._future.cancel()
+
+        def on_done(future: Future[Any], task: Task[Any]) -> None:
+            error = CancelledError() if future.cancelled() else future.exception()
+            for dependent in dependents[id(task)]:
+                with lock:
+                    if dependent._future.running() or dependent._future.done():
+                        # This dependent already failed due to another of its dependencies.
+                        continue
+                    if error is not None:
+                        fail = dependent._future.set_running_or_notify_cancel()
+                        ready = False
+                    else:
+                        fail = False
+                        remaining[id(dependent)] -= 1
+                        ready = 0 == remaining[id(dependent)]
+                if fail:
+                    dependent._future.set_exception(error)
+                elif ready:
+                    schedule(dependent)
+
+        for task in self._tasks:
+            task._future.add_done_callback(functools.partial(on_done, task=task))
+
+        self._epoch = time.perf_counter()
+        try:
+            for task in self._tasks:
+                if not task.dependencies:
+                    schedule(task)
+            wait([task._future for task in self._tasks])
+        finally:
+            executor.shutdown(cancel_futures=True)
+        if self._tasks:
+            logger.info(self.critical_path_report())
+
+    def critical_path(self) -> tuple[Task[Any], ...]:
+        """Return the chain of tasks that determined the overall run time, in execution order."""
+        finished = [task for task in self._tasks if task.finished is not None]
+        if not finished:
+            return ()
+
+        path = list[Task[Any]]()
+        task: Task[Any] | None = max(finished, key=lambda t: t.finished or 0.0)
+        while task:
+            path.append(task)
+            # N.B.: A task could start only once its last dependency finished; so that dependency
+            # is the one that gated it.
+            task = max(
+                (dep for dep in task.dependencies if dep.finished is not None),
+                key=lambda t: t.finished or 0.0,
+                default=None,
+            )
+        return tuple(reversed(path))
+
+    def critical_path_report(self) -> str:
+        critical_path = self.critical_path()
+        epoch = self._epoch or 0.0
+        total = max(((task.finished or epoch) - epoch for task in critical_path), default=0.0)
+        return os.linesep.join(
+            (
+                f"Critical path ({total:.2f}s total):",
+                *(
+                    f"  {task.name}: {task.duration:.2f}s "
+                    f"(started at {(task.started or epoch) - epoch:.2f}s)"
+                    for task in critical_path
+                ),
+            )
+        )
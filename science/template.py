@@ -0,0 +1,68 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import functools
+import re
+from dataclasses import dataclass
+from typing import Callable
+
+_PLACEHOLDER_RE = re.compile(r"#\{(?P<id>[^{}:]+)(?::(?P<placeholder>[^{}:]+))?\}")
+
+
+@dataclass(frozen=True)
+class Placeholder:
+    """A `#{<id>}` or `#{<id>:<name>}` placeholder."""
+
+    text: str
+    id: str
+    name: str | None = None
+
+
+@dataclass(frozen=True)
+class Template:
+    """A string parsed into its literal text and placeholder tokens.
+
+    Parse once with `Template.parse` and then render as many times as needed; e.g.: once per target
+    platform.
+    """
+
+    @classmethod
+    def parse(cls, text: str) -> Template:
+        return _parse(text)
+
+    tokens: tuple[str | Placeholder, ...]
+
+    def render(self, resolve: Callable[[Placeholder], str | None]) -> str:
+        """Render this template in a single pass.
+
+        Placeholders for which `resolve` returns `None` are rendered verbatim.
+        """
+        if len(self.tokens) == 1 and isinstance(literal := self.tokens[0], str):
+            return literal
+        return "".join(
+            token if isinstance(token, str) else _resolve_or_verbatim(resolve, token)
+            for token in self.tokens
+        )
+
+
+def _resolve_or_verbatim(resolve: Callable[[Placeholder], str | None], token: Placeholder) -> str:
+    resolved = resolve(token)
+    return token.text if resolved is None else resolved
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse(text: str) -> Template:
+    tokens = list[str | Placeholder]()
+    position = 0
+    for match in _PLACEHOLDER_RE.finditer(text):
+        if match.start() > position:
+            tokens.append(text[position : match.start()])
+        tokens.append(
+            Placeholder(text=match.group(0), id=match.group("id"), name=match.group("placeholder"))
+        )
+        position = match.end()
+    if position < len(text) or not tokens:
+        tokens.append(text[position:])
+    return Template(tokens=tuple(tokens))
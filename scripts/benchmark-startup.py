@@ -0,0 +1,298 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from pathlib import Path
+from textwrap import dedent
+from typing import Any
+
+import coloredlogs
+
+logger = logging.getLogger(__name__)
+
+_IMPORT_TIME_RE = re.compile(r"^import time:\s+\d+ \|\s+(?P<cumulative_us>\d+) \|(?P<module>.+)$")
+
+# N.B.: Importing the science CLI used to take ~280ms since it eagerly imported every sub-command
+# along with their heavy dependencies. With sub-commands loaded lazily it takes ~30ms on a typical
+# development machine; so this budget leaves ample head room for slow CI machines while still
+# catching a regression to eager imports.
+_CLI_IMPORT_TIME_BUDGET_MS = 150.0
+_CLI_IMPORT_TIME_BUDGET_SCENARIOS = ("version", "help")
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    args: tuple[str, ...]
+
+
+def create_lift_export_scenario(work_dir: Path) -> Scenario:
+    # N.B.: The lift manifest sources its file from a local `file://` mirror; so the export
+    # exercises fetching without touching the network.
+    mirror = work_dir / "mirror"
+    mirror.mkdir()
+    data = mirror / "data.txt"
+    data.write_text("Science startup benchmark data.\n")
+    size = data.stat().st_size
+    fingerprint = hashlib.sha256(data.read_bytes()).hexdigest()
+
+    lift_toml = work_dir / "lift.toml"
+    lift_toml.write_text(
+        dedent(
+            f"""\
+            [lift]
+            name = "benchmark"
+            platforms = ["linux-aarch64", "linux-x86_64", "macos-aarch64", "windows-x86_64"]
+
+            [[lift.files]]
+            name = "data.txt"
+            digest = {{ size = {size}, fingerprint = "{fingerprint}" }}
+            source = {{ url = "{data.as_uri()}", lazy = false }}
+
+            [[lift.commands]]
+            exe = "/bin/cat"
+            args = ["{{data.txt}}"]
+            """
+        )
+    )
+    # N.B.: The lift export re-uses an up-to-date export in its destination directory; so we
+    # always export to a fresh one by passing a placeholder the runner fills in.
+    return Scenario(
+        name="lift-export", args=("lift", "export", "--dest-dir", "{dest_dir}", str(lift_toml))
+    )
+
+
+@dataclass(frozen=True)
+class Runner:
+    command: tuple[str, ...]
+    work_dir: Path
+    cold: bool
+
+    def run(self, scenario: Scenario, *python_args: str) -> subprocess.CompletedProcess[str]:
+        run_dir = Path(tempfile.mkdtemp(dir=self.work_dir, prefix=f"{scenario.name}."))
+        cache_dir = run_dir / "cache" if self.cold else self.work_dir / "cache"
+        env = {**os.environ, "SCIENCE_CACHE_DIR": str(cache_dir)}
+        if self.cold:
+            # N.B.: Shiv zipapps extract themselves to `SHIV_ROOT` on first run.
+            env.update(SHIV_ROOT=str(run_dir / "shiv"))
+        python, *rest = self.command
+        args = [
+            python,
+            *python_args,
+            *rest,
+            *(arg.format(dest_dir=run_dir / "dest") for arg in scenario.args),
+        ]
+        return subprocess.run(
+            args=args,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True,
+        )
+
+    def wall_clock_ms(self, scenario: Scenario) -> float:
+        start = time.perf_counter()
+        self.run(scenario)
+        return (time.perf_counter() - start) * 1000
+
+    def import_times_ms(self, scenario: Scenario) -> dict[str, float]:
+        result = self.run(scenario, "-X", "importtime")
+        return {
+            match.group("module").strip(): int(match.group("cumulative_us")) / 1000
+            for line in result.stderr.splitlines()
+            if (match := _IMPORT_TIME_RE.match(line))
+        }
+
+
+def benchmark(runner: Runner, scenarios: list[Scenario], runs: int) -> dict[str, Any]:
+    results = dict[str, Any]()
+    for scenario in scenarios:
+        # N.B.: A warm-up run byte-compiles modules and fills caches so that, unless benchmarking
+        # cold starts, each measured run sees the same conditions.
+        if not runner.cold:
+            runner.run(scenario)
+        wall_clock_ms = [runner.wall_clock_ms(scenario) for _ in range(runs)]
+
+        import_times_ms = dict[str, float]()
+        for _ in range(runs):
+            for module, import_time_ms in runner.import_times_ms(scenario).items():
+                import_times_ms[module] = min(
+                    import_time_ms, import_times_ms.get(module, import_time_ms)
+                )
+
+        results[scenario.name] = {
+            "wall_clock_ms": statistics.median(wall_clock_ms),
+            "import_times_ms": dict(sorted(import_times_ms.items())),
+        }
+        logger.info(
+            f"{scenario.name}: {statistics.median(wall_clock_ms):.1f}ms median wall clock over "
+            f"{runs} runs (min {min(wall_clock_ms):.1f}ms, max {max(wall_clock_ms):.1f}ms)."
+        )
+        slowest = sorted(import_times_ms.items(), key=lambda item: item[1], reverse=True)[:5]
+        for module, import_time_ms in slowest:
+            logger.info(f"  {module}: {import_time_ms:.1f}ms cumulative import time")
+    return results
+
+
+def find_regressions(
+    baseline: dict[str, Any],
+    results: dict[str, Any],
+    threshold: float,
+    min_regression_ms: float,
+) -> list[str]:
+    regressions = list[str]()
+    for scenario, result in results.items():
+        if not (baseline_result := baseline.get(scenario)):
+            continue
+        baseline_import_times = baseline_result["import_times_ms"]
+        for module, import_time_ms in result["import_times_ms"].items():
+            baseline_import_time_ms = baseline_import_times.get(module, 0.0)
+            regression_ms = import_time_ms - baseline_import_time_ms
+            if regression_ms > min_regression_ms and import_time_ms > baseline_import_time_ms * (
+                1 + threshold
+            ):
+                regressions.append(
+                    f"{scenario}: {module} took {import_time_ms:.1f}ms to import vs a baseline of "
+                    f"{baseline_import_time_ms:.1f}ms."
+                )
+    return regressions
+
+
+def find_budget_overruns(results: dict[str, Any], budget_ms: float) -> list[str]:
+    overruns = list[str]()
+    for scenario in _CLI_IMPORT_TIME_BUDGET_SCENARIOS:
+        if not (result := results.get(scenario)):
+            continue
+        import_time_ms = result["import_times_ms"].get("science.exe", 0.0)
+        if import_time_ms > budget_ms:
+            overruns.append(
+                f"{scenario}: Importing the science CLI took {import_time_ms:.1f}ms which exceeds "
+                f"the budget of {budget_ms:.1f}ms."
+            )
+    return overruns
+
+
+def main() -> Any:
+    coloredlogs.install(
+        fmt="%(levelname)s %(message)s",
+        field_styles={
+            **coloredlogs.DEFAULT_FIELD_STYLES,
+            # Default is bold black, we switch to gray; c.f:
+            # https://coloredlogs.readthedocs.io/en/latest/api.html#available-text-styles-and-colors
+            "levelname": {"bold": True, "color": 8},
+        },
+    )
+
+    parser = ArgumentParser(
+        description=(
+            "Benchmark science startup: per-module import times and wall clock for representative "
+            "commands."
+        )
+    )
+    parser.add_argument(
+        "--pyz",
+        type=Path,
+        help=(
+            "Benchmark the science zipapp at this path (as built by `scripts/create-zipapp.py`) "
+            "instead of the science sources in this checkout."
+        ),
+    )
+    parser.add_argument(
+        "--cold",
+        action="store_true",
+        help=(
+            "Benchmark cold starts: each run uses an empty science cache and, for a zipapp, an "
+            "empty shiv extraction root."
+        ),
+    )
+    parser.add_argument("--runs", type=int, default=5, help="The number of runs per command.")
+    parser.add_argument(
+        "--baseline", type=Path, help="A baseline results file to check these results against."
+    )
+    parser.add_argument(
+        "--save-baseline", type=Path, help="Save the results to this file for use as a baseline."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.5,
+        help="The fraction by which a module's cumulative import time may exceed its baseline.",
+    )
+    parser.add_argument(
+        "--min-regression-ms",
+        type=float,
+        default=10.0,
+        help="Ignore import time regressions smaller than this to filter out noise.",
+    )
+    parser.add_argument(
+        "--import-time-budget-ms",
+        type=float,
+        default=_CLI_IMPORT_TIME_BUDGET_MS,
+        help=(
+            "When checking against a baseline, also fail if importing the science CLI for "
+            "`--version` or `--help` takes longer than this."
+        ),
+    )
+    options = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="science-benchmark-startup."))
+    atexit.register(shutil.rmtree, work_dir, ignore_errors=True)
+
+    command = (
+        (sys.executable, str(options.pyz.resolve()))
+        if options.pyz
+        else (sys.executable, "-m", "science")
+    )
+    runner = Runner(command=command, work_dir=work_dir, cold=options.cold)
+    scenarios = [
+        Scenario(name="version", args=("--version",)),
+        Scenario(name="help", args=("--help",)),
+        Scenario(name="provider-list", args=("provider", "list")),
+        create_lift_export_scenario(work_dir),
+    ]
+    try:
+        results = benchmark(runner, scenarios, runs=options.runs)
+    except subprocess.CalledProcessError as e:
+        return f"Failed to run {e.cmd}:\n{e.stderr}"
+
+    if options.save_baseline:
+        options.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        options.save_baseline.write_text(json.dumps(results, indent=2, sort_keys=True))
+        logger.info(f"Saved baseline to {options.save_baseline}.")
+
+    if options.baseline:
+        baseline = json.loads(options.baseline.read_text())
+        regressions = find_regressions(
+            baseline,
+            results,
+            threshold=options.threshold,
+            min_regression_ms=options.min_regression_ms,
+        )
+        regressions.extend(find_budget_overruns(results, budget_ms=options.import_time_budget_ms))
+        if regressions:
+            return os.linesep.join(
+                (
+                    f"Found {len(regressions)} import time regressions vs {options.baseline}:",
+                    *regressions,
+                )
+            )
+        logger.info(f"No import time regressions vs {options.baseline}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,7 +11,8 @@ from packaging.version import InvalidVersion, Version
 
 from science.config import parse_config_file
 from science.errors import InputError
-from science.providers import PyPy, PythonBuildStandalone
+from science.providers.pypy import PyPy
+from science.providers.python_build_standalone import PythonBuildStandalone
 
 
 def main() -> Any:
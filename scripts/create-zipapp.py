@@ -4,12 +4,30 @@
 import atexit
 import os
 import shutil
+import stat
 import subprocess
 import sys
 import tempfile
+import zipfile
 from pathlib import Path
 
 
+def add_bytecode(pyz: Path, site_packages_dir: Path) -> None:
+    # N.B.: Shiv skips `.pyc` files when building a zipapp; so we add them after the fact alongside
+    # the sources shiv extracts from the zipapp's `site-packages/` directory on first run.
+    with zipfile.ZipFile(pyz, "a", compression=zipfile.ZIP_DEFLATED) as zf:
+        for pyc in sorted(site_packages_dir.rglob("*.pyc")):
+            zip_info = zipfile.ZipInfo(
+                filename=f"site-packages/{pyc.relative_to(site_packages_dir).as_posix()}",
+                # N.B.: This matches the timestamp `shiv --reproducible` uses for all its entries.
+                date_time=(1980, 1, 1, 0, 0, 0),
+            )
+            zip_info.compress_type = zipfile.ZIP_DEFLATED
+            # N.B.: Shiv restores the permissions recorded in the zip when extracting.
+            zip_info.external_attr = (stat.S_IFREG | 0o644) << 16
+            zf.writestr(zip_info, pyc.read_bytes())
+
+
 def main() -> int:
     work_dir = Path(tempfile.mkdtemp(prefix="science-zipapp-build."))
     atexit.register(shutil.rmtree, work_dir, ignore_errors=True)
@@ -56,23 +74,69 @@ def main() -> int:
     # and know it matches the project Requires-Python.
     python = f"python{sys.version_info[0]}.{sys.version_info[1]}"
 
+    # Generate the index science serves shell completions from so that each TAB press does not
+    # need to import the full CLI.
+    if 0 != (
+        exit_code := subprocess.call(
+            args=[
+                sys.executable,
+                "-c",
+                "from science.cli.completion import write_index; write_index()",
+            ],
+            # N.B.: Running from the site-packages directory puts it first on the `sys.path`; so we
+            # generate the index into the science we are shipping and not any development install.
+            cwd=site_packages_dir,
+        )
+    ):
+        return exit_code
+
+    # Pre-compile all modules so that the first run of science does not pay to compile every module
+    # it imports. Since this is the same major/minor as the science scie interpreter, the bytecode
+    # is valid there. We use unchecked hash-based pycs since shiv does not preserve source file
+    # modification times when it extracts the zipapp and the extracted sources are never modified.
+    if 0 != (
+        exit_code := subprocess.call(
+            args=[
+                sys.executable,
+                "-m",
+                "compileall",
+                "-q",
+                "-j",
+                "0",
+                "--invalidation-mode",
+                "unchecked-hash",
+                # N.B.: This keeps the build directory out of the bytecode for reproducibility.
+                "-s",
+                site_packages_dir,
+                site_packages_dir,
+            ]
+        )
+    ):
+        return exit_code
+
     dest = Path("dist") / "science.pyz"
     dest.parent.mkdir(exist_ok=True)
     dest.unlink(missing_ok=True)
-    return subprocess.call(
-        args=[
-            "shiv",
-            "-p",
-            f"/usr/bin/env {python}",
-            "-c",
-            "science",
-            "--site-packages",
-            site_packages_dir,
-            "--reproducible",
-            "-o",
-            dest,
-        ],
-    )
+    if 0 != (
+        exit_code := subprocess.call(
+            args=[
+                "shiv",
+                "-p",
+                f"/usr/bin/env {python}",
+                "-c",
+                "science",
+                "--site-packages",
+                site_packages_dir,
+                "--reproducible",
+                "-o",
+                dest,
+            ],
+        )
+    ):
+        return exit_code
+
+    add_bytecode(dest, site_packages_dir)
+    return 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,162 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import dataclasses
+import gzip
+import io
+import struct
+import sys
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from science import archive
+from science.hashing import Digest
+from science.model import Bytecode, File, FileType, Slim, Zstd
+
+
+def create_tar_gz(path: Path, *names: str) -> File:
+    with tarfile.open(path, mode="w:gz") as tf:
+        for name in names:
+            if name.endswith("/"):
+                tar_info = tarfile.TarInfo(name.rstrip("/"))
+                tar_info.type = tarfile.DIRTYPE
+                tf.addfile(tar_info)
+            else:
+                tar_info = tarfile.TarInfo(name)
+                tar_info.size = len(name)
+                tf.addfile(tar_info, io.BytesIO(name.encode()))
+    return File(name=path.name, digest=Digest.hash(path), type=FileType.TarGzip)
+
+
+def test_slim_tar_gz(tmp_path: Path, cache_dir: Path) -> None:
+    dist = tmp_path / "dist.tar.gz"
+    file = create_tar_gz(
+        dist,
+        "python/",
+        "python/bin/",
+        "python/bin/python3.13",
+        "python/lib/",
+        "python/lib/python3.13/",
+        "python/lib/python3.13/os.py",
+        "python/lib/python3.13/test/",
+        "python/lib/python3.13/test/test_os.py",
+        "python/lib/python3.13/idlelib/",
+        "python/lib/python3.13/idlelib/idle.py",
+    )
+
+    rules = Slim(exclude=("python/lib/python3.*/test", "**/idlelib/**"))
+    slimmed, digest = archive.slim(file, dist, rules)
+    assert slimmed.is_relative_to(cache_dir)
+    assert slimmed.name == dist.name
+    assert Digest.hash(slimmed) == digest
+    with tarfile.open(slimmed) as tf:
+        assert [
+            "python",
+            "python/bin",
+            "python/bin/python3.13",
+            "python/lib",
+            "python/lib/python3.13",
+            "python/lib/python3.13/os.py",
+            "python/lib/python3.13/idlelib",
+        ] == tf.getnames()
+        extracted = tf.extractfile("python/lib/python3.13/os.py")
+        assert extracted is not None
+        assert b"python/lib/python3.13/os.py" == extracted.read()
+
+    dist.unlink()
+    assert (slimmed, digest) == archive.slim(file, dist, rules), (
+        "Expected the slimmed archive to be served from the cache."
+    )
+
+
+def test_slim_zip_include(tmp_path: Path, cache_dir: Path) -> None:
+    dist = tmp_path / "dist.zip"
+    with zipfile.ZipFile(dist, mode="w") as zf:
+        zf.writestr("pypy/", "")
+        zf.writestr("pypy/pypy3.exe", "exe")
+        zf.writestr("pypy/Lib/", "")
+        zf.writestr("pypy/Lib/os.py", "os")
+        zf.writestr("pypy/Lib/tkinter/", "")
+        zf.writestr("pypy/Lib/tkinter/__init__.py", "tk")
+        zf.writestr("pypy/include/", "")
+        zf.writestr("pypy/include/Python.h", "h")
+    file = File(name=dist.name, digest=Digest.hash(dist), type=FileType.Zip)
+
+    slimmed, _ = archive.slim(
+        file, dist, Slim(include=("pypy/*.exe", "pypy/Lib/**"), exclude=("**/tkinter",))
+    )
+    with zipfile.ZipFile(slimmed) as zf:
+        assert ["pypy/", "pypy/pypy3.exe", "pypy/Lib/", "pypy/Lib/os.py"] == zf.namelist()
+        assert b"os" == zf.read("pypy/Lib/os.py")
+
+
+def test_compile_bytecode(tmp_path: Path, cache_dir: Path) -> None:
+    dist = tmp_path / "dist.tar.gz"
+    with tarfile.open(dist, mode="w:gz") as tf:
+        for name, content in (("lib/mod.py", b"x = 42\n"), ("lib/bad.py", b"def (\n")):
+            tar_info = tarfile.TarInfo(name)
+            tar_info.size = len(content)
+            tf.addfile(tar_info, io.BytesIO(content))
+    file = File(name=dist.name, digest=Digest.hash(dist), type=FileType.TarGzip)
+
+    compiled, digest = archive.compile_bytecode(
+        file, dist, Bytecode(optimize=1), python=Path(sys.executable)
+    )
+    assert Digest.hash(compiled) == digest
+    pyc = f"lib/__pycache__/mod.{sys.implementation.cache_tag}.opt-1.pyc"
+    with tarfile.open(compiled) as tf:
+        assert ["lib/mod.py", "lib/bad.py", "lib", "lib/__pycache__", pyc] == tf.getnames()
+        extracted = tf.extractfile(pyc)
+        assert extracted is not None
+        _magic, flags = struct.unpack("<4sI", extracted.read(8))
+        assert 0b01 == flags, "Expected an unchecked hash-based pyc."
+
+    if sys.platform != "win32":
+        relocated_python = tmp_path / "relocated" / "python"
+        relocated_python.parent.mkdir()
+        relocated_python.symlink_to(sys.executable)
+        assert (compiled, digest) == archive.compile_bytecode(
+            file, dist, Bytecode(optimize=1), python=relocated_python
+        ), "Expected the same interpreter at a different path to re-use the compiled archive."
+
+
+def zstd_decompress(data: bytes) -> bytes:
+    if sys.version_info >= (3, 14):
+        from compression import zstd
+
+        return zstd.decompress(data)
+
+    zstandard = pytest.importorskip("zstandard")
+    return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+@pytest.mark.parametrize("level", [pytest.param(3, id="default"), pytest.param(-5, id="fast")])
+@pytest.mark.parametrize("threads", [pytest.param(0, id="single-threaded"), None])
+def test_transcode_to_zstd(
+    tmp_path: Path, cache_dir: Path, threads: int | None, level: int
+) -> None:
+    dist = tmp_path / "dist.tar.gz"
+    file = create_tar_gz(dist, "python/", "python/bin/", "python/bin/python", "python/README")
+    # MyPy does not handle dataclass_transform yet: https://github.com/python/mypy/issues/14293
+    file = dataclasses.replace(file, type=None)  # type: ignore[misc]
+
+    result = archive.transcode_to_zstd(file, dist, Zstd(level=level, threads=threads))
+    assert result is not None
+    transcoded_file, transcoded = result
+    assert "dist.tar.zst" == transcoded_file.name == transcoded.name
+    assert "dist.tar.gz" == transcoded_file.key, "Expected the original name to be retained as key."
+    assert FileType.TarZstd is transcoded_file.type
+    assert Digest.hash(transcoded) == transcoded_file.digest
+    assert gzip.decompress(dist.read_bytes()) == zstd_decompress(transcoded.read_bytes())
+
+
+def test_transcode_to_zstd_not_applicable(tmp_path: Path, cache_dir: Path) -> None:
+    blob = tmp_path / "dist.tar.gz"
+    blob.write_bytes(b"not really a tarball")
+    file = File(name=blob.name, type=FileType.Blob)
+    assert archive.transcode_to_zstd(file, blob, Zstd()) is None
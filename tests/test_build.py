@@ -0,0 +1,193 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from textwrap import dedent
+from typing import Any, Callable, TypeVar
+
+import pytest
+from pytest import MonkeyPatch
+
+from science import hashing
+from science.a_scie import LoadResult
+from science.commands import build
+from science.commands.build import _assemble_scie
+from science.commands.lift import PlatformInfo
+from science.hashing import Digest
+from science.model import Application, Command
+from science.platform import CURRENT_PLATFORM, CURRENT_PLATFORM_SPEC
+from science.scheduler import Scheduler, Task
+
+_T = TypeVar("_T")
+
+pytestmark = pytest.mark.skipif(
+    CURRENT_PLATFORM.is_windows, reason="The stand-in scie-jump is a Python script."
+)
+
+
+def done(func: Callable[[], _T]) -> Task[_T]:
+    scheduler = Scheduler()
+    task = scheduler.add(func.__name__, func)
+    scheduler.run()
+    return task
+
+
+def create_native_jump(path: Path, log: Path) -> LoadResult:
+    # N.B.: This stands in for `scie-jump -sj <jump> <lift manifest>`, appending the payload and the
+    # lift manifest to the jump and logging each assembly.
+    path.write_text(
+        dedent(
+            f"""\
+            #!{sys.executable}
+            import json
+            import sys
+            from pathlib import Path
+
+            _, _, jump, lift_manifest = sys.argv
+            lift_manifest = Path(lift_manifest)
+            data = json.loads(lift_manifest.read_text())
+            name = data["scie"]["lift"]["name"]
+            with open(name, "wb") as scie:
+                scie.write(Path(jump).read_bytes())
+                for file in data["scie"]["lift"]["files"]:
+                    scie.write((lift_manifest.parent / file["name"]).read_bytes())
+                scie.write(lift_manifest.read_bytes())
+            with open({str(log)!r}, "a") as log:
+                print(name, file=log)
+            """
+        )
+    )
+    path.chmod(0o755)
+    return LoadResult(path=path, digest=Digest.hash(path), binary_name="scie-jump")
+
+
+class ScieCache:
+    def __init__(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        self.chroot = tmp_path / "chroot"
+        self.chroot.mkdir()
+        self.payload = self.chroot / "app.txt"
+        self.payload.write_text("Ford")
+        self.lift_manifest = self.chroot / "lift.json"
+        self.lift_manifest.write_text(
+            json.dumps(
+                {
+                    "scie": {
+                        "lift": {
+                            "name": "app",
+                            "files": [{"name": "app.txt"}],
+                            "boot": {"commands": {"": {"exe": "/bin/cat", "args": ["{app.txt}"]}}},
+                        }
+                    }
+                }
+            )
+        )
+        self.dest_dir = tmp_path / "dist"
+        self.dest_dir.mkdir()
+
+        self.assembly_log = tmp_path / "assemblies.log"
+        self.native_jump = create_native_jump(tmp_path / "native-jump", log=self.assembly_log)
+
+        jump = tmp_path / "jump"
+        jump.write_bytes(b"jump")
+        self.jump = LoadResult(path=jump, digest=Digest.hash(jump), binary_name="scie-jump")
+
+        self.hashes = 0
+        hash_path = hashing.hash_path
+
+        def counting_hash_path(*args: Any, **kwargs: Any) -> hashing.Digests:
+            self.hashes += 1
+            return hash_path(*args, **kwargs)
+
+        monkeypatch.setattr(build, "hash_path", counting_hash_path)
+
+    @property
+    def assemblies(self) -> int:
+        if not self.assembly_log.exists():
+            return 0
+        return len(self.assembly_log.read_text().splitlines())
+
+    def assemble(self, project: str = "project") -> Path:
+        def export() -> Path:
+            return self.lift_manifest
+
+        def native_jump() -> LoadResult:
+            return self.native_jump
+
+        def jump() -> LoadResult:
+            return self.jump
+
+        assembled_scie = _assemble_scie(
+            Application(name="app", commands=(Command(exe="/bin/cat"),)),
+            self.dest_dir,
+            CURRENT_PLATFORM_SPEC,
+            PlatformInfo(use_suffix=False),
+            ["sha256"],
+            project=project,
+            export_task=done(export),
+            native_jump_task=done(native_jump),
+            jump_task=done(jump),
+        )
+        assert {"sha256": Digest.hash(assembled_scie.scie).fingerprint} == (
+            assembled_scie.checksums
+        )
+        return assembled_scie.scie
+
+
+@pytest.fixture
+def scie_cache(tmp_path: Path, monkeypatch: MonkeyPatch, cache_dir: Path) -> ScieCache:
+    return ScieCache(tmp_path, monkeypatch)
+
+
+def cached_scies(cache_dir: Path) -> list[Path]:
+    return [path for path in (cache_dir / "artifacts" / "2").iterdir() if path.is_dir()]
+
+
+def test_scie_cache_hit(scie_cache: ScieCache, cache_dir: Path) -> None:
+    scie = scie_cache.assemble()
+    assert 1 == scie_cache.assemblies
+    assert 1 == scie_cache.hashes
+    contents = scie.read_bytes()
+    assert contents.startswith(b"jumpFord")
+
+    scie.unlink()
+    assert scie == scie_cache.assemble()
+    assert 1 == scie_cache.assemblies, "Expected the cached scie to be used."
+    assert 1 == scie_cache.hashes, "Expected the cached scie checksums to be used."
+    assert contents == scie.read_bytes()
+    assert 1 == len(cached_scies(cache_dir))
+
+
+def test_scie_cache_invalidated(scie_cache: ScieCache, cache_dir: Path) -> None:
+    scie = scie_cache.assemble()
+    assert b"Ford" in scie.read_bytes()
+
+    scie_cache.payload.write_text("Arthur")
+    scie = scie_cache.assemble()
+    assert 2 == scie_cache.assemblies, "Expected a payload change to miss the cache."
+    assert 2 == scie_cache.hashes
+    assert b"Arthur" in scie.read_bytes()
+    assert b"Ford" not in scie.read_bytes()
+    assert 1 == len(cached_scies(cache_dir)), "Expected the replaced scie to be evicted."
+
+    scie_cache.payload.write_text("Ford")
+    scie_cache.assemble()
+    assert 3 == scie_cache.assemblies, "Expected the evicted scie to be re-assembled."
+    assert 1 == len(cached_scies(cache_dir))
+
+
+def test_scie_cache_per_project(scie_cache: ScieCache, cache_dir: Path) -> None:
+    scie_cache.assemble(project="one")
+    scie_cache.payload.write_text("Arthur")
+    scie_cache.assemble(project="two")
+    assert 2 == scie_cache.assemblies
+    assert 2 == len(cached_scies(cache_dir)), (
+        "Expected projects building a same-named application not to evict each other's scies."
+    )
+
+    scie_cache.payload.write_text("Ford")
+    scie_cache.assemble(project="one")
+    assert 2 == scie_cache.assemblies, "Expected the scie of project one to still be cached."
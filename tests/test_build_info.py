@@ -0,0 +1,100 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import gc
+import shutil
+import subprocess
+import warnings
+from pathlib import Path
+from textwrap import dedent
+from typing import Any
+
+import pytest
+
+from science.build_info import BuildInfo
+from science.config import parse_config_str
+from science.hashing import Digest, DigestCache, Provenance
+
+
+def test_gather_memoizes_science_digest(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    science = tmp_path / "science"
+    science.write_bytes(b"science")
+    monkeypatch.setenv("SCIE_ARGV0", str(science))
+    monkeypatch.chdir(tmp_path)
+
+    expected = Digest.hash(science)
+    digest_cache = DigestCache(tmp_path / "digests")
+    build_info = BuildInfo.gather(lift_toml=Provenance("lift.toml"), digest_cache=digest_cache)
+    assert {"size": expected.size, "hash": expected.fingerprint}.items() <= (
+        build_info.to_dict()["binary"].items()
+    )
+
+    def fail_hash(path: Path, algorithm: str = "sha256") -> Digest:
+        raise AssertionError(f"Expected the digest of {path} to be memoized.")
+
+    monkeypatch.setattr(Digest, "hash", fail_hash)
+    build_info = BuildInfo.gather(
+        lift_toml=Provenance("lift.toml"), digest_cache=DigestCache(tmp_path / "digests")
+    )
+    assert expected == build_info.digest
+
+
+@pytest.mark.skipif(not shutil.which("git"), reason="This test requires git.")
+def test_gather_git_state(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("SCIE_ARGV0", raising=False)
+    monkeypatch.chdir(tmp_path)
+
+    assert BuildInfo.gather(lift_toml=Provenance("lift.toml")).git_state is None
+
+    def git(*args: str) -> None:
+        subprocess.run(
+            args=["git", "-c", "user.name=Jane", "-c", "user.email=jane@example.com", *args],
+            check=True,
+        )
+
+    git("init", "-q")
+    (tmp_path / "file").touch()
+    git("add", "file")
+    git("commit", "-q", "-m", "Initial commit.")
+    commit = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], stdout=subprocess.PIPE, text=True, check=True
+    ).stdout.strip()
+
+    build_info = BuildInfo.gather(lift_toml=Provenance("lift.toml"))
+    assert commit == build_info.git_state
+    assert {"git_state": commit}.items() <= build_info.to_dict().items()
+
+
+def test_git_state_only_gathered_for_provenance(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail_popen(*args: Any, **kwargs: Any) -> subprocess.Popen:
+        raise AssertionError("Expected git state to only be gathered for provenance.")
+
+    with monkeypatch.context() as m:
+        m.setattr(subprocess, "Popen", fail_popen)
+        application = parse_config_str(
+            dedent(
+                """\
+                [lift]
+                name = "example"
+
+                [[lift.commands]]
+                exe = "/bin/echo"
+                """
+            )
+        )
+    assert application.build_info is not None
+    assert application.build_info.git_state is None
+
+
+@pytest.mark.skipif(not shutil.which("git"), reason="This test requires git.")
+def test_git_state_reaped(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", ResourceWarning)
+        build_info = BuildInfo.gather(lift_toml=Provenance("lift.toml"))
+        assert build_info.gathered is not None
+        del build_info
+        gc.collect()
+    assert not [warning for warning in caught if issubclass(warning.category, ResourceWarning)]
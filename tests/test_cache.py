@@ -0,0 +1,44 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+from science.cache import Complete, Missing, artifact_cache
+
+
+def test_artifact_delete_waits_for_lock(tmp_path: Path, cache_dir: Path) -> None:
+    cache = artifact_cache()
+    with cache.get_or_create("key", file="artifact") as cache_result:
+        assert isinstance(cache_result, Missing)
+        cache_result.work_path.write_text("Trillian")
+
+    locked = threading.Event()
+    release = threading.Event()
+    copy = tmp_path / "copy"
+
+    def use() -> None:
+        with cache.get_or_create("key", file="artifact", lock=True) as cache_result:
+            assert isinstance(cache_result, Complete)
+            locked.set()
+            release.wait(timeout=10)
+            copy.write_text(cache_result.path.read_text())
+
+    user = threading.Thread(target=use)
+    user.start()
+    assert locked.wait(timeout=10)
+
+    deleter = threading.Thread(target=cache.delete, args=("key", "artifact"))
+    deleter.start()
+    deleter.join(timeout=0.5)
+    assert deleter.is_alive(), "Expected the delete to wait for the entry lock to be released."
+
+    release.set()
+    user.join(timeout=10)
+    deleter.join(timeout=10)
+    assert "Trillian" == copy.read_text()
+    with cache.get_or_create("key", file="artifact") as cache_result:
+        assert isinstance(cache_result, Missing), "Expected the entry to be deleted."
+        cache_result.work_path.write_text("Zaphod")
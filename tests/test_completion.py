@@ -0,0 +1,119 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from textwrap import dedent
+from typing import Any
+
+import click
+import pytest
+from click.shell_completion import ShellComplete
+
+from science import __version__
+from science.cli import completion
+from science.exe import _main
+
+
+@pytest.fixture(scope="module")
+def index(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    index = tmp_path_factory.mktemp("completion") / "completion-index.json"
+    completion.write_index(index)
+    return index
+
+
+def completions(
+    command: click.Command, args: list[str], incomplete: str
+) -> list[tuple[Any, str, str | None]]:
+    return [
+        (item.value, item.type, item.help)
+        for item in ShellComplete(command, {}, "science", "_SCIENCE_COMPLETE").get_completions(
+            args, incomplete
+        )
+    ]
+
+
+@pytest.mark.parametrize(
+    ("args", "incomplete"),
+    [
+        ([], ""),
+        ([], "-"),
+        (["-v"], "--"),
+        (["lift"], ""),
+        (["lift"], "-"),
+        (["lift", "--platform"], ""),
+        (["lift", "--platform"], "linux-"),
+        (["lift", "--file"], ""),
+        (["lift", "export"], ""),
+        (["lift", "build"], "--h"),
+        (["lift", "build", "--hash"], "sha"),
+        (["lift", "build", "--use-platform-suffix"], "--"),
+        (["download", "--libc"], ""),
+        (["download", "provider"], ""),
+        (["download", "provider", "PyPy"], "-"),
+        (["complete", "--shell"], ""),
+        (["doc"], ""),
+    ],
+)
+def test_index_matches_cli(index: Path, args: list[str], incomplete: str) -> None:
+    skeleton = completion.load_index(index)
+    assert skeleton is not None
+    assert completions(_main, args, incomplete) == completions(skeleton, args, incomplete)
+
+
+def test_index_version_mismatch(index: Path, tmp_path: Path) -> None:
+    assert completion.load_index(tmp_path / "does-not-exist.json") is None
+
+    data = json.loads(index.read_text())
+    assert __version__ == data["version"]
+    data["version"] = "0.0.0"
+    stale_index = tmp_path / "completion-index.json"
+    stale_index.write_text(json.dumps(data))
+    assert completion.load_index(stale_index) is None
+
+
+def test_complete_from_index(index: Path) -> None:
+    result = subprocess.run(
+        args=[
+            sys.executable,
+            "-c",
+            dedent(
+                f"""\
+                import sys
+                from pathlib import Path
+
+                from science.cli import completion
+
+                assert 0 == completion.complete("science", index=Path({str(index)!r}))
+                assert not [
+                    module
+                    for module in (
+                        "httpx",
+                        "psutil",
+                        "science.cli.lift",
+                        "science.commands.lift",
+                        "science.model",
+                        "science.platform",
+                        "science.providers",
+                    )
+                    if module in sys.modules
+                ]
+                """
+            ),
+        ],
+        env={
+            **os.environ,
+            "_SCIENCE_COMPLETE": "bash_complete",
+            "COMP_WORDS": "science lift build --hash sha",
+            "COMP_CWORD": "4",
+        },
+        stdout=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    assert "plain,sha256" in result.stdout.splitlines()
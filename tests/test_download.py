@@ -17,7 +17,7 @@ from pytest import MonkeyPatch
 
 from science.hashing import Digest
 from science.platform import CURRENT_PLATFORM_SPEC, Platform
-from science.providers import PyPy
+from science.providers.pypy import PyPy
 
 
 @pytest.fixture(autouse=True)
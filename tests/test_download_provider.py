@@ -0,0 +1,249 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+from packaging.version import Version
+from pytest import MonkeyPatch
+
+from science import providers
+from science.commands import download
+from science.commands.download import download_provider_distribution
+from science.fetcher import FetchResult
+from science.hashing import Digest, Fingerprint
+from science.model import FileType, Url
+from science.platform import LibC, Platform, PlatformSpec
+from science.providers import pypy, python_build_standalone
+
+LINUX = PlatformSpec(Platform.Linux_x86_64, LibC.GLIBC)
+WINDOWS_AARCH64 = PlatformSpec(Platform.Windows_aarch64)
+WINDOWS_X86_64 = PlatformSpec(Platform.Windows_x86_64)
+
+
+@pytest.fixture
+def upstream(tmp_path: Path) -> Url:
+    upstream_dir = tmp_path / "upstream"
+    upstream_dir.mkdir()
+    base_url = Url(upstream_dir.as_uri())
+
+    assets = []
+    for arch, extension in ("linux64", "tar.bz2"), ("win64", "zip"), ("macos_arm64", "tar.bz2"):
+        name = f"pypy3.10-v7.3.17-{arch}.{extension}"
+        asset = upstream_dir / name
+        asset.write_bytes(f"PyPy for {arch}".encode())
+        assets.append(
+            pypy.FingerprintedAsset(
+                url=Url(f"{base_url}/{name}", base=base_url),
+                name=name,
+                extension=extension,
+                version=Version("3.10"),
+                release="v7.3.17",
+                arch=arch,
+                fingerprint=Digest.hash(asset).fingerprint,
+                file_type=FileType.for_extension(extension),
+            )
+        )
+    pypy.Distributions(
+        base_url=base_url, version=Version("3.10"), release="v7.3.17", assets=tuple(assets)
+    ).serialize(upstream_dir)
+    return base_url
+
+
+def download_pypy(
+    upstream: Url,
+    dest_dir: Path,
+    *platform_specs: PlatformSpec,
+    incremental: bool = True,
+    jobs: int | None = None,
+) -> None:
+    provider_info = providers.get_provider("PyPy")
+    assert provider_info is not None
+    download_provider_distribution(
+        provider_info=provider_info,
+        platform_specs=platform_specs,
+        explicit_platforms=True,
+        dest_dir=dest_dir,
+        jobs=jobs,
+        incremental=incremental,
+        version=["3.10"],
+        release=["v7.3.17"],
+        base_url=[upstream],
+    )
+
+
+def record_fetches(monkeypatch: MonkeyPatch) -> list[Url]:
+    fetches = list[Url]()
+    fetch_and_verify = download.fetch_and_verify
+
+    def recording_fetch_and_verify(url: Url, **kwargs: Any) -> FetchResult:
+        fetches.append(url)
+        return fetch_and_verify(url, **kwargs)
+
+    monkeypatch.setattr(download, "fetch_and_verify", recording_fetch_and_verify)
+    return fetches
+
+
+def manifest_assets(manifest: Path) -> list[str]:
+    return [asset["name"] for asset in json.loads(manifest.read_text())["assets"]]
+
+
+def test_download_parallel_deduplicated(
+    tmp_path: Path, cache_dir: Path, upstream: Url, monkeypatch: MonkeyPatch
+) -> None:
+    fetches = record_fetches(monkeypatch)
+
+    # N.B.: Each download waits for the other; so this only completes if they run in parallel.
+    barrier = threading.Barrier(2, timeout=10)
+    download_artifact = download._download_artifact
+
+    def parallel_download_artifact(artifact: Any) -> Any:
+        barrier.wait()
+        return download_artifact(artifact)
+
+    monkeypatch.setattr(download, "_download_artifact", parallel_download_artifact)
+
+    progress_totals = list[int]()
+    tqdm = download.tqdm
+
+    def recording_tqdm(**kwargs: Any) -> Any:
+        progress_totals.append(kwargs["total"])
+        return tqdm(**kwargs)
+
+    monkeypatch.setattr(download, "tqdm", recording_tqdm)
+
+    dest_dir = tmp_path / "mirror"
+    download_pypy(upstream, dest_dir, LINUX, WINDOWS_AARCH64, WINDOWS_X86_64, jobs=2)
+    assert sorted(
+        [f"{upstream}/pypy3.10-v7.3.17-linux64.tar.bz2", f"{upstream}/pypy3.10-v7.3.17-win64.zip"]
+    ) == sorted(fetches), "Expected the win64 distribution shared by Windows to be fetched once."
+    assert [2] == progress_totals
+    assert sorted(
+        [
+            "distributions-3.10-v7.3.17.json",
+            "pypy3.10-v7.3.17-linux64.tar.bz2",
+            "pypy3.10-v7.3.17-linux64.tar.bz2.sha256",
+            "pypy3.10-v7.3.17-win64.zip",
+            "pypy3.10-v7.3.17-win64.zip.sha256",
+        ]
+    ) == sorted(os.listdir(dest_dir / "providers" / "PyPy"))
+
+
+def test_incremental_skips_mirrored(
+    tmp_path: Path, cache_dir: Path, upstream: Url, monkeypatch: MonkeyPatch
+) -> None:
+    dest_dir = tmp_path / "mirror"
+    download_pypy(upstream, dest_dir, LINUX, WINDOWS_X86_64)
+
+    mirror_dir = dest_dir / "providers" / "PyPy"
+    linux_dist = mirror_dir / "pypy3.10-v7.3.17-linux64.tar.bz2"
+    windows_dist = mirror_dir / "pypy3.10-v7.3.17-win64.zip"
+    assert b"PyPy for linux64" == linux_dist.read_bytes()
+    assert b"PyPy for win64" == windows_dist.read_bytes()
+
+    fetches = record_fetches(monkeypatch)
+    download_pypy(upstream, dest_dir, LINUX, WINDOWS_X86_64)
+    assert [] == fetches
+
+    linux_sidecar = linux_dist.with_name(f"{linux_dist.name}.sha256")
+    linux_sidecar.write_text(f"{'0' * 64}  {linux_dist.name}")
+    download_pypy(upstream, dest_dir, LINUX, WINDOWS_X86_64)
+    assert [f"{upstream}/{linux_dist.name}"] == fetches
+    assert linux_sidecar.read_text().startswith(f"{Digest.hash(linux_dist).fingerprint} ")
+
+    fetches.clear()
+    download_pypy(upstream, dest_dir, LINUX, WINDOWS_X86_64, incremental=False)
+    assert sorted([f"{upstream}/{linux_dist.name}", f"{upstream}/{windows_dist.name}"]) == sorted(
+        fetches
+    )
+
+
+def test_incremental_merges_manifest(tmp_path: Path, cache_dir: Path, upstream: Url) -> None:
+    dest_dir = tmp_path / "mirror"
+    manifest = dest_dir / "providers" / "PyPy" / "distributions-3.10-v7.3.17.json"
+
+    download_pypy(upstream, dest_dir, WINDOWS_X86_64)
+    assert ["pypy3.10-v7.3.17-win64.zip"] == manifest_assets(manifest)
+
+    download_pypy(upstream, dest_dir, LINUX)
+    assert [
+        "pypy3.10-v7.3.17-win64.zip",
+        "pypy3.10-v7.3.17-linux64.tar.bz2",
+    ] == manifest_assets(manifest), "Expected new assets to be added after existing assets."
+
+    download_pypy(upstream, dest_dir, WINDOWS_X86_64)
+    assert [
+        "pypy3.10-v7.3.17-win64.zip",
+        "pypy3.10-v7.3.17-linux64.tar.bz2",
+    ] == manifest_assets(manifest)
+
+    download_pypy(upstream, dest_dir, WINDOWS_X86_64, incremental=False)
+    assert manifest_assets(upstream_manifest := tmp_path / "upstream" / manifest.name) == (
+        manifest_assets(manifest)
+    ), f"Expected a non-incremental download to mirror {upstream_manifest} as-is."
+
+
+def pbs_distributions(release: str, *target_triples: str) -> python_build_standalone.Distributions:
+    base_url = Url("https://github.com/astral-sh/python-build-standalone/releases")
+    return python_build_standalone.Distributions(
+        base_url=base_url,
+        release=release,
+        latest=True,
+        version=Version("3.13"),
+        flavor="install_only",
+        assets=tuple(
+            python_build_standalone.FingerprintedAsset(
+                url=Url(
+                    f"{base_url}/download/{release}/cpython-3.13-{target_triple}.tar.gz",
+                    base=base_url,
+                ),
+                name=f"cpython-3.13-{target_triple}.tar.gz",
+                digest=Digest(
+                    size=42,
+                    fingerprint=Fingerprint(hashlib.sha256(target_triple.encode()).hexdigest()),
+                ),
+                version=Version("3.13"),
+                target_triple=target_triple,
+                file_type=FileType.TarGzip,
+            )
+            for target_triple in target_triples
+        ),
+    )
+
+
+def test_pbs_incremental_latest_manifest(tmp_path: Path) -> None:
+    def serialize(distributions: python_build_standalone.Distributions) -> None:
+        distributions.serialize(
+            tmp_path, urls=frozenset(asset.url for asset in distributions.assets)
+        )
+
+    manifest = tmp_path / "latest" / "download" / "distributions-3.13-install_only.json"
+
+    serialize(pbs_distributions("20250101", "x86_64-unknown-linux-gnu"))
+    serialize(pbs_distributions("20250101", "aarch64-apple-darwin"))
+    assert "20250101" == json.loads(manifest.read_text())["release"]
+    assert [
+        "cpython-3.13-x86_64-unknown-linux-gnu.tar.gz",
+        "cpython-3.13-aarch64-apple-darwin.tar.gz",
+    ] == manifest_assets(manifest)
+
+    serialize(pbs_distributions("20250202", "aarch64-apple-darwin"))
+    assert "20250202" == json.loads(manifest.read_text())["release"]
+    assert ["cpython-3.13-aarch64-apple-darwin.tar.gz"] == manifest_assets(manifest), (
+        "Expected the assets of the prior latest release to be dropped."
+    )
+
+
+def test_pbs_manifest_order(tmp_path: Path) -> None:
+    target_triples = ("x86_64-unknown-linux-gnu", "aarch64-apple-darwin", "aarch64-pc-windows-msvc")
+    pbs_distributions("20250101", *target_triples).serialize(tmp_path)
+    assert [
+        f"cpython-3.13-{target_triple}.tar.gz" for target_triple in target_triples
+    ] == manifest_assets(tmp_path / "latest" / "download" / "distributions-3.13-install_only.json")
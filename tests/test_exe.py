@@ -27,8 +27,8 @@ from testing import issue
 from science import __version__
 from science.config import parse_config_file
 from science.os import IS_WINDOWS
-from science.platform import CURRENT_PLATFORM, CURRENT_PLATFORM_SPEC, Platform
-from science.providers import PyPy
+from science.platform import CURRENT_PLATFORM, CURRENT_PLATFORM_SPEC, Platform, PlatformSpec
+from science.providers.pypy import PyPy
 
 
 @pytest.fixture(scope="module")
@@ -913,3 +913,191 @@ def test_pbs_provider_pre_releases(tmp_path: Path, science_exe: Path) -> None:
         "3.15.0a1"
         == subprocess.run(args=[scie], stdout=subprocess.PIPE, text=True, check=True).stdout.strip()
     )
+
+
+def test_incremental_export(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    lift_toml = project / "lift.toml"
+    lift_toml.write_text(
+        dedent(
+            """\
+            [lift]
+            name = "app"
+            platforms = ["linux-x86_64", "macos-aarch64"]
+
+            [[lift.files]]
+            name = "app.sh"
+
+            [[lift.commands]]
+            exe = "{app.sh}"
+            """
+        )
+    )
+    app = project / "app.sh"
+    app.write_text("echo app")
+
+    def export() -> tuple[list[str], str]:
+        result = subprocess.run(
+            args=[
+                sys.executable,
+                "-m",
+                "science",
+                "-v",
+                "--cache-dir",
+                str(tmp_path / "cache"),
+                "lift",
+                "export",
+                "--dest-dir",
+                "out",
+            ],
+            cwd=project,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True,
+        )
+        return sorted(result.stdout.splitlines()), result.stderr
+
+    expected_outputs = [
+        os.path.join("out", "linux-x86_64", "lift.json"),
+        os.path.join("out", "macos-aarch64", "lift.json"),
+    ]
+    outputs, stderr = export()
+    assert expected_outputs == outputs
+    assert "Re-using" not in stderr
+
+    outputs, stderr = export()
+    assert expected_outputs == outputs
+    assert "Re-using the up-to-date export in out." in stderr
+
+    app.write_text("echo changed app")
+    outputs, stderr = export()
+    assert expected_outputs == outputs
+    assert "Re-using" not in stderr
+
+    (project / expected_outputs[0]).write_text("{}")
+    outputs, stderr = export()
+    assert "Re-using" not in stderr
+    assert "{}" != (project / expected_outputs[0]).read_text()
+
+
+def test_build_cached(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "lift.toml").write_text(
+        dedent(
+            f"""\
+            [lift]
+            name = "app"
+            platforms = ["{CURRENT_PLATFORM_SPEC.value}"]
+
+            [[lift.files]]
+            name = "app.txt"
+
+            [[lift.commands]]
+            exe = "{{app.txt}}"
+            """
+        )
+    )
+    (project / "app.txt").write_text("Marvin")
+
+    def build() -> str:
+        return subprocess.run(
+            args=[
+                sys.executable,
+                "-m",
+                "science",
+                "-v",
+                "--cache-dir",
+                str(tmp_path / "cache"),
+                "lift",
+                "build",
+                "--dest-dir",
+                "dist",
+                "--hash",
+                "sha256",
+            ],
+            cwd=project,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True,
+        ).stderr
+
+    scie = project / "dist" / CURRENT_PLATFORM.binary_name("app")
+    checksum = scie.with_name(f"{scie.name}.sha256")
+
+    cached_message = f"Using the cached scie assembled for {CURRENT_PLATFORM_SPEC}."
+    assert cached_message not in build()
+    contents = scie.read_bytes()
+    assert f"{hashlib.sha256(contents).hexdigest()} *{scie.name}" == checksum.read_text()
+
+    scie.unlink()
+    checksum.unlink()
+    assert cached_message in build(), "Expected the second build to be served from the cache."
+    assert contents == scie.read_bytes()
+    assert f"{hashlib.sha256(contents).hexdigest()} *{scie.name}" == checksum.read_text()
+
+
+@pytest.mark.skipif(IS_WINDOWS, reason="The test scie runs `/bin/cat`.")
+def test_build_parallel_platforms(tmp_path: Path) -> None:
+    foreign_platform = next(plat for plat in Platform if plat is not CURRENT_PLATFORM)
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "lift.toml").write_text(
+        dedent(
+            f"""\
+            [lift]
+            name = "app"
+            platforms = ["{CURRENT_PLATFORM_SPEC.value}", "{foreign_platform.value}"]
+
+            [[lift.files]]
+            name = "app.txt"
+
+            [[lift.commands]]
+            exe = "/bin/cat"
+            args = ["{{app.txt}}"]
+            """
+        )
+    )
+    (project / "app.txt").write_text("Slartibartfast")
+
+    subprocess.run(
+        args=[
+            sys.executable,
+            "-m",
+            "science",
+            "--cache-dir",
+            str(tmp_path / "cache"),
+            "lift",
+            "--jobs",
+            "2",
+            "build",
+            "--dest-dir",
+            "dist",
+            "--use-platform-suffix",
+            "--hash",
+            "sha256",
+        ],
+        cwd=project,
+        check=True,
+    )
+
+    scies = [
+        project / "dist" / platform_spec.qualified_binary_name("app")
+        for platform_spec in (CURRENT_PLATFORM_SPEC, PlatformSpec(foreign_platform))
+    ]
+    for scie in scies:
+        checksum = scie.with_name(f"{scie.name}.sha256")
+        assert f"{hashlib.sha256(scie.read_bytes()).hexdigest()} *{scie.name}" == (
+            checksum.read_text()
+        )
+    assert scies[0].read_bytes() != scies[1].read_bytes(), (
+        "Expected each platform's scie to be assembled with its own scie-jump."
+    )
+    assert (
+        "Slartibartfast"
+        == subprocess.run(
+            args=[scies[0]], stdout=subprocess.PIPE, text=True, check=True
+        ).stdout.strip()
+    )
@@ -10,8 +10,11 @@ from pytest import MonkeyPatch
 from pytest_httpx import HTTPXMock
 from testing import issue
 
-from science.fetcher import fetch_json, fetch_text
+from science import fetcher
+from science.fetcher import fetch_and_verify, fetch_json, fetch_text
+from science.hashing import Digest
 from science.model import Url
+from science.parallel import Executor
 
 
 @issue(71, ignore=True)
@@ -91,3 +94,32 @@ def test_bearer_auth(_, monkeypatch: MonkeyPatch, httpx_mock: HTTPXMock, cache_d
         expected_authorization_header_value="Bearer Zaphod",
         SCIENCE_AUTH_API_GITHUB_COM_BEARER="Zaphod",
     )
+
+
+def test_fetch_and_verify_memoized(
+    tmp_path: Path, monkeypatch: MonkeyPatch, cache_dir: Path
+) -> None:
+    blob = tmp_path / "blob"
+    blob.write_bytes(b"42")
+    digest = Digest.hash(blob)
+    url = Url(blob.as_uri())
+
+    fetches = list[Url]()
+    original_fetch_and_verify = fetcher._fetch_and_verify
+
+    def recording_fetch_and_verify(url: Url, **kwargs) -> fetcher.FetchResult:
+        fetches.append(url)
+        return original_fetch_and_verify(url, **kwargs)
+
+    monkeypatch.setattr(fetcher, "_fetch_and_verify", recording_fetch_and_verify)
+
+    with Executor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: fetch_and_verify(url, fingerprint=digest), range(8)))
+    assert [url] == fetches
+    assert {results[0]} == set(results)
+    assert digest == results[0].digest
+
+    # N.B.: A memoized result whose cache entry was removed is re-fetched.
+    shutil.rmtree(cache_dir)
+    assert results[0] == fetch_and_verify(url, fingerprint=digest)
+    assert [url, url] == fetches
@@ -0,0 +1,75 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from pytest import MonkeyPatch
+
+from science import fs
+
+
+@pytest.fixture
+def src(tmp_path: Path) -> Path:
+    src = tmp_path / "src" / "file"
+    src.parent.mkdir()
+    src.write_text("Slartibartfast")
+    return src
+
+
+def assert_linked_or_copied(src: Path, dst: Path) -> None:
+    assert "Slartibartfast" == dst.read_text()
+    assert [dst.name] == os.listdir(dst.parent), "Expected no work files to be left behind."
+
+
+def test_link_or_copy_reflink(src: Path, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    def reflink(src: Path, dst: Path) -> bool:
+        shutil.copy(src, dst)
+        return True
+
+    def link(*_args, **_kwargs) -> None:
+        pytest.fail("Expected a reflink to be used.")
+
+    monkeypatch.setattr(fs, "_reflink", reflink)
+    monkeypatch.setattr(os, "link", link)
+
+    dst = tmp_path / "dst" / "file"
+    fs.link_or_copy(src, dst)
+    assert_linked_or_copied(src, dst)
+    assert not os.path.samefile(src, dst)
+
+
+def test_link_or_copy_hardlink(src: Path, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(fs, "_reflink", lambda src, dst: False)
+
+    dst = tmp_path / "dst" / "file"
+    fs.link_or_copy(src, dst)
+    assert_linked_or_copied(src, dst)
+    assert os.path.samefile(src, dst)
+
+
+def test_link_or_copy_copy(src: Path, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    def link(*_args, **_kwargs) -> None:
+        raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+
+    monkeypatch.setattr(fs, "_reflink", lambda src, dst: False)
+    monkeypatch.setattr(os, "link", link)
+
+    dst = tmp_path / "dst" / "file"
+    fs.link_or_copy(src, dst)
+    assert_linked_or_copied(src, dst)
+    assert not os.path.samefile(src, dst)
+
+
+def test_link_or_copy_replaces(src: Path, tmp_path: Path) -> None:
+    dst = tmp_path / "dst" / "file"
+    dst.parent.mkdir()
+    dst.write_text("Zaphod")
+
+    fs.link_or_copy(src, dst)
+    assert_linked_or_copied(src, dst)
@@ -0,0 +1,153 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import hashlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+from textwrap import dedent
+
+import pytest
+
+from science import hashing
+from science.errors import InputError
+from science.hashing import Digest, DigestCache, ExpectedDigest, Fingerprint, hash_path
+from science.platform import CURRENT_PLATFORM
+
+
+def test_digest_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    file = tmp_path / "file"
+    file.write_bytes(b"contents")
+    expected = Digest.hash(file)
+
+    hashed = list[Path]()
+    original_hash = Digest.hash
+
+    def recording_hash(path: Path, algorithm: str = "sha256") -> Digest:
+        hashed.append(path)
+        return original_hash(path, algorithm=algorithm)
+
+    monkeypatch.setattr(Digest, "hash", recording_hash)
+
+    base_dir = tmp_path / "digests"
+    digest_cache = DigestCache(base_dir)
+    assert expected == digest_cache.digest(file)
+    assert expected == digest_cache.digest(tmp_path / "." / "file")
+    assert [file] == hashed
+
+    assert expected == DigestCache(base_dir).digest(file), (
+        "Expected the digest to be persisted across digest cache instances."
+    )
+    assert [file] == hashed
+
+    file.write_bytes(b"changed!")
+    stat = file.stat()
+    os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert Digest.hash(file) == digest_cache.digest(file)
+    assert [file, file, file] == hashed
+    assert 1 == len(list(base_dir.iterdir())), (
+        "Expected the persisted digest of a changed file to be replaced."
+    )
+    assert Digest.hash(file) == DigestCache(base_dir).digest(file)
+    assert [file, file, file, file] == hashed
+
+
+def test_check_path_digest_cache(tmp_path: Path) -> None:
+    file = tmp_path / "file"
+    file.write_bytes(b"contents")
+    digest = Digest.hash(file)
+    digest_cache = DigestCache(tmp_path / "digests")
+
+    ExpectedDigest(fingerprint=digest.fingerprint, size=digest.size).check_path(
+        file, digest_cache=digest_cache
+    )
+    with pytest.raises(InputError, match=r"unexpected contents"):
+        ExpectedDigest(fingerprint=Fingerprint("bad")).check_path(file, digest_cache=digest_cache)
+
+
+@pytest.mark.parametrize("size", [0, 1, 15, 16, 17, 100])
+def test_hash_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, size: int) -> None:
+    monkeypatch.setattr(hashing, "_HASH_CHUNK_SIZE", 16)
+
+    data = os.urandom(size)
+    file = tmp_path / "file"
+    file.write_bytes(data)
+
+    digests = hash_path(file, algorithms=("sha256", "md5", "shake_128", "shake_256"))
+    assert size == digests.size
+    assert {
+        "sha256": Fingerprint(hashlib.sha256(data).hexdigest()),
+        "md5": Fingerprint(hashlib.md5(data).hexdigest()),
+        "shake_128": Fingerprint(hashlib.shake_128(data).hexdigest(16)),
+        "shake_256": Fingerprint(hashlib.shake_256(data).hexdigest(32)),
+    } == digests.fingerprints
+
+    assert Digest(size=size, fingerprint=digests.fingerprints["sha256"]) == Digest.hash(file)
+
+
+@pytest.mark.skipif(CURRENT_PLATFORM.is_windows, reason="The resource module is Unix only.")
+def test_hash_bounded_memory(tmp_path: Path) -> None:
+    chunk = os.urandom(1024 * 1024)
+    expected = hashlib.sha256()
+
+    def peak_rss_growth(size: int) -> int:
+        file = tmp_path / f"file-{size}"
+        with file.open("wb") as fp:
+            for _ in range(size // len(chunk)):
+                fp.write(chunk)
+
+        # N.B.: We measure the peak RSS of a fresh process since, unlike tracemalloc, it accounts
+        # for all memory use; including the pages of any memory mapped file.
+        result = subprocess.run(
+            args=[
+                sys.executable,
+                "-c",
+                dedent(
+                    """\
+                    import resource
+                    import sys
+                    from pathlib import Path
+
+                    from science.hashing import Digest
+
+
+                    def peak_rss():
+                        # N.B.: The peak RSS is reported in KiB on Linux but in bytes on macOS.
+                        scale = 1 if sys.platform == "darwin" else 1024
+                        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+                    path = Path(sys.argv[1])
+                    baseline = peak_rss()
+                    digest = Digest.hash(path)
+                    with path.open("rb") as fp:
+                        assert digest == Digest.hasher(fp).drain()
+                    print(digest.size, digest.fingerprint, peak_rss() - baseline)
+                    """
+                ),
+                str(file),
+            ],
+            stdout=subprocess.PIPE,
+            text=True,
+            check=True,
+        )
+        hashed_size, fingerprint, growth = result.stdout.split()
+        assert size == int(hashed_size)
+        assert expected.hexdigest() == fingerprint
+        return int(growth)
+
+    for _ in range(8):
+        expected.update(chunk)
+    small_growth = peak_rss_growth(8 * len(chunk))
+    for _ in range(120):
+        expected.update(chunk)
+    large_growth = peak_rss_growth(128 * len(chunk))
+
+    assert large_growth < 4 * hashing._HASH_CHUNK_SIZE
+    assert large_growth < small_growth + 2 * hashing._HASH_CHUNK_SIZE, (
+        f"Expected flat peak RSS regardless of file size but hashing 8 MiB grew it by "
+        f"{small_growth} bytes and hashing 128 MiB grew it by {large_growth} bytes."
+    )
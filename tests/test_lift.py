@@ -0,0 +1,137 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from pathlib import Path
+from textwrap import dedent
+from typing import Iterable, Mapping
+
+import pytest
+from packaging.version import Version
+
+from science.commands.lift import ExportFingerprint, LiftConfig, export_manifest
+from science.config import parse_config_file, parse_config_str
+from science.hashing import Digest, Fingerprint
+from science.model import Distribution, FileType, Url
+from science.platform import PlatformSpec
+from science.providers import pypy
+
+
+def test_export_directory(tmp_path: Path, cache_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    site = tmp_path / "site"
+    (site / "sub").mkdir(parents=True)
+    (site / "index.html").write_text("<html></html>")
+    (site / "sub" / "page.html").write_text("<html></html>")
+
+    application = parse_config_str(
+        dedent(
+            """\
+            [lift]
+            name = "docs"
+            platforms = ["linux-x86_64"]
+
+            [[lift.files]]
+            name = "site"
+
+            [[lift.commands]]
+            exe = "/bin/ls"
+            args = ["{site}"]
+            """
+        )
+    )
+    ((_, lift_manifest),) = export_manifest(LiftConfig(), application, tmp_path / "dest")
+
+    # N.B.: The scie-jump zips directories itself; so it must be handed a local directory to zip.
+    chroot_site = lift_manifest.parent / "site"
+    assert chroot_site.is_dir()
+    assert not chroot_site.is_symlink()
+    assert {
+        "index.html": site / "index.html",
+        "sub": site / "sub",
+    } == {entry.name: entry.readlink() for entry in chroot_site.iterdir()}
+    assert [{"name": "site"}] == json.loads(lift_manifest.read_text())["scie"]["lift"]["files"]
+
+
+def test_export_fingerprint_resolved(
+    tmp_path: Path, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    mirror = tmp_path / "mirror"
+    mirror.mkdir()
+    base_url = Url(mirror.as_uri())
+    name = "pypy3.10-v7.3.17-linux64.tar.bz2"
+    (mirror / name).write_bytes(b"PyPy")
+    pypy.Distributions(
+        base_url=base_url,
+        version=Version("3.10"),
+        release="v7.3.17",
+        assets=(
+            pypy.FingerprintedAsset(
+                url=Url(f"{base_url}/{name}", base=base_url),
+                name=name,
+                extension="tar.bz2",
+                version=Version("3.10"),
+                release="v7.3.17",
+                arch="linux64",
+                fingerprint=Digest.hash(mirror / name).fingerprint,
+                file_type=FileType.TarBzip2,
+            ),
+        ),
+    ).serialize(mirror)
+
+    lift_toml = tmp_path / "lift.toml"
+    lift_toml.write_text(
+        dedent(
+            f"""\
+            [lift]
+            name = "pypy"
+            platforms = ["linux-x86_64"]
+
+            [[lift.interpreters]]
+            id = "pypy"
+            provider = "PyPy"
+            version = "3.10"
+            release = "v7.3.17"
+            base_url = "{base_url}"
+
+            [[lift.commands]]
+            exe = "#{{pypy:python}}"
+            """
+        )
+    )
+
+    def calculate() -> ExportFingerprint | None:
+        with lift_toml.open("rb") as config:
+            return ExportFingerprint.calculate(
+                LiftConfig(), config, parse_config_file(lift_toml), tmp_path / "dest", None
+            )
+
+    fingerprint = calculate()
+    assert fingerprint is not None
+    assert fingerprint == calculate()
+
+    distributions_for = pypy.PyPy.distributions_for
+
+    def re_released(
+        self: pypy.PyPy, platform_specs: Iterable[PlatformSpec]
+    ) -> Mapping[PlatformSpec, Distribution | None]:
+        return {
+            platform_spec: dataclasses.replace(
+                distribution,
+                file=dataclasses.replace(
+                    distribution.file, digest=Digest(size=42, fingerprint=Fingerprint("0" * 64))
+                ),
+            )
+            if distribution
+            else None
+            for platform_spec, distribution in distributions_for(self, platform_specs).items()
+        }
+
+    monkeypatch.setattr(pypy.PyPy, "distributions_for", re_released)
+    assert fingerprint != calculate(), (
+        "Expected a change in the resolved distributions to change the fingerprint."
+    )
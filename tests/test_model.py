@@ -1,10 +1,26 @@
 # Copyright 2022 Science project contributors.
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+from __future__ import annotations
 
+from dataclasses import dataclass
+
+import pytest
+
+from science.dataclass import Dataclass
+from science.errors import InputError
 from science.frozendict import FrozenDict
 from science.hashing import Digest, Fingerprint
-from science.model import Distribution, Fetch, File, Identifier, Url
+from science.model import (
+    Distribution,
+    DistributionsManifest,
+    Fetch,
+    File,
+    Identifier,
+    Provider,
+    Url,
+    Zstd,
+)
 from science.platform import Platform, PlatformSpec
 
 
@@ -86,3 +102,50 @@ def test_distribution_windows() -> None:
     assert r"{cpython310}\python\python.exe" == distribution.expand_placeholders(
         windows, "#{cpython:python}"
     )
+
+
+@dataclass(frozen=True)
+class LinuxOnlyProvider(Provider[Dataclass]):
+    @classmethod
+    def config_dataclass(cls) -> type[Dataclass]:
+        raise NotImplementedError()
+
+    @classmethod
+    def create(cls, identifier: Identifier, lazy: bool, config: Dataclass) -> Provider:
+        raise NotImplementedError()
+
+    def distributions(self) -> DistributionsManifest:
+        raise NotImplementedError()
+
+    def distribution(self, platform_spec: PlatformSpec) -> Distribution | None:
+        if platform_spec.platform.is_windows:
+            return None
+        return Distribution(
+            id=Identifier("linux"),
+            file=File(name=f"linux-{platform_spec.value}.tar.gz"),
+            placeholders=FrozenDict(),
+        )
+
+
+def test_distributions_for_default() -> None:
+    linux = PlatformSpec(Platform.Linux_x86_64)
+    windows = PlatformSpec(Platform.Windows_x86_64)
+    linux_arm = PlatformSpec(Platform.Linux_aarch64)
+
+    provider = LinuxOnlyProvider()
+    distributions = provider.distributions_for([linux, windows, linux_arm])
+    assert [linux, windows, linux_arm] == list(distributions)
+    assert provider.distribution(linux) == distributions[linux]
+    assert distributions[windows] is None
+    assert provider.distribution(linux_arm) == distributions[linux_arm]
+
+
+@pytest.mark.parametrize("level", [-131072, -5, 0, 1, 22])
+def test_zstd_level_valid(level: int) -> None:
+    assert level == Zstd(level=level).level
+
+
+@pytest.mark.parametrize("level", [-131073, 23])
+def test_zstd_level_invalid(level: int) -> None:
+    with pytest.raises(InputError, match=r"The zstd compression level must be from -131072 to 22"):
+        Zstd(level=level)
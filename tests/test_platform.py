@@ -0,0 +1,74 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import shutil
+import struct
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from science.platform import CURRENT_PLATFORM, Arch, LibC, Os, _elf_interpreter
+
+
+def create_elf(path: Path, interpreter: bytes | None, is_64bit: bool, byte_order: str) -> Path:
+    header_size, program_header_size = (64, 56) if is_64bit else (52, 32)
+    program_headers = [(1, header_size + 2 * program_header_size, 0)]
+    if interpreter:
+        program_headers.append((3, header_size + 2 * program_header_size, len(interpreter) + 1))
+
+    ident = b"\x7fELF" + bytes([2 if is_64bit else 1, 1 if byte_order == "<" else 2, 1])
+    if is_64bit:
+        header = struct.pack(f"{byte_order}HHIQQQIHHH", 2, 62, 1, 0, header_size, 0, 0, 64, 56, 2)
+        entries = [
+            struct.pack(f"{byte_order}IIQQQQ", type_, 0, offset, 0, 0, size)
+            for type_, offset, size in program_headers
+        ]
+    else:
+        header = struct.pack(f"{byte_order}HHIIIIIHHH", 2, 3, 1, 0, header_size, 0, 0, 52, 32, 2)
+        entries = [
+            struct.pack(f"{byte_order}IIIII", type_, offset, 0, 0, size)
+            for type_, offset, size in program_headers
+        ]
+
+    with path.open("wb") as fp:
+        fp.write(ident.ljust(16, b"\x00"))
+        fp.write(header.ljust(header_size - 16, b"\x00"))
+        for entry in entries:
+            fp.write(entry.ljust(program_header_size, b"\x00"))
+        fp.write(b"\x00" * (2 - len(entries)) * program_header_size)
+        if interpreter:
+            fp.write(interpreter + b"\x00")
+    return path
+
+
+@pytest.mark.parametrize("is_64bit", [True, False])
+@pytest.mark.parametrize("byte_order", ["<", ">"])
+def test_elf_interpreter(tmp_path: Path, is_64bit: bool, byte_order: str) -> None:
+    musl = create_elf(
+        tmp_path / "musl", b"/lib/ld-musl-x86_64.so.1", is_64bit=is_64bit, byte_order=byte_order
+    )
+    assert "/lib/ld-musl-x86_64.so.1" == _elf_interpreter(str(musl))
+
+    static = create_elf(tmp_path / "static", None, is_64bit=is_64bit, byte_order=byte_order)
+    assert _elf_interpreter(str(static)) is None
+
+    script = tmp_path / "script"
+    script.write_text("#!/bin/sh\n")
+    assert _elf_interpreter(str(script)) is None
+
+
+@pytest.mark.skipif(
+    CURRENT_PLATFORM.os is not Os.Linux
+    or CURRENT_PLATFORM.arch is not Arch.X86_64
+    or not shutil.which("ldd"),
+    reason="Libc detection only applies to Linux x86_64 and this test checks it against ldd.",
+)
+def test_libc_current() -> None:
+    ldd = subprocess.run(
+        args=["ldd", sys.executable], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    ).stdout
+    assert (LibC.MUSL if "musl" in ldd else LibC.GLIBC) is LibC.current()
@@ -0,0 +1,185 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+from pathlib import Path
+from textwrap import dedent
+from types import ModuleType
+from typing import Any, Iterator
+
+import pytest
+from packaging.version import Version
+from pytest_httpx import HTTPXMock
+
+from science import providers
+from science.hashing import Fingerprint
+from science.model import FileType, Identifier, Url
+from science.platform import LibC, Platform, PlatformSpec
+from science.providers.pypy import Distributions, FingerprintedAsset, PyPy
+
+
+@pytest.fixture
+def fresh_registry() -> Iterator[None]:
+    providers._registry.cache_clear()
+    try:
+        yield
+    finally:
+        providers._registry.cache_clear()
+
+
+def test_provider_modules_imported_lazily() -> None:
+    subprocess.run(
+        args=[
+            sys.executable,
+            "-c",
+            dedent(
+                """\
+                import sys
+
+                from science import providers
+
+
+                def imported(module):
+                    return module in sys.modules
+
+
+                assert not imported("science.providers.pypy")
+                assert not imported("science.providers.python_build_standalone")
+
+                provider_info = providers.get_provider("PyPy")
+                assert provider_info is not None
+                assert "science.providers.pypy.PyPy" == provider_info.fully_qualified_name
+                assert not imported("science.providers.pypy")
+
+                assert "PyPy" == provider_info.type.__name__
+                assert imported("science.providers.pypy")
+                assert not imported("science.providers.python_build_standalone")
+                """
+            ),
+        ],
+        check=True,
+    )
+
+
+def test_plugin_discovery_cached(
+    cache_dir: Path, monkeypatch: pytest.MonkeyPatch, fresh_registry: None
+) -> None:
+    scans = list[str]()
+
+    class EntryPoints:
+        def select(self, group: str) -> list[EntryPoint]:
+            scans.append(group)
+            return [EntryPoint(name="Plugin", group=group, value="science.providers.pypy:PyPy")]
+
+    def entry_points() -> Any:
+        return EntryPoints()
+
+    monkeypatch.setattr(providers, "entry_points", entry_points)
+
+    def assert_plugin_registered() -> None:
+        provider_info = providers.get_provider("Plugin")
+        assert provider_info is not None
+        assert "unknown plugin" == provider_info.source
+        assert PyPy is provider_info.type
+        assert provider_info in providers.all_providers()
+
+    assert_plugin_registered()
+    assert ["science.providers_by_short_name"] == scans
+
+    providers._registry.cache_clear()
+    assert_plugin_registered()
+    assert ["science.providers_by_short_name"] == scans, (
+        "Expected the plugin entry points to be read from the cache."
+    )
+    assert providers.get_provider("PyPy") is not None
+
+
+class ReExportedPyPy(PyPy):
+    pass
+
+
+def test_plugin_type_name(
+    cache_dir: Path, monkeypatch: pytest.MonkeyPatch, fresh_registry: None
+) -> None:
+    plugin_api = ModuleType("plugin_api")
+    setattr(plugin_api, "PyPyPlugin", ReExportedPyPy)
+    monkeypatch.setitem(sys.modules, "plugin_api", plugin_api)
+
+    class EntryPoints:
+        def select(self, group: str) -> list[EntryPoint]:
+            return [EntryPoint(name="Plugin", group=group, value="plugin_api:PyPyPlugin")]
+
+    monkeypatch.setattr(providers, "entry_points", EntryPoints)
+
+    provider_info = providers.get_provider("plugin_api.PyPyPlugin")
+    assert provider_info is not None
+    assert "plugin_api.PyPyPlugin" == provider_info.fully_qualified_name
+    assert provider_info is providers.get_provider(
+        f"{ReExportedPyPy.__module__}.{ReExportedPyPy.__qualname__}"
+    ), "Expected a provider to still be found by the fully qualified name of its type."
+    assert providers.get_provider("plugin_api.Missing") is None
+
+
+def test_pypy_distributions_for(cache_dir: Path, httpx_mock: HTTPXMock) -> None:
+    base_url = Url("https://downloads.python.org/pypy")
+    sizes = {"linux64": 137, "win64": 42, "macos_arm64": 1729}
+    assets = []
+    for arch, extension in ("linux64", "tar.bz2"), ("win64", "zip"), ("macos_arm64", "tar.bz2"):
+        name = f"pypy3.10-v7.3.17-{arch}.{extension}"
+        url = Url(f"{base_url}/{name}", base=base_url)
+        if "macos_arm64" != arch:
+            httpx_mock.add_response(
+                method="HEAD", url=url, headers={"Content-Length": str(sizes[arch])}
+            )
+        assets.append(
+            FingerprintedAsset(
+                url=url,
+                name=name,
+                extension=extension,
+                version=Version("3.10"),
+                release="v7.3.17",
+                arch=arch,
+                fingerprint=Fingerprint(f"{arch:0>64}"),
+                file_type=FileType.for_extension(extension),
+            )
+        )
+    pypy = PyPy(
+        id=Identifier("pypy"),
+        lazy=False,
+        _distributions=Distributions(
+            base_url=base_url, version=Version("3.10"), release="v7.3.17", assets=tuple(assets)
+        ),
+    )
+
+    linux = PlatformSpec(Platform.Linux_x86_64, LibC.GLIBC)
+    linux_riscv64 = PlatformSpec(Platform.Linux_riscv64, LibC.GLIBC)
+    windows_aarch64 = PlatformSpec(Platform.Windows_aarch64)
+    windows_x86_64 = PlatformSpec(Platform.Windows_x86_64)
+    assert [linux, windows_aarch64, windows_x86_64] == list(
+        PyPy.iter_supported_platforms([linux, linux_riscv64, windows_aarch64, windows_x86_64])
+    )
+    distributions = pypy.distributions_for([linux, linux_riscv64, windows_aarch64, windows_x86_64])
+
+    assert [linux, linux_riscv64, windows_aarch64, windows_x86_64] == list(distributions)
+    assert distributions[linux_riscv64] is None, "Expected PyPy to have no riscv64 distribution."
+
+    def asset_and_size(platform_spec: PlatformSpec) -> tuple[str, int | None]:
+        distribution = distributions[platform_spec]
+        assert distribution is not None
+        assert distribution.file.digest is not None
+        return distribution.file.name, distribution.file.digest.size
+
+    assert ("pypy3.10-v7.3.17-linux64.tar.bz2", 137) == asset_and_size(linux)
+    assert ("pypy3.10-v7.3.17-win64.zip", 42) == asset_and_size(windows_aarch64)
+    assert ("pypy3.10-v7.3.17-win64.zip", 42) == asset_and_size(windows_x86_64)
+
+    assert sorted(
+        [f"{base_url}/pypy3.10-v7.3.17-linux64.tar.bz2", f"{base_url}/pypy3.10-v7.3.17-win64.zip"]
+    ) == sorted(str(request.url) for request in httpx_mock.get_requests(method="HEAD")), (
+        "Expected one HEAD request per selected asset; the macOS asset was not selected and the "
+        "Windows platforms share an asset."
+    )
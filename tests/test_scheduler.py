@@ -0,0 +1,77 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from science.errors import InputError
+from science.scheduler import Scheduler
+
+
+def test_dependencies() -> None:
+    scheduler = Scheduler(jobs=4)
+    events = list[str]()
+    lock = threading.Lock()
+
+    def record(name: str, delay: float = 0.0) -> str:
+        time.sleep(delay)
+        with lock:
+            events.append(name)
+        return name
+
+    fetch = scheduler.add("fetch", lambda: record("fetch", delay=0.1))
+    resolve = scheduler.add("resolve", lambda: record("resolve"))
+    export = scheduler.add(
+        "export", lambda: record(f"export {fetch.result()}"), dependencies=[fetch, resolve]
+    )
+    assemble = scheduler.add("assemble", lambda: record("assemble"), dependencies=[export])
+    scheduler.run()
+
+    assert "assemble" == assemble.result()
+    assert ["resolve", "fetch", "export fetch", "assemble"] == events
+    assert [fetch, export, assemble] == list(scheduler.critical_path())
+    assert scheduler.critical_path_report().startswith("Critical path (")
+
+
+def test_failure() -> None:
+    scheduler = Scheduler(jobs=2)
+
+    def fail() -> None:
+        raise InputError("Download failed.")
+
+    ran = list[str]()
+    fetch = scheduler.add("fetch", fail)
+    other = scheduler.add("other", lambda: ran.append("other"))
+    export = scheduler.add("export", lambda: ran.append("export"), dependencies=[fetch, other])
+    assemble = scheduler.add("assemble", lambda: ran.append("assemble"), dependencies=[export])
+    scheduler.run()
+
+    assert ["other"] == ran
+    for task in fetch, export, assemble:
+        with pytest.raises(InputError, match=r"^Download failed\.$"):
+            task.result()
+
+
+def test_jobs() -> None:
+    scheduler = Scheduler(jobs=2)
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def work() -> None:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    for index in range(8):
+        scheduler.add(f"work {index}", work)
+    scheduler.run()
+    assert 2 == max_running
@@ -0,0 +1,74 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+
+import pytest
+
+from science.cli import LazyGroup
+from science.exe import _main
+
+# These are only needed by the sub-commands that use them.
+HEAVY_MODULES = (
+    "bs4",
+    "httpx",
+    "psutil",
+    "science.commands.build",
+    "science.commands.lift",
+    "science.config",
+    "science.model",
+    "science.providers",
+    "tenacity",
+    "tqdm",
+)
+
+_IMPORT_TIME_RE = re.compile(r"^import time:\s+\d+ \|\s+(?P<cumulative_us>\d+) \|(?P<module>.+)$")
+
+
+def import_times(*args: str) -> dict[str, int]:
+    result = subprocess.run(
+        args=[sys.executable, "-X", "importtime", "-m", "science", *args],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    return {
+        match.group("module").strip(): int(match.group("cumulative_us"))
+        for line in result.stderr.splitlines()
+        if (match := _IMPORT_TIME_RE.match(line))
+    }
+
+
+@pytest.mark.parametrize("args", [["--version"], ["--help"]])
+def test_no_heavy_imports(args: list[str]) -> None:
+    imported = import_times(*args)
+    assert not [module for module in HEAVY_MODULES if module in imported]
+
+
+def test_only_used_sub_command_imported() -> None:
+    imported = import_times("doc", "--help")
+    assert "science.commands.doc" in imported
+    assert not [
+        module
+        for module in (
+            "science.commands.complete",
+            "science.commands.download",
+            "science.commands.lift",
+        )
+        if module in imported
+    ]
+
+
+def test_lazy_command_short_help() -> None:
+    assert isinstance(_main, LazyGroup)
+    for name, lazy_command in _main.lazy_commands.items():
+        command = lazy_command.load()
+        assert name == command.name
+        assert command.get_short_help_str(limit=sys.maxsize) == lazy_command.short_help, (
+            f"The declared short help for the lazily loaded {name} command is out of date."
+        )
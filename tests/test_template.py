@@ -0,0 +1,29 @@
+# Copyright 2025 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from science.template import Placeholder, Template
+
+
+def test_parse() -> None:
+    assert Template(tokens=("",)) == Template.parse("")
+    assert Template(tokens=("{scie.lift}",)) == Template.parse("{scie.lift}")
+    assert Template(
+        tokens=(
+            Placeholder(text="#{cpython:python}", id="cpython", name="python"),
+            " -m ",
+            Placeholder(text="#{app}", id="app"),
+            "/main.py",
+        )
+    ) == Template.parse("#{cpython:python} -m #{app}/main.py")
+
+
+def test_render() -> None:
+    def resolve(placeholder: Placeholder) -> str | None:
+        if "cpython" != placeholder.id:
+            return None
+        return f"{{cpython}}/{placeholder.name}" if placeholder.name else "{cpython}"
+
+    template = Template.parse("#{cpython:python} #{cpython} #{other:python} #{cpython:}")
+    assert "{cpython}/python {cpython} #{other:python} #{cpython:}" == template.render(resolve)